@@ -50,6 +50,7 @@ information on how to use it with the `quickstart tutorials`_.
 """
 
 from radarly.api import RadarlyApi
+from radarly.asyncapi import AsyncRadarlyApi
 
 
 __title__ = 'radarly'
@@ -9,6 +9,7 @@ distribution of some metrics.
 """
 
 from .api import RadarlyApi
+from .asyncapi import AsyncRadarlyApi
 from .constants import ANALYTICS_FIELD
 from .utils._internal import CallableDict
 
@@ -73,7 +74,7 @@ class Analytics(dict):
 
     @classmethod
     def fetch(cls, project_id, parameter,
-              focuses=None, api=None):
+              focuses=None, api=None, timestamps=None):
         """Retrieve some insights from the API. It allows you to dive deeper
         into the analysis of your project by retrieving several kind of
         analytics, computed on all or a subset of the publications stored in
@@ -89,6 +90,10 @@ class Analytics(dict):
                 in the field.
             api (RadarlyApi, optional): API to use to made the request. If
                 None, it will use the default API.
+            timestamps (str, optional): ``'epoch'`` to get the dates as
+                numbers of milliseconds since the epoch instead of
+                ``datetime`` objects (see ``RadarlyApi``). If None, the
+                option of the API is used.
         Returns:
             Analytics: object storing data retrieved from the API and which
             can be explored with ``pandas``
@@ -96,20 +101,76 @@ class Analytics(dict):
         api = api or RadarlyApi.get_default_api()
         url = api.router.analytics['global'].format(project_id=project_id)
 
-        is_occupation_asked = ANALYTICS_FIELD.OCCUPATIONS in \
-            parameter.get('fields', [])
-        if is_occupation_asked:
-            parameter['fields'].remove(ANALYTICS_FIELD.OCCUPATIONS)
-        if parameter.get('fields', []) == [] and is_occupation_asked:
+        payload, occupation_payload = _split_occupations(parameter)
+        if payload is None:
             data = dict(dots=[])
         else:
-            data = api.post(url, data=parameter)
-        if is_occupation_asked:
-            _ = parameter.pop('fields')
+            data = api.post(url, data=payload, timestamps=timestamps)
+        if occupation_payload is not None:
             url = api.router.analytics['occupation'].format(
                 project_id=project_id
             )
-            occupations_data = api.post(url, data=parameter)
+            occupations_data = api.post(url, data=occupation_payload,
+                                        timestamps=timestamps)
             data['dots'] += occupations_data['dots']
 
         return cls(data, focuses)
+
+    @classmethod
+    async def afetch(cls, project_id, parameter,
+                     focuses=None, api=None, timestamps=None):
+        """Coroutine version of ``fetch``.
+
+        Args:
+            project_id (int): id of your project where all data are stored
+            parameter (AnalyticsParameter): parameter used to specify
+                which analytics you want to compute.
+            focuses (dict): used to translate headers if *focuses* was asked
+                in the field.
+            api (AsyncRadarlyApi, optional): API to use to made the request.
+                If None, it will use the default asynchronous API.
+            timestamps (str, optional): see ``fetch``.
+        Returns:
+            Analytics:
+        """
+        api = api or AsyncRadarlyApi.get_default_api()
+        url = api.router.analytics['global'].format(project_id=project_id)
+
+        payload, occupation_payload = _split_occupations(parameter)
+        if payload is None:
+            data = dict(dots=[])
+        else:
+            data = await api.post(url, data=payload,
+                                  timestamps=timestamps)
+        if occupation_payload is not None:
+            url = api.router.analytics['occupation'].format(
+                project_id=project_id
+            )
+            occupations_data = await api.post(url, data=occupation_payload,
+                                              timestamps=timestamps)
+            data['dots'] += occupations_data['dots']
+
+        return cls(data, focuses)
+
+
+def _split_occupations(parameter):
+    """Build the payloads of the analytics and of the occupations (which are
+    computed by another road) from the parameter, without modifying it.
+
+    Returns:
+        tuple(dict, dict): payload of the analytics (None if only the
+        occupations are asked) and payload of the occupations (None if they
+        aren't asked).
+    """
+    fields = parameter.get('fields', [])
+    if ANALYTICS_FIELD.OCCUPATIONS not in fields:
+        return parameter, None
+    fields = [
+        field for field in fields if field != ANALYTICS_FIELD.OCCUPATIONS
+    ]
+    occupation_payload = {
+        key: value for key, value in parameter.items() if key != 'fields'
+    }
+    if not fields:
+        return None, occupation_payload
+    return dict(parameter, fields=fields), occupation_payload
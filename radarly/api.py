@@ -11,7 +11,7 @@ To initialize a default API, simply run:
 >>> RadarlyApi.init(client_id=<client_id>, client_secret=<client_secret>)
 """
 
-import json
+import time
 from datetime import datetime
 from os import getenv
 
@@ -20,9 +20,14 @@ import requests
 from .auth import RadarlyAuth
 from .exceptions import (AuthenticationError, NoInitializedApi,
                          RadarlyHTTPError, RateReached)
-from .rate import RateLimit
+from .rate import RateLimit, RateScheduler
+from .retry import TRANSIENT_ERRORS
+from .schema import GENERIC_SCHEMA, schema_for
+from .session import SessionPool
 from .utils._internal import _parse_error_response
-from .utils.jsonparser import snake_dict as _decoder, _BLACKLIST_PATH
+from .utils.jsonengine import get_engine
+from .utils.jsonparser import date_parser
+from .utils.jsonstream import StreamedResponse
 from .utils.router import Router
 
 __all__ = ['RadarlyApi']
@@ -65,8 +70,52 @@ class RadarlyApi: # pylint: disable=R0902
             initialization.
         rates (RateLimit): RateLimit object which can be used to know the
             current number of requests made and how many left you can do.
+        throttle (bool): whether or not delay the requests in order to
+            respect the rate limits instead of raising a ``RateReached``
+            error. Can be set at initialization. Default to False.
+        scheduler (RateScheduler): scheduler used to delay the requests
+            when ``throttle`` is set to True, None otherwise.
+        retry (RetryPolicy): policy used to retry the requests which failed
+            because of a transient error. If None, the requests are not
+            retried. Can be set at initialization.
+        pool_size (int): maximum number of connections kept alive with the
+            Radarly's server. Can be set at initialization. Default to 10.
+        session (requests.Session): session used to perform the requests.
+            If None during initialization, a session shared with all the
+            API objects pointing at the same host will be used. Can be set at
+            initialization.
+        timestamps (str): decoding of the dates of the responses:
+            ``'datetime'`` to get ``datetime`` objects, ``'epoch'`` to get
+            numbers of milliseconds since the epoch (UTC), which are cheaper
+            to build and can be handed over to ``numpy`` or ``pandas``
+            as is. Can be set at initialization and overridden for a request
+            with the ``timestamps`` argument of ``request``. Default to
+            ``'datetime'``.
+        intern (list[str] or bool): paths of the values of the responses
+            which must be interned (see ``InternTable``), in addition to
+            those declared by the decoding schemas (see ``radarly.schema``).
+            The paths are written with the original keys of the responses,
+            separated by dots, as ``'hits.user.name'``. If False, no value
+            is interned. Can be set at initialization. Default to None.
+        intern_table (InternTable): table storing the interned values. If
+            None, the table shared by all the decoders is used. Can be set
+            at initialization.
+        cache (ResponseCache): cache of the responses of the GET requests
+            and of the insights (see ``radarly.cache``). A response found in
+            the cache is
+            decoded without sending any request, so that it doesn't consume
+            the rate limits. If None, the responses are not cached. Can be
+            set at initialization.
+
+    The API can be used as a context manager in order to release its
+    connections as soon as you don't need it anymore:
+
+    >>> with RadarlyApi(client_id=<client_id>,
+    ...                 client_secret=<client_secret>) as api:
+    ...     project = Project.find(pid=<project_id>, api=api)
     """
     _default_api = None
+    _asynchronous = False
 
     def __init__(self, # pylint: disable=C0303
                  client_id=None,
@@ -78,7 +127,15 @@ class RadarlyApi: # pylint: disable=R0902
                  version='1.1',
                  router=None,
                  environment='prod',
-                 authenticate=True):
+                 authenticate=True,
+                 pool_size=10,
+                 session=None,
+                 throttle=False,
+                 retry=None,
+                 timestamps='datetime',
+                 intern=None,
+                 intern_table=None,
+                 cache=None):
         client_id = client_id or getenv('RADARLY_CLIENT_ID')
         client_secret = client_secret or getenv('RADARLY_CLIENT_SECRET')
         if not(client_id and client_secret):
@@ -100,6 +157,13 @@ class RadarlyApi: # pylint: disable=R0902
         self.last_refresh = datetime.now()
         self._auth = None
         self.rates = RateLimit()
+        self.scheduler = RateScheduler(self.rates) if throttle else None
+        self.retry = retry
+        date_parser(timestamps)
+        self.timestamps = timestamps
+        self.intern = intern
+        self.intern_table = intern_table
+        self.cache = cache
         self.scope = scope or [
             'listening',
             'social-performance',
@@ -108,12 +172,45 @@ class RadarlyApi: # pylint: disable=R0902
         self.environment = environment
         self.router = router or \
             type('Router', Router.__bases__, dict(Router.__dict__))
+        self.pool_size = pool_size
+        self._shared_session = session is None
+        self.session = session
         if authenticate:
             self.authenticate()
 
     def __repr__(self):
         return '<RadarlyAPI.client_id={.client_id}>'.format(self)
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _acquire_session(self):
+        """Get the session shared by all the APIs pointing at the same
+        host."""
+        self.session = SessionPool.acquire(
+            self.router.host[self.environment], self.pool_size
+        )
+        return self.session
+
+    def close(self):
+        """Release the connections used by the API. A shared session is
+        closed as soon as no API uses it anymore; a session given during the
+        initialization is left open. Calling this method several times is
+        safe and the API can still be used after being closed (a new session
+        will be acquired by the next request).
+
+        Returns:
+            None:
+        """
+        if self.session is not None and self._shared_session:
+            SessionPool.release(self.router.host[self.environment],
+                                self.pool_size)
+            self.session = None
+        return None
+
     @classmethod
     def init(cls, *args, **kwargs):
         """
@@ -129,6 +226,7 @@ class RadarlyApi: # pylint: disable=R0902
             scope (list[str]): list of scope
             timeout (float): timeout for the requests
             proxies (dict): proxies to use for the requests.
+            pool_size (int): number of connections kept alive.
         """
         api = cls(*args, **kwargs)
         cls.set_default_api(api)
@@ -152,61 +250,258 @@ class RadarlyApi: # pylint: disable=R0902
     @classmethod
     def set_default_api(cls, api):
         """Set a default API for the client. This method is automatically
-        called when you use the ``init`` class method."""
-        assert isinstance(api, cls), ("Only a RadarlyApi object can "
-                                      "be set as default api")
+        called when you use the ``init`` class method.
+
+        Raises:
+            TypeError: raised if the API is not an instance of the class, or
+                if an asynchronous API is set as default synchronous API
+                (its methods return coroutines).
+        """
+        if not isinstance(api, cls) or api._asynchronous != cls._asynchronous:
+            raise TypeError("Only a {} object can be set as default "
+                            "api.".format(cls.__name__))
         cls._default_api = api
         return None
 
     def request(self, verb, url, **kwargs):
         """
-        Send a request using the request module. Some pre- and post-tasks
+        Send a request using the session of the API. Some pre- and post-tasks
         are computed each time in order to actualize the rates information
         and check whether or not the request is a success. This method uses
         the same parameters as request function of requests module so you can
         easily made your own authenticated request.
 
+        With ``raw`` set to True, the response is only parsed: the keys keep
+        the format of the API and no value is decoded. With ``raw`` set to
+        ``'bytes'``, the body of the response is returned as is. These modes
+        are useful to forward the responses without paying for their
+        decoding.
+
         Args:
             verb (string): method used for the request
             url (string): url to ask
+            raw (bool or str, optional): False to decode the response, True
+                to only parse it, ``'bytes'`` to get the body of the
+                response. Default to False.
+            timestamps (str, optional): decoding of the dates of the
+                response, ``'datetime'`` or ``'epoch'``. If None, the
+                ``timestamps`` option of the API is used.
             **kwargs: keywords arguments sent with request
         Raises:
             HTTP Error: raised if the request failed for an unknown cause
         Returns:
-            dict: corresponds to the response data of the answer
+            dict: corresponds to the response data of the answer (bytes if
+            ``raw`` is ``'bytes'``)
         """
-        root_url = self.router.host[self.environment]
-        url = url.strip('/')
+        url = self._build_url(url)
         if self._auth is None:
             self.authenticate()
+        cached = self._cache_policy(verb, url, kwargs)
+        kwargs = self._build_kwargs(kwargs)
+        attempt, elapsed = 0, 0.
+        while True:
+            try:
+                return self._request_once(verb, url, cached=cached, **kwargs)
+            except (RadarlyHTTPError,) + TRANSIENT_ERRORS as error:
+                delay = self._retry_delay(verb, url, error, attempt, elapsed)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt, elapsed = attempt + 1, elapsed + delay
+
+    def stream(self, verb, url, key='hits', **kwargs):
+        """Send a request whose response is read incrementally. The items
+        of the array ``key`` of the response are decoded as soon as they are
+        received, instead of waiting for the whole body of the response. The
+        request is retried (see ``RetryPolicy``) until its headers are
+        received, not when the connection fails while its body is read.
+
+        >>> url = api.router.publication['search'].format(project_id=1)
+        >>> response = api.stream('POST', url, data=parameter)
+        >>> for hit in response:
+        ...     print(hit['uid'])
+
+        Args:
+            verb (string): method used for the request
+            url (string): url to ask
+            key (string, optional): name of the array of the response which
+                is streamed. Default to 'hits'.
+            **kwargs: keywords arguments sent with request. With ``raw``
+                set to True, the items are only parsed (see ``request``).
+        Raises:
+            HTTP Error: raised if the request failed for an unknown cause
+        Returns:
+            StreamedResponse: iterable over the items of the array. The other
+            members of the response are available with
+            ``response[<name>]``.
+        """
+        if kwargs.get('raw') == 'bytes':
+            raise ValueError("The raw bytes of a response can't be streamed.")
+        return self.request(verb, url, stream=True, stream_key=key, **kwargs)
+
+    def _request_once(self, verb, url, stream_key=None, raw=False,
+                      timestamps=None, cached=None, **kwargs):
+        """Send a request once, refreshing the tokens if they have
+        expired. A fresh response of the cache is returned without sending
+        the request."""
+        cached = self._cache_lookup(cached, kwargs)
+        if cached[2] is not None and cached[2].fresh:
+            return self._decode_content(url, cached[2].content, raw,
+                                        timestamps)
+        delay = self._rate_delay(url)
+        if delay:
+            time.sleep(delay)
+        session = self.session or self._acquire_session()
+
+        try:
+            res = session.request(verb, url, auth=self._auth, **kwargs)
+
+            if self.autorefresh and self._has_expired(res):
+                self.refresh()
+                res = session.request(verb, url, auth=self._auth, **kwargs)
+            return self._handle_response(url, res, stream_key, raw,
+                                         timestamps, cached)
+        finally:
+            self._rate_release(url)
+
+    def _rate_delay(self, url):
+        """Number of seconds to wait before sending a request. Without
+        scheduler, an error is raised if the rate limit is reached."""
+        if self.scheduler is None:
+            if self.rates.is_reached(url):
+                raise RateReached('No more request available')
+            return 0
+        return self.scheduler.delay(url)
+
+    def _rate_release(self, url):
+        """Notify the scheduler that a request is done"""
+        if self.scheduler is not None:
+            self.scheduler.release(url)
+
+    def _retry_delay(self, verb, url, error, attempt, elapsed):
+        """Delay before retrying a failed request, None if the request
+        must not be retried."""
+        if self.retry is None:
+            return None
+        return self.retry.next_delay(verb, url, error, attempt, elapsed)
+
+    def _build_url(self, url):
+        """Build the full URL of a request from a path of the ``Router``"""
+        root_url = self.router.host[self.environment]
+        url = url.strip('/')
         if self.version and not url.startswith(self.version) \
             and not url.startswith(root_url):
             url = '{}/{}'.format(self.version, url)
-        url = url if root_url in url  \
+        return url if root_url in url  \
             else '{}/{}'.format(root_url, url)
+
+    def _build_kwargs(self, kwargs):
+        """Set the default headers, timeout and proxies of a request and
+        serialize its payload."""
         kwargs.setdefault('headers', {})
         kwargs['headers'].setdefault('Content-Type', 'application/json')
         if ('data' in kwargs and
                 kwargs['headers']['Content-Type'] == 'application/json'):
-            kwargs['data'] = json.dumps(kwargs['data'])
+            kwargs['data'] = get_engine().dumpb(kwargs['data'])
         kwargs.setdefault('timeout', self.timeout)
         kwargs.setdefault('proxies', self.proxies)
-        if self.rates.is_reached(url):
-            raise RateReached('No more request available')
-
-        res = requests.request(verb, url, auth=self._auth, **kwargs)
+        return kwargs
 
+    @staticmethod
+    def _has_expired(res):
+        """Whether or not a request failed because of an expired token"""
         error_data = _parse_error_response(res)
-        error_type = error_data.get('error_type', '')
-        if self.autorefresh and error_type == 'ExpiredTokenException':
-            self.refresh()
-            res = requests.request(verb, url, auth=self._auth, **kwargs)
+        return error_data.get('error_type', '') == 'ExpiredTokenException'
+
+    def _handle_response(self, url, res, stream_key=None, raw=False,
+                         timestamps=None, cached=(None, None, None)):
+        """Check the response of a request, update the rates and decode the
+        content of the response. With a ``stream_key``, the response is
+        wrapped in a ``StreamedResponse`` decoding the array ``stream_key``
+        incrementally. ``cached`` is the key, the duration and the entry of
+        the request in the cache (see ``_cache_lookup``): the response is
+        stored in the cache, or the entry is used again if the server
+        answered that it is not modified."""
+        key, ttl, entry = cached
+        if entry is not None and res.status_code == 304:
+            self.rates.update(url, res.headers)
+            entry = self.cache.revalidate(key, entry, res)
+            return self._decode_content(url, entry.content, raw, timestamps)
         if not res.ok:
             raise RadarlyHTTPError(response=res)
 
         self.rates.update(url, res.headers)
+        if key is not None:
+            self.cache.set(key, ttl, res)
+
+        if stream_key is not None and raw != 'bytes':
+            decoder = None if raw else self.decoder(url, timestamps)
+            return StreamedResponse(res, stream_key, decoder)
+        return self._decode_content(url, res.content, raw, timestamps)
+
+    def _decode_content(self, url, content, raw=False, timestamps=None):
+        """Decode the body of a response. The responses of the routes
+        having a decoding schema only have their declared fields decoded.
+        See ``request`` for the ``raw`` modes."""
+        if raw == 'bytes':
+            return content
+        if raw:
+            return get_engine().loads(content)
+        return self.decoder(url, timestamps).decode(content)
 
-        return _decoder(res.json(), blacklist=_BLACKLIST_PATH)
+    def _cache_policy(self, verb, url, kwargs):
+        """Identify a request in the cache of the API. It must be called
+        before the serialization of the payload of the request, which is
+        part of the identifier of the insights.
+
+        Returns:
+            tuple(str, float): key of the request and duration of its entry,
+            None if the request can't be cached.
+        """
+        if self.cache is None or kwargs.get('stream_key') is not None:
+            return None
+        scope = [self.client_id, sorted(self.scope)]
+        data = kwargs.get('data')
+        key = self.cache.key(verb, url, kwargs.get('params'), scope, data)
+        if key is None:
+            return None
+        return key, self.cache.ttl_for(url, verb, data)
+
+    def _cache_lookup(self, cached, kwargs):
+        """Look up a request identified by ``_cache_policy`` in the cache of
+        the API. The validators of an expired entry are added to the headers
+        of the request, in order to revalidate it.
+
+        Returns:
+            tuple(str, float, CacheEntry): key of the request (None if it
+            can't be cached), duration of its entry and its entry (None if it
+            isn't in the cache).
+        """
+        if cached is None:
+            return None, None, None
+        key, ttl = cached
+        entry = self.cache.get(key)
+        if entry is not None and not entry.fresh:
+            kwargs['headers'] = dict(kwargs.get('headers') or {},
+                                     **entry.validators)
+        return key, ttl, entry
+
+    def decoder(self, url, timestamps=None):
+        """Build the decoder of the responses of an URL: the decoder of its
+        schema if the route has one, the generic decoder otherwise. The
+        ``intern`` and ``intern_table`` options of the API are applied.
+
+        Args:
+            url (str): url of the request (or path of the ``Router``)
+            timestamps (str, optional): decoding of the dates. If None, the
+                ``timestamps`` option of the API is used.
+        Returns:
+            RadarlyDecoder:
+        """
+        timestamps = timestamps or self.timestamps
+        schema = schema_for(self._build_url(url)) or GENERIC_SCHEMA
+        return schema.decoder(timestamps, intern=self.intern,
+                              intern_table=self.intern_table)
 
     def get(self, url, **kwargs):
         """Shortcut for the ``request`` method with 'GET' as verb.
@@ -260,22 +555,11 @@ class RadarlyApi: # pylint: disable=R0902
         Returns:
             None:
         """
-        data = dict(
-            client_id=self.client_id,
-            client_secret=self.client_secret,
-            grant_type='client_credentials',
-            scope=' '.join(self.scope)
-        )
-        headers = {'Content-Type': 'application/x-www-form-urlencoded'}
-        kwargs = dict(
-            data=data,
-            headers=headers,
-            proxies=self.proxies,
-            timeout=self.timeout
-        )
         url = self.router.oauth[self.environment]
-        auth_response = requests.request('POST', url,
-                                         **kwargs)
+        session = self.session or self._acquire_session()
+        auth_response = session.request(
+            'POST', url, **self._oauth_kwargs('client_credentials')
+        )
         try:
             auth_response.raise_for_status()
         except requests.exceptions.HTTPError:
@@ -283,9 +567,7 @@ class RadarlyApi: # pylint: disable=R0902
             raise AuthenticationError(auth_response.get('error'))
         auth_response = auth_response.json()
         self.scope = auth_response.get('scope', '').split(' ')
-        self.access_token = auth_response.get('access_token')
-        self.refresh_token = auth_response.get('refresh_token')
-        self._auth = RadarlyAuth(self.access_token)
+        self._store_tokens(auth_response)
         return None
 
     def refresh(self):
@@ -294,22 +576,45 @@ class RadarlyApi: # pylint: disable=R0902
         token has expired. The auto-refresh behaviour can be ignored with
         the autorefresh attribute.
         """
+        url = self.router.oauth[self.environment]
+        session = self.session or self._acquire_session()
+        auth_response = session.request(
+            'POST', url, **self._oauth_kwargs('refresh_token')
+        )
+        self._store_tokens(auth_response.json())
+        self.last_refresh = datetime.now()
+        return None
+
+    def _oauth_kwargs(self, grant_type):
+        """Build the keywords arguments of a request sent to the OAUTH2
+        server.
+
+        Args:
+            grant_type (str): 'client_credentials' to authenticate or
+                'refresh_token' to refresh the tokens.
+        Returns:
+            dict:
+        """
         data = dict(
             client_id=self.client_id,
             client_secret=self.client_secret,
-            grant_type='refresh_token',
-            refresh_token=self.refresh_token,
+            grant_type=grant_type,
         )
-        headers = {
-            'Content-Type': 'application/x-www-form-urlencoded'
-        }
-        url = self.router.oauth[self.environment]
-        auth_response = requests.request('POST', url,
-                                         data=data, headers=headers,
-                                         proxies=self.proxies, timeout=self.timeout)
-        auth_response = auth_response.json()
+        if grant_type == 'refresh_token':
+            data['refresh_token'] = self.refresh_token
+        else:
+            data['scope'] = ' '.join(self.scope)
+        headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+        return dict(
+            data=data,
+            headers=headers,
+            proxies=self.proxies,
+            timeout=self.timeout
+        )
+
+    def _store_tokens(self, auth_response):
+        """Store the tokens returned by the OAUTH2 server"""
         self.access_token = auth_response.get('access_token')
         self.refresh_token = auth_response.get('refresh_token')
         self._auth = RadarlyAuth(self.access_token)
-        self.last_refresh = datetime.now()
         return None
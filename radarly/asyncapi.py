@@ -0,0 +1,249 @@
+"""
+Asynchronous version of the ``RadarlyApi``. The ``AsyncRadarlyApi`` shares
+the routing, the rates tracking and the decoding of the ``RadarlyApi`` but
+the methods sending requests (``request``, ``get``, ``post``, ``put``,
+``authenticate`` and ``refresh``) are coroutines. Each object of
+``radarly-py`` retrieving data from the API defines coroutine counterparts of
+its methods (prefixed by ``a``, as ``Publication.afetch``) which use an
+``AsyncRadarlyApi``.
+
+This module relies on :mod:`aiohttp` which must be installed to use the
+asynchronous client (``pip install radarly-py[async]``).
+
+>>> import asyncio
+>>> from radarly import AsyncRadarlyApi
+>>> from radarly.publication import Publication
+>>> async def main():
+...     async with AsyncRadarlyApi(client_id=<client_id>,
+...                                client_secret=<client_secret>) as api:
+...         async for publication in Publication.afetch_all(
+...                 <project_id>, <parameter>, api=api):
+...             print(publication)
+>>> asyncio.run(main())
+"""
+
+import asyncio
+from datetime import datetime
+
+import requests
+from requests.models import RequestEncodingMixin
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from .api import RadarlyApi
+from .exceptions import AuthenticationError, RadarlyHTTPError
+from .retry import TRANSIENT_ERRORS
+
+__all__ = ['AsyncRadarlyApi']
+
+STREAM_ERROR = "The responses can't be streamed with an AsyncRadarlyApi."
+
+
+class AsyncRadarlyApi(RadarlyApi):
+    """Asynchronous interface with the Radarly API. It takes the same
+    arguments as the ``RadarlyApi`` but, given that a coroutine can not be
+    awaited during the initialization, the authentication is made when
+    entering the ``async with`` block or during the first request.
+
+    Args:
+        pool_size (int): maximum number of simultaneous connections with the
+            Radarly's server. Default to 10.
+        session (aiohttp.ClientSession): session used to perform the
+            requests. If None, the API builds its own session the first
+            time it sends a request.
+    """
+    _default_api = None
+    _asynchronous = True
+
+    def __init__(self, *args, **kwargs):
+        if aiohttp is None:
+            raise ImportError(("The asynchronous client requires the "
+                               "aiohttp package. Install it with "
+                               "`pip install radarly-py[async]`."))
+        kwargs['authenticate'] = False
+        super().__init__(*args, **kwargs)
+
+    def __repr__(self):
+        return '<AsyncRadarlyAPI.client_id={.client_id}>'.format(self)
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with an AsyncRadarlyApi object.")
+
+    async def __aenter__(self):
+        if self._auth is None:
+            await self.authenticate()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _acquire_session(self):
+        """Build the session of the API. It must be called inside a running
+        event loop."""
+        connector = aiohttp.TCPConnector(limit=self.pool_size)
+        self.session = aiohttp.ClientSession(connector=connector)
+        return self.session
+
+    async def close(self):
+        """Close the session of the API if it was built by the API."""
+        if self.session is not None and self._shared_session:
+            await self.session.close()
+            self.session = None
+        return None
+
+    async def _send(self, verb, url, auth=None, proxies=None, timeout=None,
+                    **kwargs):
+        """Send a request with ``aiohttp``. The keywords arguments are the
+        same as those of ``requests`` and the response is converted into a
+        ``requests.Response`` in order to reuse the error and rates
+        handling of ``RadarlyApi``."""
+        session = self.session or self._acquire_session()
+        if auth is not None:
+            kwargs['headers'] = dict(kwargs.get('headers') or {})
+            kwargs['headers']['Authorization'] = 'Bearer {}'.format(auth.token)
+        if kwargs.get('params') is not None:
+            kwargs['params'] = RequestEncodingMixin._encode_params(
+                kwargs['params']
+            )
+        proxy = (proxies or {}).get(url.split(':')[0])
+        timeout = aiohttp.ClientTimeout(total=timeout)
+        try:
+            async with session.request(verb, url, proxy=proxy,
+                                       timeout=timeout, **kwargs) as res:
+                content = await res.read()
+        except asyncio.TimeoutError as error:
+            raise requests.exceptions.Timeout(str(error)) from error
+        except aiohttp.ClientPayloadError as error:
+            raise requests.exceptions.ChunkedEncodingError(str(error)) \
+                from error
+        except aiohttp.ClientConnectionError as error:
+            raise requests.exceptions.ConnectionError(str(error)) from error
+        return _to_response(res, content)
+
+    async def request(self, verb, url, **kwargs):
+        """Coroutine version of ``RadarlyApi.request``.
+
+        Args:
+            verb (string): method used for the request
+            url (string): url to ask
+            raw (bool or str, optional): see ``RadarlyApi.request``
+            timestamps (str, optional): see ``RadarlyApi.request``
+            **kwargs: keywords arguments sent with request (same as those of
+                the ``requests`` module)
+        Raises:
+            ValueError: raised if the response is streamed (see
+                ``RadarlyApi.stream``), which is only supported by the
+                ``RadarlyApi``
+            HTTP Error: raised if the request failed for an unknown cause
+        Returns:
+            dict: corresponds to the response data of the answer
+        """
+        if 'stream_key' in kwargs:
+            raise ValueError(STREAM_ERROR)
+        url = self._build_url(url)
+        if self._auth is None:
+            await self.authenticate()
+        cached = self._cache_policy(verb, url, kwargs)
+        kwargs = self._build_kwargs(kwargs)
+        attempt, elapsed = 0, 0.
+        while True:
+            try:
+                return await self._request_once(verb, url, cached=cached,
+                                                **kwargs)
+            except (RadarlyHTTPError,) + TRANSIENT_ERRORS as error:
+                delay = self._retry_delay(verb, url, error, attempt, elapsed)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt, elapsed = attempt + 1, elapsed + delay
+
+    async def _request_once(self, verb, url, raw=False, timestamps=None,
+                            cached=None, **kwargs):
+        """Coroutine version of ``RadarlyApi._request_once``"""
+        cached = self._cache_lookup(cached, kwargs)
+        if cached[2] is not None and cached[2].fresh:
+            return self._decode_content(url, cached[2].content, raw,
+                                        timestamps)
+        delay = self._rate_delay(url)
+        if delay:
+            await asyncio.sleep(delay)
+
+        try:
+            res = await self._send(verb, url, auth=self._auth, **kwargs)
+
+            if self.autorefresh and self._has_expired(res):
+                await self.refresh()
+                res = await self._send(verb, url, auth=self._auth, **kwargs)
+            return self._handle_response(url, res, raw=raw,
+                                         timestamps=timestamps,
+                                         cached=cached)
+        finally:
+            self._rate_release(url)
+
+    async def get(self, url, **kwargs):
+        """Shortcut for the ``request`` coroutine with 'GET' as verb."""
+        return await self.request('GET', url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        """Shortcut for the ``request`` coroutine with 'POST' as verb."""
+        return await self.request('POST', url, **kwargs)
+
+    async def put(self, url, **kwargs):
+        """Shortcut for the ``request`` coroutine with 'PUT' as verb."""
+        return await self.request('PUT', url, **kwargs)
+
+    async def authenticate(self):
+        """Coroutine version of ``RadarlyApi.authenticate``.
+
+        Raises:
+            AuthenticationError: raised if client_id or client_secret is
+                incorrect
+        Returns:
+            None:
+        """
+        url = self.router.oauth[self.environment]
+        auth_response = await self._send(
+            'POST', url, **self._oauth_kwargs('client_credentials')
+        )
+        try:
+            auth_response.raise_for_status()
+        except requests.exceptions.HTTPError:
+            auth_response = auth_response.json()
+            raise AuthenticationError(auth_response.get('error'))
+        auth_response = auth_response.json()
+        self.scope = auth_response.get('scope', '').split(' ')
+        self._store_tokens(auth_response)
+        return None
+
+    async def refresh(self):
+        """Coroutine version of ``RadarlyApi.refresh``."""
+        url = self.router.oauth[self.environment]
+        auth_response = await self._send(
+            'POST', url, **self._oauth_kwargs('refresh_token')
+        )
+        self._store_tokens(auth_response.json())
+        self.last_refresh = datetime.now()
+        return None
+
+
+def _to_response(res, content):
+    """Convert an ``aiohttp`` response into a ``requests.Response``.
+
+    Args:
+        res (aiohttp.ClientResponse):
+        content (bytes): body of the response
+    Returns:
+        requests.Response:
+    """
+    response = requests.Response()
+    response.status_code = res.status
+    response.reason = res.reason
+    response.url = str(res.url)
+    response.headers = CaseInsensitiveDict(res.headers)
+    response.encoding = res.charset
+    response._content = content # pylint: disable=W0212
+    return response
@@ -0,0 +1,251 @@
+"""
+Columnar storage of the publications. Building a ``Publication`` object for
+each publication and then converting the publications into a
+``pandas.DataFrame`` row after row keeps two copies of each publication in
+memory. A ``PublicationBatch`` stores the main fields of the publications of
+a page in typed arrays instead (the strings with few distinct values being
+dictionary-encoded), which are handed over to :mod:`pandas` or
+:mod:`pyarrow` without being rebuilt.
+
+>>> generator = Publication.fetch_all(<project_id>, param, raw=True)
+>>> frame = pandas.concat(
+...     batch.to_pandas() for batch in generator.iter_batches()
+... )
+
+The conversions require :mod:`pandas` or :mod:`pyarrow`
+(``pip install radarly-py[pandas]`` or ``pip install radarly-py[arrow]``).
+"""
+
+from array import array
+from datetime import datetime, timezone
+
+from .utils.jsonparser import parse_epoch, to_epoch
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+__all__ = ['PublicationBatch']
+
+
+_NAT = -2 ** 63
+
+
+class PublicationBatch:
+    """Columns of a set of publications. The dates are stored as numbers of
+    milliseconds since the epoch (UTC), the metrics as floats (NaN when the
+    metric is missing) and the tones, langs and platforms as indexes in the
+    list of their distinct values.
+
+    The publications can be given as the dictionaries sent by the API (with
+    ``raw=True``, which avoids building the ``Publication`` objects) or as
+    ``Publication`` objects.
+
+    Args:
+        hits (iterable[dict or Publication], optional): publications to store
+    """
+    COLUMNS = ('uid', 'date', 'platform', 'lang', 'tone', 'reach',
+               'impression')
+    _CATEGORIES = ('platform', 'lang', 'tone')
+    _METRICS = ('reach', 'impression')
+
+    def __init__(self, hits=None):
+        self.uid = []
+        self.date = array('q')
+        self.reach = array('d')
+        self.impression = array('d')
+        self.codes = {name: array('i') for name in self._CATEGORIES}
+        self.categories = {name: [] for name in self._CATEGORIES}
+        self._indexes = {name: {} for name in self._CATEGORIES}
+        for hit in hits or ():
+            self.append(hit)
+
+    def __repr__(self):
+        return '<PublicationBatch.length={}>'.format(len(self))
+
+    def __len__(self):
+        return len(self.uid)
+
+    def __getitem__(self, column):
+        """Values of a column, as a list of Python objects"""
+        if column in self._CATEGORIES:
+            categories = self.categories[column]
+            return [
+                categories[code] if code >= 0 else None
+                for code in self.codes[column]
+            ]
+        if column == 'date':
+            return [
+                None if value == _NAT else
+                datetime.fromtimestamp(value / 1000., timezone.utc)
+                for value in self.date
+            ]
+        if column in self.COLUMNS:
+            return list(getattr(self, column))
+        raise KeyError(column)
+
+    def append(self, hit):
+        """Add a publication to the batch.
+
+        Args:
+            hit (dict or Publication): publication to add
+        Returns:
+            None:
+        """
+        origin = _get(hit, 'origin') or {}
+        self.uid.append(_get(hit, 'uid'))
+        self.date.append(_epoch_ms(_get(hit, 'date')))
+        for name in self._METRICS:
+            value = _get(hit, name)
+            getattr(self, name).append(
+                float('nan') if value is None else value
+            )
+        for name, value in zip(self._CATEGORIES,
+                               (origin.get('platform'), _get(hit, 'lang'),
+                                _get(hit, 'tone'))):
+            self.codes[name].append(self._encode(name, value))
+        return None
+
+    def _encode(self, name, value):
+        """Index of a value in the distinct values of a column"""
+        if value is None:
+            return -1
+        indexes = self._indexes[name]
+        code = indexes.get(value)
+        if code is None:
+            code = indexes[value] = len(self.categories[name])
+            self.categories[name].append(value)
+        return code
+
+    def to_numpy(self):
+        """Views of the columns as ``numpy`` arrays, sharing the memory of
+        the batch (except for the uids).
+
+        Raises:
+            ImportError: raised if numpy is not installed
+        Returns:
+            dict[str, numpy.ndarray]: the dates are a ``datetime64[ms]``
+            array and the columns dictionary-encoded are arrays of indexes.
+        """
+        _require(numpy, 'numpy', 'pandas')
+        columns = dict(
+            uid=numpy.array(self.uid, dtype=object),
+            date=numpy.frombuffer(self.date, dtype='datetime64[ms]'),
+        )
+        for name in self._METRICS:
+            columns[name] = numpy.frombuffer(getattr(self, name),
+                                             dtype=numpy.float64)
+        for name in self._CATEGORIES:
+            columns[name] = numpy.frombuffer(self.codes[name],
+                                             dtype=numpy.int32)
+        return columns
+
+    def to_pandas(self):
+        """Convert the batch into a ``pandas.DataFrame``. The tones, langs
+        and platforms are categorical columns built from the indexes of the
+        batch.
+
+        Raises:
+            ImportError: raised if pandas is not installed
+        Returns:
+            pandas.DataFrame:
+        """
+        _require(pandas, 'pandas', 'pandas')
+        columns = self.to_numpy()
+        columns['date'] = pandas.DatetimeIndex(columns['date'], tz='UTC')
+        for name in self._CATEGORIES:
+            columns[name] = pandas.Categorical.from_codes(
+                columns[name], categories=self.categories[name]
+            )
+        return pandas.DataFrame(columns, columns=list(self.COLUMNS),
+                                copy=False)
+
+    def to_arrow(self):
+        """Convert the batch into a ``pyarrow.Table``. The buffers of the
+        batch are used as the data buffers of the arrow arrays; the tones,
+        langs and platforms are dictionary arrays.
+
+        Raises:
+            ImportError: raised if pyarrow is not installed
+        Returns:
+            pyarrow.Table:
+        """
+        _require(pyarrow, 'pyarrow', 'arrow')
+        size = len(self)
+        columns = dict(uid=pyarrow.array(self.uid, type=pyarrow.string()))
+        columns['date'] = pyarrow.Array.from_buffers(
+            pyarrow.timestamp('ms', tz='UTC'), size,
+            [_validity(value != _NAT for value in self.date),
+             pyarrow.py_buffer(self.date)],
+        )
+        for name in self._CATEGORIES:
+            codes = self.codes[name]
+            indices = pyarrow.Array.from_buffers(
+                pyarrow.int32(), size,
+                [_validity(code >= 0 for code in codes),
+                 pyarrow.py_buffer(codes)],
+            )
+            columns[name] = pyarrow.DictionaryArray.from_arrays(
+                indices, pyarrow.array(self.categories[name],
+                                       type=pyarrow.string())
+            )
+        for name in self._METRICS:
+            values = getattr(self, name)
+            columns[name] = pyarrow.Array.from_buffers(
+                pyarrow.float64(), size,
+                [_validity(value == value for value in values),
+                 pyarrow.py_buffer(values)],
+            )
+        return pyarrow.table([columns[name] for name in self.COLUMNS],
+                             names=list(self.COLUMNS))
+
+
+def _get(hit, key):
+    """Get a field of a publication given as a dictionary or as an object"""
+    if isinstance(hit, dict):
+        return hit.get(key)
+    return getattr(hit, key, None)
+
+
+def _epoch_ms(value):
+    """Convert a date (a string sent by the API, a datetime or a date
+    already decoded into an epoch value) into a number of milliseconds since
+    the epoch"""
+    if value is None:
+        return _NAT
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        return parse_epoch(value)
+    return to_epoch(value)
+
+
+def _validity(flags):
+    """Validity bitmap of an arrow array, None if all the values are valid"""
+    flags = list(flags)
+    if all(flags):
+        return None
+    bitmap = bytearray((len(flags) + 7) // 8)
+    for index, flag in enumerate(flags):
+        if flag:
+            bitmap[index // 8] |= 1 << (index % 8)
+    return pyarrow.py_buffer(bytes(bitmap))
+
+
+def _require(module, name, extra):
+    """Raise an ImportError if an optional dependency is missing"""
+    if module is None:
+        raise ImportError(("This conversion requires the {} package. Install "
+                           "it with `pip install radarly-py[{}]`.").format(
+                               name, extra))
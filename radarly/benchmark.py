@@ -7,6 +7,7 @@ benchmark.
 """
 
 from .api import RadarlyApi
+from .asyncapi import AsyncRadarlyApi
 
 
 class Benchmark(dict):
@@ -58,3 +59,22 @@ class Benchmark(dict):
         url = api.router.benchmark['fetch'].format(project_id=project_id)
         data = api.get(url, params=parameter)
         return cls(data)
+
+    @classmethod
+    async def afetch(cls, project_id, parameter, api=None):
+        """Coroutine version of ``fetch``.
+
+        Args:
+            project_id (int): identifier of your project where information is
+                stored
+            parameter (BenchmarkParameter): parameter used to configure
+                the benchmark which will be performed.
+            api (AsyncRadarlyApi, optional): API object used to perform the
+                request. If None, it will use the default asynchronous API.
+        Returns:
+            Benchmark: dict-like object storing benchmark data by platform
+        """
+        api = api or AsyncRadarlyApi.get_default_api()
+        url = api.router.benchmark['fetch'].format(project_id=project_id)
+        data = await api.get(url, params=parameter)
+        return cls(data)
@@ -0,0 +1,324 @@
+"""
+Cache of the responses of the API. Some GET requests (the description of a
+project, the current user, the metadata of a publication...) are sent over
+and over with the same arguments by the dashboards built on top of
+``radarly-py``. With a ``ResponseCache``, the ``RadarlyApi`` keeps the body of
+these responses for a duration configured for each road of the ``Router``:
+a cached response is decoded again without sending any request, so that it
+doesn't consume the rate limits.
+
+Once a response has expired, it is revalidated with the ``ETag`` and
+``Last-Modified`` headers sent by the server (if any): if the server answers
+``304 Not Modified``, the cached body is used again for a new period.
+
+The insights (``Analytics``, ``Distribution``, ``Cloud``, ``PivotTable`` and
+``Localization``) are computed by the server on each request, which takes
+several seconds. They are cached too, for the parameter sent in the body of
+the request: once the publication date range of the parameter is closed (it
+ended more than ``closing_delay`` ago), the insights don't change anymore
+and their entries never expire. The insights of a range touching the recent
+past are only kept for a short duration.
+
+>>> from radarly.cache import ResponseCache
+>>> api = RadarlyApi(client_id=<client_id>, client_secret=<client_secret>,
+...                  cache=ResponseCache(maxsize=512, path='radarly.db'))
+"""
+
+import collections
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytz
+from dateutil.parser import parse
+
+from .parameters import Parameter
+from .utils.router import Router, into_pattern
+
+__all__ = ['CacheEntry', 'ResponseCache']
+
+
+DEFAULT_TTL = {
+    Router.benchmark['fetch']: 300,
+    Router.corpora['fetch_media']: 300,
+    Router.influencer['find']: 300,
+    Router.project['find']: 300,
+    Router.publication['metadata']: 300,
+    Router.user['me']: 300,
+}
+
+DEFAULT_INSIGHT_TTL = {
+    Router.analytics['global']: 300,
+    Router.analytics['occupation']: 300,
+    Router.cloud['fetch']: 300,
+    Router.distribution['fetch']: 300,
+    Router.localization['fetch']: 300,
+    Router.pivot_table['fetch']: 300,
+}
+
+
+class CacheEntry:
+    """Body of a cached response, with its validators.
+
+    Args:
+        content (bytes): body of the response
+        ttl (float): duration (in seconds) during which the entry is used
+            without revalidation (``float('inf')`` for an entry which never
+            expires)
+        etag (str, optional): value of the ``ETag`` header of the response
+        last_modified (str, optional): value of the ``Last-Modified`` header
+            of the response
+        stored (float, optional): timestamp of the storage (or of the last
+            revalidation) of the entry. Default to now.
+    """
+    def __init__(self, content, ttl, etag=None, last_modified=None,
+                 stored=None):
+        self.content = content
+        self.ttl = ttl
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored = time.time() if stored is None else stored
+
+    def __repr__(self):
+        return '<CacheEntry.size={}.fresh={}>'.format(len(self.content),
+                                                      self.fresh)
+
+    @property
+    def fresh(self):
+        """Whether or not the entry can be used without revalidation"""
+        return time.time() - self.stored < self.ttl
+
+    @property
+    def validators(self):
+        """Headers revalidating the entry with a conditional request"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Cache of the bodies of the responses of the API. The entries are
+    kept in memory (the ``maxsize`` most recently used) and, if ``path`` is
+    given, in a SQLite database, so that the cache is shared between
+    processes and survives a restart.
+
+    Only the GET requests of the roads listed in ``ttl`` and the POST
+    requests of the roads listed in ``insight_ttl`` are cached, each road for
+    its own duration. An entry is identified by the URL of the request (and
+    so by its road and its project), its query parameters, its payload and
+    the scope of the API (its client and OAuth scopes), so that two clients
+    sharing a database don't read each other's responses.
+
+    Args:
+        maxsize (int, optional): maximum number of entries kept in memory.
+            Default to 256.
+        path (str, optional): path of the SQLite database storing the
+            entries on disk. If None, the entries are only kept in memory.
+        ttl (dict[str, float], optional): duration (in seconds) of the
+            entries of each road of the ``Router``. Default to
+            ``DEFAULT_TTL`` (5 minutes for the description of the projects,
+            the users, the influencers, the corpora, the benchmarks and the
+            metadata of the publications).
+        insight_ttl (dict[str, float], optional): duration (in seconds) of
+            the entries of the insights whose publication date range is not
+            closed yet. Default to ``DEFAULT_INSIGHT_TTL`` (5 minutes for
+            the analytics, the distributions, the clouds, the pivot tables
+            and the localizations). Use an empty dictionary to not cache the
+            insights.
+        closing_delay (datetime.timedelta, optional): duration after which
+            the insights of a publication date range don't change anymore
+            (the publications being indexed, tagged or deleted with some
+            delay). Default to 1 day.
+    """
+    def __init__(self, maxsize=256, path=None, ttl=None, insight_ttl=None,
+                 closing_delay=timedelta(days=1)):
+        self.maxsize = maxsize
+        self.path = path
+        self.ttl = dict(DEFAULT_TTL if ttl is None else ttl)
+        self.insight_ttl = dict(
+            DEFAULT_INSIGHT_TTL if insight_ttl is None else insight_ttl
+        )
+        self.closing_delay = closing_delay
+        self._patterns = {
+            verb: [
+                (into_pattern(route + '$'), duration)
+                for route, duration in durations.items()
+            ]
+            for verb, durations in (('GET', self.ttl),
+                                    ('POST', self.insight_ttl))
+        }
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(("CREATE TABLE IF NOT EXISTS responses ("
+                              "key TEXT PRIMARY KEY, content BLOB, ttl REAL, "
+                              "etag TEXT, last_modified TEXT, stored REAL)"))
+            self._db.commit()
+
+    def __repr__(self):
+        return '<ResponseCache.length={}.path={}>'.format(len(self._entries),
+                                                          self.path)
+
+    def ttl_for(self, url, verb='GET', data=None):
+        """Duration of the entries of a request. The entries of the insights
+        whose publication date range ended more than ``closing_delay`` ago
+        never expire.
+
+        Args:
+            url (str): url of the request
+            verb (str, optional): method of the request. Default to 'GET'.
+            data (dict, optional): payload of the request
+        Returns:
+            float: None if the request must not be cached
+        """
+        for pattern, duration in self._patterns.get(verb.upper(), ()):
+            if pattern.search(url):
+                break
+        else:
+            return None
+        if verb.upper() == 'POST' and self._is_closed(data):
+            return float('inf')
+        return duration
+
+    def key(self, verb, url, params=None, scope=None, data=None):
+        """Build the identifier of the entry of a request.
+
+        Args:
+            verb (str): method of the request
+            url (str): url of the request
+            params (dict, optional): query parameters of the request
+            scope (object, optional): scope of the API sending the request
+            data (dict, optional): payload of the request (the parameter of
+                an insight), before its serialization. It is identified by
+                its digest (see ``Parameter.digest``).
+        Returns:
+            str: None if the request must not be cached
+        """
+        if not self.ttl_for(url, verb):
+            return None
+        if data is not None:
+            if not isinstance(data, Parameter):
+                data = Parameter(data)
+            data = data.digest()
+        identity = json.dumps([url, params or {}, scope, data],
+                              sort_keys=True, default=str)
+        return hashlib.sha1(identity.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """Get an entry, fresh or not.
+
+        Args:
+            key (str): identifier of the entry
+        Returns:
+            CacheEntry: None if the cache has no entry for this key
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+            if self._db is None:
+                return None
+            row = self._db.execute(
+                ("SELECT content, ttl, etag, last_modified, stored "
+                 "FROM responses WHERE key = ?"), (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            entry = CacheEntry(*row)
+            self._remember(key, entry)
+            return entry
+
+    def set(self, key, ttl, response):
+        """Store the body of a successful response.
+
+        Args:
+            key (str): identifier of the entry
+            ttl (float): duration of the entry (see ``ttl_for``)
+            response (requests.Response): response to store
+        Returns:
+            CacheEntry: the stored entry
+        """
+        entry = CacheEntry(
+            response.content, ttl,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+        )
+        self._store(key, entry)
+        return entry
+
+    def revalidate(self, key, entry, response):
+        """Extend an entry after a ``304 Not Modified`` response. The entry
+        is the one whose validators were sent with the conditional request:
+        it is stored again even if it was evicted (or the cache cleared)
+        in the meantime.
+
+        Args:
+            key (str): identifier of the entry
+            entry (CacheEntry): entry revalidated by the request
+            response (requests.Response): response of the conditional request
+        Returns:
+            CacheEntry: the revalidated entry
+        """
+        entry.stored = time.time()
+        entry.etag = response.headers.get('ETag') or entry.etag
+        entry.last_modified = (response.headers.get('Last-Modified') or
+                               entry.last_modified)
+        self._store(key, entry)
+        return entry
+
+    def clear(self):
+        """Remove all the entries of the cache"""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+
+    def close(self):
+        """Close the database of the cache"""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _is_closed(self, data):
+        """Whether or not the publication date range of the parameter of an
+        insight ended more than ``closing_delay`` ago. A range without end
+        is never closed."""
+        end = (data or {}).get('to')
+        if not end:
+            return False
+        if isinstance(end, str):
+            end = parse(end)
+        if end.tzinfo is None:
+            end = end.replace(tzinfo=pytz.utc)
+        return end < datetime.now(pytz.utc) - self.closing_delay
+
+    def _store(self, key, entry):
+        """Store an entry in memory and on disk"""
+        with self._lock:
+            self._remember(key, entry)
+            if self._db is not None:
+                self._db.execute(
+                    ("INSERT OR REPLACE INTO responses VALUES "
+                     "(?, ?, ?, ?, ?, ?)"),
+                    (key, entry.content, entry.ttl, entry.etag,
+                     entry.last_modified, entry.stored)
+                )
+                self._db.commit()
+
+    def _remember(self, key, entry):
+        """Keep an entry in memory, evicting the least recently used one if
+        the memory tier is full"""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
@@ -8,6 +8,7 @@ this kind of data.
 """
 
 from .api import RadarlyApi
+from .asyncapi import AsyncRadarlyApi
 
 
 class Cloud(dict):
@@ -58,3 +59,22 @@ class Cloud(dict):
         url = api.router.cloud['fetch'].format(project_id=project_id)
         data = api.post(url, data=parameter)
         return cls(data['cloud'])
+
+    @classmethod
+    async def afetch(cls, project_id, parameter, api=None):
+        """Coroutine version of ``fetch``.
+
+        Args:
+            project_id (int): identifier of your project.
+            parameter (CloudParameter): parameter used to
+                specify on which subset of publications the cloud
+                computations must be performed.
+            api (AsyncRadarlyApi, optional): API used to perform the
+                request. If None, the default asynchronous API will be used.
+        Returns:
+            Cloud: dict-like object storing statistics by fields
+        """
+        api = api or AsyncRadarlyApi.get_default_api()
+        url = api.router.cloud['fetch'].format(project_id=project_id)
+        data = await api.post(url, data=parameter)
+        return cls(data['cloud'])
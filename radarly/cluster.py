@@ -2,12 +2,13 @@
 similarities (for example, articles published in several medias but
 with the same source will be grouped in the same cluster)."""
 
-from copy import deepcopy
 from reprlib import repr as truncate_repr
 
 from .analytics import Analytics
 from .api import RadarlyApi
+from .asyncapi import AsyncRadarlyApi
 from .model import SourceModel
+from .parameters import Parameter
 from .publication import Publication
 from .cloud import Cloud
 
@@ -25,6 +26,14 @@ class Cluster(SourceModel):
             getattr(self, 'size'), truncate_repr(getattr(self, 'story'))
         )
 
+    def _story_parameter(self, parameter):
+        """Copy of a parameter restricted to the publications of the
+        cluster. The parameter isn't modified and can be a plain
+        dictionary."""
+        if not isinstance(parameter, Parameter):
+            parameter = Parameter(parameter)
+        return parameter.replace(stories=[getattr(self, 'story')])
+
     @classmethod
     def fetch(cls, project_id, parameter, api=None):
         """Retrieve clusters from the Radarly API.
@@ -49,6 +58,29 @@ class Cluster(SourceModel):
             ans.append(cls(data, api=api))
         return ans
 
+    @classmethod
+    async def afetch(cls, project_id, parameter, api=None):
+        """Coroutine version of ``fetch``. The clusters keep a reference
+        to the asynchronous API so their ``aget_*`` methods use it.
+
+        Args:
+            project_id (int): identifier of your project
+            parameter (ClusterParameter): parameter to configure
+                how the cluster are calculated.
+            api (AsyncRadarlyApi, optional): API used to perform the
+                request. If None, the default asynchronous API will be used.
+        Returns:
+            list[Cluster]:
+        """
+        api = api or AsyncRadarlyApi.get_default_api()
+        url = api.router.cluster['fetch'].format(project_id=project_id)
+        data = await api.post(url, data=parameter)
+        ans = []
+        for data in data['hits']:
+            data['project_id'] = project_id
+            ans.append(cls(data, api=api))
+        return ans
+
     def get_analytics(self, parameter, focuses=None):
         """Compute some insights about the set of publications in the
         cluster.
@@ -63,11 +95,20 @@ class Cluster(SourceModel):
         Returns:
             Analytics:
         """
-        parameter = deepcopy(parameter)
-        parameter['stories'] = [getattr(self, 'story')]
+        parameter = self._story_parameter(parameter)
         return Analytics.fetch(getattr(self, 'project_id'), parameter,
                                focuses=focuses, api=self._api)
 
+    async def aget_analytics(self, parameter, focuses=None):
+        """Coroutine version of ``get_analytics``.
+
+        Returns:
+            Analytics:
+        """
+        parameter = self._story_parameter(parameter)
+        return await Analytics.afetch(getattr(self, 'project_id'), parameter,
+                                      focuses=focuses, api=self._api)
+
     def get_publications(self, parameter):
         """Retrieve publications in the cluster.
 
@@ -79,12 +120,22 @@ class Cluster(SourceModel):
         Returns:
             Analytics:
         """
-        parameter = deepcopy(parameter)
-        parameter['stories'] = [getattr(self, 'story')]
+        parameter = self._story_parameter(parameter)
         return Publication.fetch(
             getattr(self, 'project_id'), parameter, self._api
         )
 
+    async def aget_publications(self, parameter):
+        """Coroutine version of ``get_publications``.
+
+        Returns:
+            list[Publication]:
+        """
+        parameter = self._story_parameter(parameter)
+        return await Publication.afetch(
+            getattr(self, 'project_id'), parameter, self._api
+        )
+
     def get_cloud(self, parameter):
         """Retrieve clouds insights about publications in the cluster.
 
@@ -95,8 +146,18 @@ class Cluster(SourceModel):
         Returns:
             Cloud:
         """
-        parameter = deepcopy(parameter)
-        parameter['stories'] = [getattr(self, 'story')]
+        parameter = self._story_parameter(parameter)
         return Cloud.fetch(
             getattr(self, 'project_id'), parameter, self._api
         )
+
+    async def aget_cloud(self, parameter):
+        """Coroutine version of ``get_cloud``.
+
+        Returns:
+            Cloud:
+        """
+        parameter = self._story_parameter(parameter)
+        return await Cloud.afetch(
+            getattr(self, 'project_id'), parameter, self._api
+        )
@@ -2,6 +2,7 @@
 """
 
 from .api import RadarlyApi
+from .asyncapi import AsyncRadarlyApi
 from .model import SourceModel
 
 
@@ -41,6 +42,23 @@ class Corpus(SourceModel):
         )
         return api.get(url)
 
+    @classmethod
+    async def afetch_media(cls, project_id, corpora_id, api=None):
+        """Coroutine version of ``fetch_media``.
+
+        Args:
+            project_id (int): identifier of the project
+            corpora_id (int): identifier of the corpus
+            api (optional, AsyncRadarlyApi): API to use to perform the
+                request. If ``None``, the default asynchronous API will be
+                used.
+        """
+        api = api or AsyncRadarlyApi.get_default_api()
+        url = api.router.corpora['fetch_media'].format(
+            project_id=project_id, corpora_id=corpora_id
+        )
+        return await api.get(url)
+
 
 class InfoCorpus(SourceModel):
     """Store small part of information about a corpus. In order to get the full
@@ -80,3 +98,15 @@ class InfoCorpus(SourceModel):
                                                          self['id'],
                                                          api)
         return Corpus(data=data_corpus)
+
+    async def aexpand(self, api=None):
+        """Coroutine version of ``expand``.
+
+        Returns:
+            Corpus:
+        """
+        data_corpus = self.__dict__
+        data_corpus['media_source'] = await Corpus.afetch_media(
+            self['project_id'], self['id'], api
+        )
+        return Corpus(data=data_corpus)
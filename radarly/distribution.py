@@ -5,6 +5,7 @@ publications.
 """
 
 from .api import RadarlyApi
+from .asyncapi import AsyncRadarlyApi
 
 
 class Distribution(list):
@@ -42,7 +43,7 @@ class Distribution(list):
         return '<Distribution.length={}>'.format(len(self))
 
     @classmethod
-    def fetch(cls, project_id, parameter, api=None):
+    def fetch(cls, project_id, parameter, api=None, timestamps=None):
         """Retrieve distribution data from the Radarly API.
 
         Args:
@@ -53,10 +54,35 @@ class Distribution(list):
                 how to build this object.
             api (RadarlyApi, optional): API used to make the
                 request. If None, the default API will be used.
+            timestamps (str, optional): ``'epoch'`` to get the dates as
+                numbers of milliseconds since the epoch instead of
+                ``datetime`` objects (see ``RadarlyApi``). If None, the
+                option of the API is used.
         Returns:
             Distribution: list-like object storing statistics by date.
         """
         api = api or RadarlyApi.get_default_api()
         url = api.router.distribution['fetch'].format(project_id=project_id)
-        data = api.post(url, data=parameter)
+        data = api.post(url, data=parameter, timestamps=timestamps)
+        return cls(data['distribution'])
+
+    @classmethod
+    async def afetch(cls, project_id, parameter, api=None,
+                     timestamps=None):
+        """Coroutine version of ``fetch``.
+
+        Args:
+            project_id (int): identifier of your project
+            parameter (DistributionParameter): parameter used to specify
+                on which subset of publications the distribution must be
+                computed.
+            api (AsyncRadarlyApi, optional): API used to make the
+                request. If None, the default asynchronous API will be used.
+            timestamps (str, optional): see ``fetch``.
+        Returns:
+            Distribution: list-like object storing statistics by date.
+        """
+        api = api or AsyncRadarlyApi.get_default_api()
+        url = api.router.distribution['fetch'].format(project_id=project_id)
+        data = await api.post(url, data=parameter, timestamps=timestamps)
         return cls(data['distribution'])
@@ -6,6 +6,7 @@ region.
 """
 
 from .api import RadarlyApi
+from .asyncapi import AsyncRadarlyApi
 
 
 class GeoGrid(list):
@@ -56,3 +57,21 @@ class GeoGrid(list):
         url = api.router.geogrid['fetch'].format(project_id=project_id)
         data = api.post(url, data=parameter)
         return cls(data)
+
+    @classmethod
+    async def afetch(cls, project_id, parameter, api=None):
+        """Coroutine version of ``fetch``.
+
+        Args:
+            project_id (int): unique identifier of the project
+            parameter (GeoParameter): parameter to specify how to
+                compute the geographical distribution.
+            api (AsyncRadarlyApi, optional): API used to make the
+                request. If None, the default asynchronous API will be used.
+        Returns:
+            GeoGrid: list-like object compatible with ``pandas``
+        """
+        api = api or AsyncRadarlyApi.get_default_api()
+        url = api.router.geogrid['fetch'].format(project_id=project_id)
+        data = await api.post(url, data=parameter)
+        return cls(data)
@@ -6,28 +6,20 @@ influencers in your project and consequently understand your audience.
 """
 
 from .api import RadarlyApi
-from .model import GeneratorModel, SourceModel
+from .asyncapi import AsyncRadarlyApi
+from .model import (AsyncGeneratorModel, CompactModel, GeneratorModel,
+                    SourceModel)
+from .parameters import InfluencerParameter
 from .utils._internal import parse_struct_stat
 
 
-class Influencer(SourceModel):
-    """Dict-like object storing information about an influencer. The value of
-    this object are available as value associated to a key, or as attribute of
-    the instance. Here are some useful attributes:
-
-    .. warning:: The structure of the ``Influencer`` object may change
-        depending on the platform
-
-    Args:
-        id (str): identifier for the influencer
-        platform (str): origin platform of the influencer
-        screen_name (str): display name on the social_accounts
-        permalink (str): link to the social_account
-        followers_count (int): numbers of followers of the influencer
-        count (int): number of documents published by the follower in your
-            project.
-        stats (dict): statitics about the influencers publications
+class _InfluencerBase(SourceModel):
+    """Fields and methods shared by ``Influencer`` and ``CompactInfluencer``.
+    It doesn't define any ``__dict__``, so that the compact influencers only
+    store their fields in slots.
     """
+    __slots__ = ()
+
     def __init__(self, data, project_id):
         self.project_id = project_id
         super().__init__()
@@ -35,9 +27,9 @@ class Influencer(SourceModel):
             stats=parse_struct_stat
         )
         if 'user' in data:
-            super().add_data(data['user'], translator)
+            self.add_data(data['user'], translator)
             del data['user']
-        super().add_data(data, translator)
+        self.add_data(data, translator)
 
     def __repr__(self):
         influ_id, platform = getattr(self, 'id'), getattr(self, 'platform')
@@ -66,7 +58,30 @@ class Influencer(SourceModel):
         return Influencer(res_data, project_id)
 
     @classmethod
-    def fetch(cls, project_id, parameter, api=None):
+    async def afind(cls, project_id, influencer_id, platform, api=None):
+        """Coroutine version of ``find``.
+
+        Args:
+            project_id (int): id of the project
+            influencer_id (int): id of the influencer
+            platform (str): platform of the influencer
+            api (AsyncRadarlyApi, optional): API used to make the
+                request. If None, the default asynchronous API will be used.
+        Returns:
+            Influencer:
+        """
+        api = api or AsyncRadarlyApi.get_default_api()
+        url = api.router.influencer['find'].format(project_id=project_id)
+        params = dict(
+            uid=influencer_id,
+            platform=platform
+        )
+        res_data = await api.get(url, params=params)
+        return Influencer(res_data, project_id)
+
+    @classmethod
+    def fetch(cls, project_id, parameter, api=None, raw=False,
+              compact=False):
         """Retrieve influencers list from a project.
 
         Args:
@@ -76,16 +91,26 @@ class Influencer(SourceModel):
                 this object.
             api (RadarlyApi): API used to performed the request. If None, the
                 default API will be used.
+            raw (bool or str, optional): if True, the influencers are
+                returned as the dictionaries sent by the API, without
+                decoding. If ``'bytes'``, the body of the response is
+                returned as is. Default to False.
+            compact (bool, optional): whether or not return
+                ``CompactInfluencer`` objects. Default to False.
         Returns:
             list[Influencer]:
         """
         api = api or RadarlyApi.get_default_api()
         url = api.router.influencer['search'].format(project_id=project_id)
-        data = api.post(url, data=parameter)
-        return [cls(item, project_id) for item in data['users']]
+        data = api.post(url, data=parameter, raw=raw)
+        if raw:
+            return data if raw == 'bytes' else data['users']
+        model = CompactInfluencer if compact else cls
+        return [model(item, project_id) for item in data['users']]
 
     @classmethod
-    def fetch_all(cls, project_id, parameter, api=None):
+    def fetch_all(cls, project_id, parameter, api=None, prefetch=0,
+                  raw=False, compact=False):
         """retrieve all influencers from a project.
 
         Args:
@@ -95,11 +120,64 @@ class Influencer(SourceModel):
                 this object. This object must contain pagination's parameters.
             api (RadarlyApi): API used to performed the request. If None, the
                 default API will be used.
+            prefetch (int, optional): number of pages requested in advance
+                in a background thread. Default to 0.
+            raw (bool, optional): whether or not yield the influencers as
+                the dictionaries sent by the API, without decoding. Default
+                to False.
+            compact (bool, optional): whether or not yield
+                ``CompactInfluencer`` objects. Default to False.
         Returns:
             InfluencerGenerator:
         """
-        return InfluencersGenerator(parameter,
-                                    project_id=project_id, api=api)
+        return InfluencersGenerator(parameter, project_id=project_id,
+                                    api=api, prefetch=prefetch, raw=raw,
+                                    compact=compact)
+
+    @classmethod
+    async def afetch(cls, project_id, parameter, api=None, raw=False,
+                     compact=False):
+        """Coroutine version of ``fetch``.
+
+        Args:
+            project_id (int): id of the project
+            parameter (InfluencerParameter): parameter sent as payload
+                to the API.
+            api (AsyncRadarlyApi): API used to performed the request. If
+                None, the default asynchronous API will be used.
+            raw (bool or str, optional): see ``fetch``. Default to False.
+            compact (bool, optional): see ``fetch``. Default to False.
+        Returns:
+            list[Influencer]:
+        """
+        api = api or AsyncRadarlyApi.get_default_api()
+        url = api.router.influencer['search'].format(project_id=project_id)
+        data = await api.post(url, data=parameter, raw=raw)
+        if raw:
+            return data if raw == 'bytes' else data['users']
+        model = CompactInfluencer if compact else cls
+        return [model(item, project_id) for item in data['users']]
+
+    @classmethod
+    def afetch_all(cls, project_id, parameter, api=None, raw=False,
+                   compact=False):
+        """Asynchronous version of ``fetch_all``. The returned generator
+        must be iterated with ``async for``.
+
+        Args:
+            project_id (int): identifier of a project
+            parameter (InfluencerParameter): parameter sent as payload
+                to the API. This object must contain pagination's parameters.
+            api (AsyncRadarlyApi): API used to performed the request. If
+                None, the default asynchronous API will be used.
+            raw (bool, optional): see ``fetch_all``. Default to False.
+            compact (bool, optional): see ``fetch_all``. Default to False.
+        Returns:
+            AsyncInfluencersGenerator:
+        """
+        return AsyncInfluencersGenerator(parameter,
+                                         project_id=project_id, api=api,
+                                         raw=raw, compact=compact)
 
     def get_metrics(self, api=None):
         """Retrieve metrics data about the influencer from the API.
@@ -116,32 +194,117 @@ class Influencer(SourceModel):
         metrics = api.get(url, params=params)['metrics']
         return metrics
 
+    async def aget_metrics(self, api=None):
+        """Coroutine version of ``get_metrics``.
 
-class InfluencersGenerator(GeneratorModel):
-    """Generator which yields all influencers matching some payload.
+        Returns:
+            dict:
+        """
+        api = api or AsyncRadarlyApi.get_default_api()
+        params = dict(
+            platform=self['platform'],
+            uid=self['id']
+        )
+        url = api.router.influencer['find'].format(project_id=self.project_id)
+        metrics = (await api.get(url, params=params))['metrics']
+        return metrics
+
+
+class Influencer(_InfluencerBase):
+    """Dict-like object storing information about an influencer. The value of
+    this object are available as value associated to a key, or as attribute of
+    the instance. Here are some useful attributes:
+
+    .. warning:: The structure of the ``Influencer`` object may change
+        depending on the platform
 
     Args:
-        search_param (InfluencerParameter):
-        project_id (int):
-        api (RadarlyApi):
-    Yields:
-        Influencer:
+        id (str): identifier for the influencer
+        platform (str): origin platform of the influencer
+        screen_name (str): display name on the social_accounts
+        permalink (str): link to the social_account
+        followers_count (int): numbers of followers of the influencer
+        count (int): number of documents published by the follower in your
+            project.
+        stats (dict): statitics about the influencers publications
     """
-    def _fetch_items(self):
-        """Get next range of influencers"""
-        url = self._api.router.influencer['search'].format(project_id=self.project_id)
-        res_data = self._api.post(url, data=self.search_param)
-        self.total = 1000
-        self._items = (
-            Influencer(item, self.project_id) for item in res_data['users']
+
+
+class CompactInfluencer(CompactModel, _InfluencerBase):
+    """Version of ``Influencer`` storing its well-known fields in slots, in
+    order to use less memory. It behaves as an ``Influencer`` but isn't an
+    instance of it; see ``CompactModel``.
+    """
+    _FIELDS = (
+        'project_id', 'id', 'uid', 'platform', 'name', 'screen_name',
+        'permalink', 'description', 'gender', 'profile_img', 'geo',
+        'followers', 'followers_count', 'email', 'telephone', 'comment',
+        'social_account', 'tags', 'count', 'impressions', 'reach', 'stats',
+    )
+    __slots__ = _FIELDS
+
+
+class _InfluencersPageMixin:
+    """Methods shared by the synchronous and asynchronous generators of
+    influencers"""
+    def _url(self):
+        """URL used to search influencers"""
+        return self._api.router.influencer['search'].format(
+            project_id=self.project_id
         )
+
+    def _load_page(self, res_data):
+        """Store the influencers of a range"""
+        self.total = 1000
+        if self.raw:
+            self._items = iter(res_data['users'])
+        else:
+            model = CompactInfluencer if self.compact else Influencer
+            project_id = self.project_id
+            self._items = (
+                model(item, project_id) for item in res_data['users']
+            )
         div = self.total // self.search_param['limit']
         reste = self.total % self.search_param['limit']
         self.total_page = div
         if reste != 0: self.total_page += 1
-        self.search_param = self.search_param.next_page()
 
     def __repr__(self):
-        return '<InfluencersGenerator.total={}.total_page={}>'.format(
-            self.total, self.total_page
+        return '<{}.total={}.total_page={}>'.format(
+            self.__class__.__name__, self.total, self.total_page
         )
+
+
+class InfluencersGenerator(_InfluencersPageMixin, GeneratorModel):
+    """Generator which yields all influencers matching some payload.
+
+    Args:
+        search_param (InfluencerParameter):
+        project_id (int):
+        api (RadarlyApi):
+        prefetch (int, optional): number of pages requested in advance.
+            Default to 0.
+        raw (bool, optional): whether or not yield the influencers without
+            decoding. Default to False.
+        compact (bool, optional): whether or not yield ``CompactInfluencer``
+            objects. Default to False.
+        checkpoint (str, optional): path of the file where the cursor of the
+            generator is written. See ``GeneratorModel``.
+    Yields:
+        Influencer:
+    """
+    _parameter_class = InfluencerParameter
+
+
+class AsyncInfluencersGenerator(_InfluencersPageMixin, AsyncGeneratorModel):
+    """Asynchronous generator which yields all influencers matching some
+    payload. It must be iterated with ``async for``.
+
+    Args:
+        search_param (InfluencerParameter):
+        project_id (int):
+        api (AsyncRadarlyApi):
+    Yields:
+        Influencer:
+    """
+    pass
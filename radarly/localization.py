@@ -4,9 +4,8 @@ town. The ``localization`` modules defines all objects in order to interact
 with such results.
 """
 
-import copy
-
 from .api import RadarlyApi
+from .asyncapi import AsyncRadarlyApi
 from .utils.misc import to_snake_case
 
 
@@ -55,14 +54,42 @@ class Localization(list):
         Returns:
             Localization: list of stats by geographical point
         """
-        parameter = copy.deepcopy(parameter)
         api = api or RadarlyApi.get_default_api()
+        url, params, parameter = cls._request_args(api, project_id, parameter)
+        data = api.post(url, params=params, data=parameter)
+        return cls(data[to_snake_case('geo-digging')])
+
+    @classmethod
+    async def afetch(cls, project_id, parameter, api=None):
+        """Coroutine version of ``fetch``.
+
+        Args:
+            project_id (int): identifier of your project
+            parameter (LocalizationParameter): object sent as payload to
+                the API.
+            api (AsyncRadarlyApi, optional): API used to make the
+                request. If None, the default asynchronous API will be used.
+        Returns:
+            Localization: list of stats by geographical point
+        """
+        api = api or AsyncRadarlyApi.get_default_api()
+        url, params, parameter = cls._request_args(api, project_id, parameter)
+        data = await api.post(url, params=params, data=parameter)
+        return cls(data[to_snake_case('geo-digging')])
+
+    @staticmethod
+    def _request_args(api, project_id, parameter):
+        """Split the parameter into the URL, the query parameters and the
+        payload of the request."""
         url = api.router.localization['fetch'].format(
             project_id=project_id,
-            region_type=parameter.pop('geo_type', 'region')
+            region_type=parameter.get('geo_type', 'region')
         )
         params = [
-            ('locale', parameter.pop('locale', 'en_GB'))
+            ('locale', parameter.get('locale', 'en_GB'))
         ]
-        data = api.post(url, params=params, data=parameter)
-        return cls(data[to_snake_case('geo-digging')])
+        payload = {
+            key: value for key, value in parameter.items()
+            if key not in ['geo_type', 'locale']
+        }
+        return url, params, payload
@@ -2,20 +2,27 @@
 Model used in ``radarly-py``
 """
 
-import copy
+import collections
+import functools
+import itertools
 import json
 from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 from pytz import timezone
 
 from .api import RadarlyApi
-from .utils.jsonparser import RadarlyEncoder
+from .asyncapi import AsyncRadarlyApi
+from .utils.jsonengine import get_engine
+from .utils.jsonparser import RadarlyEncoder, encode_default
+from .utils.misc import atomic_dump
 from .utils.path import dpath, draw_structure
 
 
 class SourceModel:
     """Mixin to transform dictionary into an object where the keys of the
     dictionary are attributes of the instance"""
+    __slots__ = ()
     _TRANSLATOR = dict(
         timezone=timezone
     )
@@ -33,11 +40,11 @@ class SourceModel:
         Returns:
             None:
         """
-        translator = translator or dict()
-        data = {
-            key: translator.get(key, lambda x: x)(data[key])
-            for key in data.keys()
-        }
+        if translator:
+            data = {
+                key: translator[key](value) if key in translator else value
+                for key, value in data.items()
+            }
         self.__dict__.update(data)
         return None
 
@@ -96,47 +103,521 @@ class SourceModel:
 
     def json(self, **kwargs):
         """Serialize the object in order to have a dict object"""
-        return json.dumps(self, cls=RadarlyEncoder, **kwargs)
+        return get_engine().dumps(self, default=encode_default, **kwargs)
+
+
+class CompactModel:
+    """Mixin storing the well-known fields of a ``SourceModel`` in slots
+    instead of the ``__dict__`` of the instance, in order to reduce the
+    memory used by the objects kept in large numbers. The fields which are
+    not listed in ``_FIELDS`` are stored in an overflow dictionary. The
+    attributes, ``__getitem__`` (and so ``dpath``), ``keys`` and ``json``
+    behave as with the regular model.
+
+    The subclasses must inherit from this mixin first and define
+    ``__slots__`` as their ``_FIELDS``. The other classes of their MRO must
+    define empty ``__slots__`` (as ``SourceModel``), otherwise the instances
+    still get a ``__dict__``:
+
+    >>> class CompactPublication(CompactModel, _PublicationBase):
+    ...     _FIELDS = ('uid', 'date', 'pid')
+    ...     __slots__ = _FIELDS
+    """
+    __slots__ = ('_extra',)
+    _FIELDS = ()
+    _FIELD_SET = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._FIELD_SET = frozenset(cls._FIELDS)
+
+    def __init__(self, *args, **kwargs):
+        object.__setattr__(self, '_extra', None)
+        super().__init__(*args, **kwargs)
+
+    def __getattr__(self, name):
+        extra = self._extra if name != '_extra' else None
+        if extra is not None and name in extra:
+            return extra[name]
+        raise AttributeError("'{}' object has no attribute '{}'".format(
+            self.__class__.__name__, name
+        ))
+
+    def __setattr__(self, name, value):
+        if name in self._FIELD_SET or name == '_extra':
+            object.__setattr__(self, name, value)
+            return
+        if self._extra is None:
+            object.__setattr__(self, '_extra', {})
+        self._extra[name] = value
+
+    def __delattr__(self, name):
+        if name in self._FIELD_SET:
+            object.__delattr__(self, name)
+        elif self._extra is not None and name in self._extra:
+            del self._extra[name]
+        else:
+            raise AttributeError(name)
+
+    def add_data(self, data, translator=None):
+        """Add all (key, value) of data in the object
+
+        Args:
+            data (dict): data to transfer to the new object
+            translator (dict, optional): translator to convert some value of
+                the dict
+        Returns:
+            None:
+        """
+        translator = translator or {}
+        for key, value in data.items():
+            if key in translator:
+                value = translator[key](value)
+            setattr(self, key, value)
+        return None
+
+    def keys(self):
+        """Returns a set of available attribute."""
+        keys = set()
+        for name in self._FIELDS:
+            try:
+                object.__getattribute__(self, name)
+            except AttributeError:
+                continue
+            keys.add(name)
+        keys.update(self._extra or ())
+        return {key for key in keys if not key.startswith('_')}
 
 
 class GeneratorModel(ABC):
     """Generator which yields all items matching some payload.
 
+    By default, the ranges of items are requested one after another. If
+    ``workers`` is greater than 1, the first range is requested in order to
+    know the number of pages and the remaining ranges are then requested
+    concurrently by a pool of ``workers`` threads. At most ``2 * workers``
+    ranges are requested in advance, so that a slow consumer doesn't pile up
+    all the pages in memory. The requests still go through the API, so the
+    rate limits are respected (use a ``RadarlyApi`` with ``throttle=True`` to
+    wait instead of raising ``RateReached``).
+
+    With ``prefetch`` set to N, a background thread keeps the next N ranges
+    in flight while the current one is consumed, so that the processing of
+    the items and the network overlap. The pending requests are cancelled
+    when the generator is closed (or garbage collected).
+
+    The position of the generator can be saved in a cursor (see the
+    ``cursor`` method), written in the ``checkpoint`` file every
+    ``checkpoint_every`` pages. A cursor points to the first page whose
+    items have not all been yielded yet, so that a generator rebuilt with
+    ``resume_from`` yields again at most one page of items already
+    processed.
+
+    >>> generator = PublicationsGenerator(param, project_id=<project_id>,
+    ...                                   checkpoint='export.json')
+    >>> # after a crash
+    >>> generator = PublicationsGenerator.resume_from('export.json')
+
     Args:
         search_param (Parameter): parameter which should contains pagination
             parameters
         project_id (int, optional): identifier of the project
         api (RadarlyApi, optional): API used to perform request. If None,
             the default API will be used.
+        workers (int, optional): number of ranges requested simultaneously.
+            Default to 1.
+        ordered (bool, optional): if True, the items are yielded in the
+            order of the pages. Otherwise, the ranges are yielded as soon as
+            they are received. Only used if ``workers`` is greater than 1.
+            Default to True.
+        prefetch (int, optional): number of ranges requested in advance.
+            Default to 0 (or to ``2 * workers`` if ``workers`` is greater
+            than 1).
+        checkpoint (str, optional): path of the file where the cursor of the
+            generator is written. If None, no cursor is written. Can't be
+            used if ``ordered`` is False.
+        checkpoint_every (int, optional): number of pages between two writes
+            of the cursor. Default to 1.
+        cursor (dict, optional): cursor returned by the ``cursor`` method, to
+            restart the iteration at the position of the cursor. It is
+            easier to use the ``resume_from`` constructor.
+        raw (bool, optional): if True, the items are yielded as the
+            dictionaries sent by the API, without decoding (see
+            ``RadarlyApi.request``). Default to False.
+        compact (bool, optional): if True, the items are built with the
+            compact version of their model (see ``CompactModel``). Default
+            to False.
+        lazy (bool, optional): if True, the items are built with the lazy
+            version of their model, which decodes each field of the
+            response only when it is read. The pages are then requested
+            with ``raw`` set to True. Only supported by the generators
+            whose ``_supports_lazy`` is True. Default to False.
+        timestamps (str, optional): decoding of the dates of the items
+            (``'datetime'`` or ``'epoch'``, see ``RadarlyApi``). If None,
+            the option of the API is used.
     Yields:
         object:
     """
-    def __init__(self, search_param, project_id=None, api=None):
+    _parameter_class = None
+    _supports_lazy = False
+
+    def __init__(self, search_param, project_id=None, api=None, workers=1,
+                 ordered=True, prefetch=0, checkpoint=None,
+                 checkpoint_every=1, cursor=None, raw=False, compact=False,
+                 lazy=False, timestamps=None):
+        if checkpoint and not ordered:
+            raise ValueError(("A checkpoint can't be written if the items "
+                              "are not yielded in the order of the pages."))
+        if raw == 'bytes':
+            raise ValueError("The raw bytes of the pages can't be paginated.")
+        _check_lazy(self, raw, compact, lazy)
         self._api = api or RadarlyApi.get_default_api()
         self.project_id = project_id
         self.total = 0
         self.total_page = 0
-        self.search_param = copy.deepcopy(search_param)
+        self.search_param = search_param.freeze()
         self._items = None
         self.current_page = 1
+        self.workers = workers
+        self.ordered = ordered
+        self.prefetch = prefetch
+        self.checkpoint = checkpoint
+        self.checkpoint_every = checkpoint_every
+        self.raw = raw
+        self.compact = compact
+        self.lazy = lazy
+        self.timestamps = timestamps
+        self._raw_pages = raw or lazy
+        self._pages = None
+        self._page_params = {}
+        if cursor is not None:
+            self._restore(cursor)
+            if self.current_page > self.total_page > 0:
+                self._items = iter(())
+                return
+        self._save_checkpoint()
         self._fetch_items()
+        if (workers > 1 or prefetch > 0) and \
+                self.total_page > self.current_page:
+            self._pages = self._fetch_pages()
+
+    @classmethod
+    def resume_from(cls, checkpoint, api=None, **kwargs):
+        """Build a generator starting at the position saved in a checkpoint.
+        The checkpoint keeps being updated during the iteration.
+
+        Args:
+            checkpoint (str or dict): path of the checkpoint file, or cursor
+                returned by the ``cursor`` method.
+            api (RadarlyApi, optional): API used to perform request. If None,
+                the default API will be used.
+            **kwargs: other arguments given to the constructor (``workers``,
+                ``prefetch``...). The pagination options saved in the
+                cursor (see ``_cursor_options``) are used by default.
+        Returns:
+            GeneratorModel:
+        """
+        cursor = checkpoint
+        if not isinstance(checkpoint, dict):
+            with open(checkpoint, mode='r') as checkpoint_file:
+                cursor = json.load(checkpoint_file)
+            kwargs.setdefault('checkpoint', checkpoint)
+        options = dict(cursor.get('options') or {})
+        options.update(kwargs)
+        search_param = (cls._parameter_class or dict)()
+        search_param.update(cursor['search_param'])
+        return cls(search_param, project_id=cursor['project_id'], api=api,
+                   cursor=cursor, **options)
+
+    def cursor(self):
+        """Position of the generator, as a serializable dictionary. The
+        cursor points to the first page whose items have not all been
+        yielded.
+
+        Returns:
+            dict:
+        """
+        return dict(
+            search_param=dict(self._page_param()),
+            current_page=self.current_page,
+            total=self.total,
+            total_page=self.total_page,
+            project_id=self.project_id,
+            options=self._cursor_options(),
+            state=self._cursor_state(),
+        )
+
+    def _page_param(self):
+        """Parameter used to request the current page"""
+        return self._page_params.get(self.current_page, self.search_param)
+
+    def _cursor_options(self):
+        """Pagination options stored in the cursor, used by default by
+        ``resume_from``"""
+        return dict(workers=self.workers, ordered=self.ordered,
+                    prefetch=self.prefetch)
+
+    def _cursor_state(self):
+        """Additional data stored in the cursor, used by the subclasses"""
+        return {}
+
+    def _restore(self, cursor):
+        """Restore the position saved in a cursor"""
+        self.current_page = cursor['current_page']
+        self.total = cursor['total']
+        self.total_page = cursor['total_page']
+
+    def _save_checkpoint(self):
+        """Write the cursor in the checkpoint file, every
+        ``checkpoint_every`` pages"""
+        if not self.checkpoint:
+            return None
+        if (self.current_page - 1) % self.checkpoint_every and \
+                self.current_page <= self.total_page:
+            return None
+        atomic_dump(self.cursor(), self.checkpoint, cls=RadarlyEncoder)
+        return None
 
     def __iter__(self):
         return self
 
+    def close(self):
+        """Cancel the ranges of items requested in advance. The generator
+        can not be iterated anymore."""
+        if self._pages is not None:
+            self._pages.close()
+        self._items = iter(())
+        self.total_page = self.current_page
+
     @abstractmethod
+    def _url(self):
+        """URL requested to get a range of items"""
+        raise NotImplementedError(("In order to use this mixin, you must "
+                                   "implement the _url method"))
+
+    @abstractmethod
+    def _load_page(self, res_data):
+        """Store the items of a range and update the total of items"""
+        raise NotImplementedError(("In order to use this mixin, you must "
+                                   "implement the _load_page method"))
+
     def _fetch_items(self):
         """Get next range of items"""
-        raise NotImplementedError(("In order to use this mixin, you must "
-                                   "implement the _fetch_items method"))
+        if self._pages is not None:
+            self._load_page(next(self._pages))
+            return
+        res_data = self._api.post(self._url(), data=self.search_param,
+                                  raw=self._raw_pages,
+                                  timestamps=self.timestamps)
+        self._load_page(res_data)
+        self._page_params[self.current_page] = self.search_param
+        self.search_param = self.search_param.next_page()
+
+    def _fetch_pages(self):
+        """Build the parameters of the remaining ranges of items and return
+        an iterator requesting them with a pool of threads. The first
+        ranges are requested right away, while the current range is
+        consumed."""
+        params = []
+        for page in range(self.current_page + 1, self.total_page + 1):
+            params.append(self.search_param)
+            self._page_params[page] = self.search_param
+            self.search_param = self.search_param.next_page()
+        request = functools.partial(self._api.post, self._url(),
+                                    raw=self._raw_pages,
+                                    timestamps=self.timestamps)
+        return _PageFetcher(request, params, workers=self.workers,
+                            window=self.prefetch or 2 * self.workers,
+                            ordered=self.ordered)
+
+    def _next_page(self):
+        """Move to the next range of items. Return False if there is no
+        more range."""
+        self._page_params.pop(self.current_page, None)
+        self.current_page += 1
+        self._save_checkpoint()
+        if self.current_page > self.total_page:
+            return False
+        self._fetch_items()
+        return True
+
+    def __next__(self):
+        while True:
+            try:
+                return next(self._items)
+            except StopIteration:
+                pass
+            # a range may be empty before the last one, move to the next
+            if not self._next_page():
+                raise StopIteration
+
+
+class _PageFetcher:
+    """Iterator requesting some ranges of items with a pool of threads. The
+    first ``window`` ranges are requested as soon as the object is built
+    and a new range is requested each time a response is returned, so that
+    ``window`` ranges are always in flight. The responses are returned in
+    the order of ``params`` if ``ordered`` is True, as soon as they are
+    received otherwise.
+
+    The fetcher doesn't hold any reference to the generator using it: a
+    generator dropped during the iteration is collected right away and the
+    requests which are not sent yet are cancelled (see ``close``).
+
+    Args:
+        request (callable): function called with ``data=param`` to request
+            a range of items
+        params (list[Parameter]): parameters of the ranges to request
+        workers (int, optional): number of threads. Default to 1.
+        window (int, optional): number of ranges requested in advance.
+            Default to 1.
+        ordered (bool, optional): whether or not return the responses in
+            the order of ``params``. Default to True.
+    """
+    def __init__(self, request, params, workers=1, window=1, ordered=True):
+        self._request = request
+        self._params = iter(params)
+        self._ordered = ordered
+        self._pending = collections.deque()
+        self._done = collections.deque()
+        self._executor = ThreadPoolExecutor(max_workers=max(workers, 1))
+        self._submit(max(window, 1))
+
+    def _submit(self, count):
+        """Request the next ``count`` ranges"""
+        for param in itertools.islice(self._params, count):
+            self._pending.append(
+                self._executor.submit(self._request, data=param)
+            )
+
+    def __iter__(self):
+        return self
 
     def __next__(self):
+        if not self._done:
+            if not self._pending:
+                self.close()
+                raise StopIteration
+            if self._ordered:
+                done = [self._pending.popleft()]
+            else:
+                done = wait(self._pending, return_when=FIRST_COMPLETED)[0]
+                for future in done:
+                    self._pending.remove(future)
+            self._submit(len(done))
+            self._done.extend(done)
         try:
-            returned_value = next(self._items)
+            return self._done.popleft().result()
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        """Cancel the requests which are not sent yet and release the
+        threads. The fetcher can not be iterated anymore."""
+        self._params = iter(())
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._done.clear()
+        self._executor.shutdown(wait=False)
+
+    def __del__(self):
+        if getattr(self, '_executor', None) is not None:
+            self.close()
+
+
+class AsyncGeneratorModel(ABC):
+    """Asynchronous generator which yields all items matching some payload.
+    It must be iterated with ``async for``. The first range of items is
+    requested during the first iteration.
+
+    Args:
+        search_param (Parameter): parameter which should contains pagination
+            parameters
+        project_id (int, optional): identifier of the project
+        api (AsyncRadarlyApi, optional): API used to perform request. If None,
+            the default asynchronous API will be used.
+        raw (bool, optional): whether or not yield the items without
+            decoding. Default to False.
+        compact (bool, optional): whether or not build the items with the
+            compact version of their model. Default to False.
+        lazy (bool, optional): whether or not build the items with the lazy
+            version of their model. Default to False.
+        timestamps (str, optional): decoding of the dates of the items. If
+            None, the option of the API is used.
+    Yields:
+        object:
+    """
+    _supports_lazy = False
+
+    def __init__(self, search_param, project_id=None, api=None, raw=False,
+                 compact=False, lazy=False, timestamps=None):
+        if raw == 'bytes':
+            raise ValueError("The raw bytes of the pages can't be paginated.")
+        _check_lazy(self, raw, compact, lazy)
+        self._api = api or AsyncRadarlyApi.get_default_api()
+        self.project_id = project_id
+        self.raw = raw
+        self.compact = compact
+        self.lazy = lazy
+        self.timestamps = timestamps
+        self._raw_pages = raw or lazy
+        self.total = 0
+        self.total_page = 0
+        self.search_param = search_param.freeze()
+        self._items = None
+        self.current_page = 1
+
+    def __aiter__(self):
+        return self
+
+    @abstractmethod
+    def _url(self):
+        """URL requested to get a range of items"""
+        raise NotImplementedError(("In order to use this mixin, you must "
+                                   "implement the _url method"))
+
+    @abstractmethod
+    def _load_page(self, res_data):
+        """Store the items of a range and update the total of items"""
+        raise NotImplementedError(("In order to use this mixin, you must "
+                                   "implement the _load_page method"))
+
+    async def _fetch_items(self):
+        """Get next range of items"""
+        res_data = await self._api.post(self._url(), data=self.search_param,
+                                        raw=self._raw_pages,
+                                        timestamps=self.timestamps)
+        self._load_page(res_data)
+        self.search_param = self.search_param.next_page()
+
+    async def __anext__(self):
+        if self._items is None:
+            await self._fetch_items()
+        try:
+            return next(self._items)
         except StopIteration:
-            self.current_page += 1
-            if self.current_page > self.total_page:
-                raise StopIteration
-            self._fetch_items()
-            returned_value = next(self._items)
-        return returned_value
+            pass
+        self.current_page += 1
+        if self.current_page > self.total_page:
+            raise StopAsyncIteration
+        await self._fetch_items()
+        try:
+            return next(self._items)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def _check_lazy(generator, raw, compact, lazy):
+    """Check that the lazy mode is supported by a generator and isn't
+    combined with an incompatible mode"""
+    if not lazy:
+        return None
+    if not generator._supports_lazy: # pylint: disable=W0212
+        raise ValueError("{} doesn't support the lazy mode.".format(
+            generator.__class__.__name__
+        ))
+    if raw or compact:
+        raise ValueError("The lazy mode can't be used with raw or compact.")
+    return None
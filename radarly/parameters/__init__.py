@@ -2,13 +2,20 @@
 Parameters object sent as payload data.
 """
 
+import copy
+import hashlib
 import json
+from datetime import datetime
 from urllib.parse import urlencode
 
+import pytz
+from dateutil.parser import parse
+
 from .field import (ClusterMixin, FctxMixin, FieldsMixin, GeoFilterMixin,
-                    GeoTypeMixin, IntervalMixin, LocaleMixin, MetricsMixin,
-                    PaginationMixin, RangeDateMixin, SortMixin,
-                    StandardParameterMixin, TimezoneMixin)
+                    GeoTypeMixin, IntervalMixin, KeysetPaginationMixin,
+                    LocaleMixin, MetricsMixin, PaginationMixin,
+                    RangeDateMixin, SortMixin, StandardParameterMixin,
+                    TimezoneMixin)
 
 __all__ = (
     'AnalyticsParameter',
@@ -33,8 +40,217 @@ class Parameter(dict):
     be sent to the API. When the methods of Parameter object is used to build
     the object, some checks are computed on the values in order to assert that
     the payload data is correctly built.
+
+    A parameter can be frozen (see ``freeze``): a frozen parameter can't be
+    modified anymore, it is hashable and the parameters derived from it
+    (with ``replace``, ``next_page`` or ``seek``) share its values instead of
+    copying them. The generators and the caches of ``radarly-py`` identify a
+    parameter with its ``digest``, computed from its canonical form.
+
+    >>> param = SearchPublicationParameter().pagination(0, 25).freeze()
+    >>> param.next_page()['start']
+    25
     """
-    pass
+    UNORDERED_FIELDS = frozenset([
+        'categories', 'corpora', 'customFields', 'emotions', 'fields',
+        'focuses', 'genders', 'hashtags', 'keywords', 'languages', 'list',
+        'media', 'mentions', 'namedEntities', 'platforms', 'stories', 'tones',
+        'userTags',
+    ])
+    DATE_FIELDS = frozenset([
+        'birthDate', 'createdAfter', 'createdBefore', 'from', 'to',
+    ])
+    _frozen = False
+
+    def __copy__(self):
+        param = self.__class__.__new__(self.__class__)
+        dict.update(param, self)
+        param.__dict__.update(self.__dict__)
+        return param
+
+    def __deepcopy__(self, memo):
+        param = self.__class__.__new__(self.__class__)
+        memo[id(self)] = param
+        dict.update(param, copy.deepcopy(dict(self), memo))
+        param.__dict__.update(copy.deepcopy(self.__dict__, memo))
+        return param
+
+    def __hash__(self):
+        if not self._frozen:
+            raise TypeError(("A parameter must be frozen to be hashable. Use "
+                             "the 'freeze' method."))
+        return hash(self.digest())
+
+    def __setitem__(self, key, value):
+        self._check_mutable()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._check_mutable()
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        self._check_mutable()
+        return super().__ior__(other)
+
+    def clear(self):
+        self._check_mutable()
+        super().clear()
+
+    def pop(self, *args):
+        self._check_mutable()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._check_mutable()
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        self._check_mutable()
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        self._check_mutable()
+        super().update(*args, **kwargs)
+
+    @property
+    def frozen(self):
+        """Whether or not the parameter is frozen"""
+        return self._frozen
+
+    def freeze(self):
+        """Get a frozen version of the parameter. A frozen parameter is
+        returned as is; otherwise the parameter is copied (deeply, so that
+        modifying the original parameter doesn't modify the frozen one).
+
+        Returns:
+            Parameter:
+        """
+        if self._frozen:
+            return self
+        param = copy.deepcopy(self)
+        param._frozen = True # pylint: disable=W0212
+        return param
+
+    def thaw(self):
+        """Get a modifiable copy of the parameter, which shares nothing with
+        the parameter.
+
+        Returns:
+            Parameter:
+        """
+        param = copy.deepcopy(self)
+        param._frozen = False # pylint: disable=W0212
+        param.__dict__.pop('_digest', None)
+        return param
+
+    def replace(self, *args, **kwargs):
+        """Get a copy of the parameter where some fields are replaced (the
+        arguments are the same as those of ``dict.update``). The copy is
+        frozen if the parameter is frozen and it shares the other values
+        with the parameter, so the values of a parameter which is not
+        frozen must not be modified in place after a call to ``replace``.
+
+        >>> param.replace({'from': start}, start=0)
+
+        Returns:
+            Parameter:
+        """
+        param = copy.copy(self)
+        dict.update(param, *args, **kwargs)
+        param.__dict__.pop('_digest', None)
+        return param
+
+    def derive(self, *args, **kwargs):
+        """Update some fields of the parameter (the arguments are the same
+        as those of ``dict.update``) and return it. A frozen parameter isn't
+        modified: an updated copy is returned instead (see ``replace``). It
+        is used by the methods moving to another page, as ``next_page``.
+
+        Returns:
+            Parameter:
+        """
+        if self._frozen:
+            return self.replace(*args, **kwargs)
+        self.update(*args, **kwargs)
+        return self
+
+    def canonical(self, exclude=()):
+        """Canonical form of the parameter: the fields which are lists of
+        values whose order doesn't matter (``UNORDERED_FIELDS``) are sorted,
+        the dates (``DATE_FIELDS``) are written in ISO 8601 (in UTC if they
+        have a timezone) and the keys of the objects are sorted. Two
+        parameters selecting the same data have the same canonical form.
+
+        Args:
+            exclude (iterable[str], optional): fields left out of the
+                canonical form (as the pagination fields)
+        Returns:
+            dict:
+        """
+        return _canonical(
+            {key: value for key, value in self.items() if key not in exclude}
+        )
+
+    def digest(self, exclude=()):
+        """Stable identifier of the parameter: the SHA-1 digest of its
+        canonical form. The digest of a frozen parameter is only computed
+        once.
+
+        Args:
+            exclude (iterable[str], optional): fields left out of the
+                digest (see ``canonical``)
+        Returns:
+            str:
+        """
+        if self._frozen and not exclude and '_digest' in self.__dict__:
+            return self.__dict__['_digest']
+        digest = hashlib.sha1(json.dumps(
+            self.canonical(exclude), sort_keys=True, separators=(',', ':'),
+            default=str,
+        ).encode('utf-8')).hexdigest()
+        if self._frozen and not exclude:
+            self.__dict__['_digest'] = digest
+        return digest
+
+    def _check_mutable(self):
+        """Raise a TypeError if the parameter is frozen"""
+        if self._frozen:
+            raise TypeError(("A frozen parameter can't be modified. Use the "
+                             "'replace' or 'thaw' methods to get a modified "
+                             "copy."))
+
+
+def _canonical(value, field=None, date=False):
+    """Canonical form of a value of a parameter (see
+    ``Parameter.canonical``)"""
+    if isinstance(value, dict):
+        return {
+            key: _canonical(item, key,
+                            date=date or field in Parameter.DATE_FIELDS)
+            for key, item in sorted(value.items())
+        }
+    if isinstance(value, (list, tuple)):
+        items = [_canonical(item) for item in value]
+        if field in Parameter.UNORDERED_FIELDS:
+            items.sort(key=lambda item: json.dumps(item, sort_keys=True,
+                                                   default=str))
+        return items
+    if isinstance(value, datetime):
+        return _canonical_date(value)
+    if isinstance(value, str) and (date or field in Parameter.DATE_FIELDS):
+        try:
+            return _canonical_date(parse(value))
+        except (ValueError, OverflowError):
+            return value
+    return value
+
+
+def _canonical_date(value):
+    """ISO 8601 form of a date, in UTC if the date has a timezone"""
+    if value.tzinfo is not None:
+        value = value.astimezone(pytz.utc)
+    return value.isoformat()
 
 
 class AnalyticsParameter(Parameter,
@@ -291,6 +507,7 @@ class SearchPublicationParameter(Parameter,
                                  StandardParameterMixin,
                                  SortMixin,
                                  PaginationMixin,
+                                 KeysetPaginationMixin,
                                  FctxMixin,
                                  ClusterMixin,
                                  GeoFilterMixin):
@@ -3,6 +3,8 @@ payload to the API. For most fields, the value is checked in
 order to be sure that the parameter is built properly. This way, bad
 requests can be avoided."""
 
+from datetime import datetime
+
 import pytz
 
 from ..constants import (CATEGORY, GENDER, GEOTYPE, INTERVAL, MEDIA, METRIC,
@@ -286,6 +288,39 @@ class IntervalMixin:
         return self
 
 
+class KeysetPaginationMixin:
+    """Field used to paginate the publications by publication date instead of
+    offset. The publications are sorted from the most recent to the oldest
+    one and each page ends where the previous one stopped: the ``to`` bound
+    of the publication date is moved to the date of the last publication
+    received. The publications published at this exact date are sent again
+    and must be filtered by the caller; ``start`` is only used to skip them
+    when they fill a whole page.
+    """
+    def keyset(self):
+        """Sort the publications by date (from the most recent to the
+        oldest) and start the pagination at the first publication."""
+        self.update(sortBy='date', sortOrder=ORDER.DESCENDANT, start=0)
+        self.setdefault('limit', 25)
+        return self
+
+    def seek(self, last_date, skip=0):
+        """Move to the page following a publication. A frozen parameter
+        isn't modified: the parameter of this page is returned instead (see
+        ``Parameter.derive``).
+
+        Args:
+            last_date (datetime.datetime or str): date of the last
+                publication received. A naive datetime is considered as
+                an UTC date.
+            skip (int, optional): number of publications published at
+                ``last_date`` to skip. Default to 0.
+        """
+        if isinstance(last_date, datetime) and last_date.tzinfo is None:
+            last_date = last_date.replace(tzinfo=pytz.utc)
+        return self.derive({'to': check_date(last_date)}, start=skip)
+
+
 class KeywordMixin:
     """Field used to build all keywords related parameter in the payload data"""
     def _builder_kw(self, name, *args):
@@ -381,10 +416,12 @@ class PaginationMixin:
         return self
 
     def next_page(self):
+        """Move to the next page. A frozen parameter isn't modified: the
+        parameter of the next page is returned instead (see
+        ``Parameter.derive``)."""
         limit = self.get('limit', 25)
         start = self.get('start', -limit) + limit
-        self.update(start=start, limit=limit)
-        return self
+        return self.derive(start=start, limit=limit)
 
 
 class PlatformMixin:
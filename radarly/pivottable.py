@@ -4,6 +4,7 @@ cross data analysis.
 """
 
 from .api import RadarlyApi
+from .asyncapi import AsyncRadarlyApi
 from .utils._internal import CallableDict, id_to_value
 from .utils.misc import to_snake_case
 
@@ -80,3 +81,34 @@ class PivotTable(dict):
             fields = id_to_value(getattr(project, 'tags'), 'tags')
 
         return cls(data, focuses, fields)
+
+    @classmethod
+    async def afetch(cls, project_id, parameter,
+                     autotranslate=False, focuses=None, fields=None,
+                     api=None):
+        """Coroutine version of ``fetch``.
+
+        Args:
+            project_id (int): identifier of the project
+            parameter (PivotParameter): parameter used to restrict data
+                used to build the pivot table.
+            autotranslate (bool): whether or not translate the headers and the
+                index in order to have labels and not integer ids.
+            focuses (dict, optional): dictionary used to translate the headers
+            fields (dict, optional): dictionary used to translate the index
+            api (AsyncRadarlyApi, optional): API used to make the
+                request. If None, the default asynchronous API will be used.
+        Returns:
+            PivotTable:
+        """
+        api = api or AsyncRadarlyApi.get_default_api()
+        url = api.router.pivot_table['fetch'].format(project_id=project_id)
+        data = await api.post(url, data=parameter)
+
+        if autotranslate and not focuses and not fields:
+            from .project import Project
+            project = await Project.afind(pid=project_id, api=api)
+            focuses = id_to_value(getattr(project, 'focuses'), 'focuses')
+            fields = id_to_value(getattr(project, 'tags'), 'tags')
+
+        return cls(data, focuses, fields)
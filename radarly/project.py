@@ -11,6 +11,7 @@ influencers or get some statitics about publications inside your project.
 
 from .analytics import Analytics
 from .api import RadarlyApi
+from .asyncapi import AsyncRadarlyApi
 from .benchmark import Benchmark
 from .cloud import Cloud
 from .cluster import Cluster
@@ -108,6 +109,23 @@ class Project(SourceModel):
         project = api.get(api.router.project['find'].format(project_id=pid))
         return cls(project, api=api)
 
+    @classmethod
+    async def afind(cls, pid, api=None):
+        """Coroutine version of ``find``.
+
+        Args:
+            pid (int): project id of the project
+            api (AsyncRadarlyApi, optional): api which must be used to
+                perform the request. If ``None``, the default asynchronous
+                API will be used.
+        Returns:
+            Project:
+        """
+        api = api or AsyncRadarlyApi.get_default_api()
+        url = api.router.project['find'].format(project_id=pid)
+        project = await api.get(url)
+        return cls(project, api=api)
+
     def get_distribution(self, parameter, api=None):
         """
         Get distribution of volume, reach, engagement actions
@@ -148,7 +166,10 @@ class Project(SourceModel):
             getattr(self, 'id'), parameter, api
         )
 
-    def get_all_publications(self, parameter, api=None):
+    def get_all_publications(self, parameter, api=None, workers=1,
+                             ordered=None, prefetch=0, shards=0,
+                             keyset=False, stream=False, raw=False,
+                             compact=False, lazy=False, timestamps=None):
         """Get all publications matching given parameters. It returns a
         generator which yields publications.
 
@@ -160,12 +181,37 @@ class Project(SourceModel):
                 build this object.
             api (RadarlyApi, optional): api which must be used to perform the
                 request. If ``None``, the default API will be used.
+            workers (int, optional): number of pages requested
+                simultaneously. Default to 1.
+            ordered (bool, optional): whether or not yield the publications
+                in the order of the pages. Default to True, or False with
+                ``shards``.
+            prefetch (int, optional): number of pages requested in advance
+                in a background thread. Default to 0.
+            shards (int, optional): number of shards of publication dates
+                exported independently. Default to 0 (no sharding).
+            keyset (bool, optional): whether or not paginate by publication
+                date instead of offset. Default to False.
+            stream (bool, optional): whether or not decode each page
+                incrementally. Default to False.
+            raw (bool, optional): whether or not yield the publications
+                without decoding. Default to False.
+            compact (bool, optional): whether or not yield
+                ``CompactPublication`` objects. Default to False.
+            lazy (bool, optional): whether or not yield
+                ``LazyPublication`` objects. Default to False.
+            timestamps (str, optional): ``'epoch'`` to get the dates as
+                numbers of milliseconds since the epoch. If None, the
+                option of the API is used.
         Returns:
             PublicationGenerator: generator of publications. On each iterations, a
             Publication is yielded until there is no more publication.
         """
         return Publication.fetch_all(
-            getattr(self, 'id'), parameter, api
+            getattr(self, 'id'), parameter, api,
+            workers=workers, ordered=ordered, prefetch=prefetch,
+            shards=shards, keyset=keyset, stream=stream, raw=raw,
+            compact=compact, lazy=lazy, timestamps=timestamps
         )
 
     def get_influencers(self, parameter, api=None):
@@ -184,7 +230,8 @@ class Project(SourceModel):
             getattr(self, 'id'), parameter, api
         )
 
-    def get_all_influencers(self, parameter, api=None):
+    def get_all_influencers(self, parameter, api=None, prefetch=0,
+                            raw=False, compact=False):
         """Get all influencers in a project matching some parameters.
 
         Args:
@@ -193,11 +240,18 @@ class Project(SourceModel):
                 pagination's parameter.
             api (RadarlyApi, optional): api which must be used to perform the
                 request. If ``None``, the default API will be used.
+            prefetch (int, optional): number of pages requested in advance
+                in a background thread. Default to 0.
+            raw (bool, optional): whether or not yield the influencers
+                without decoding. Default to False.
+            compact (bool, optional): whether or not yield
+                ``CompactInfluencer`` objects. Default to False.
         Returns:
             InflencersGenerator: generator which yields influencer
         """
         return Influencer.fetch_all(
-            getattr(self, 'id'), parameter, api=api
+            getattr(self, 'id'), parameter, api=api, prefetch=prefetch,
+            raw=raw, compact=compact
         )
 
     def get_analytics(self, parameter, api=None):
@@ -314,12 +368,22 @@ class Project(SourceModel):
             TopicWheel, Entities:
         """
         api = api or RadarlyApi.get_default_api()
+        url, param = self._topic_request_args(api, parameter)
+        res_data = api.post(url, data=param)
+        return self._parse_topics(res_data)
+
+    def _topic_request_args(self, api, parameter):
+        """Build the URL and the payload used to get the topic wheel"""
         param = parameter.copy()
         url = api.router.topicwheel['fetch'].format(
             project_id=getattr(self, 'id')
         )
         url = url + '?locale={}'.format(param.pop('locale'))
-        res_data = api.post(url, data=param)
+        return url, param
+
+    @staticmethod
+    def _parse_topics(res_data):
+        """Split the topic wheel's data into categories and entities"""
         categories = []
         entities = []
 
@@ -369,6 +433,93 @@ class Project(SourceModel):
         return Cluster.fetch(getattr(self, 'id'), parameter,
                              api=api)
 
+    async def aget_distribution(self, parameter, api=None):
+        """Coroutine version of ``get_distribution``."""
+        return await Distribution.afetch(
+            getattr(self, 'id'), parameter, api=api
+        )
+
+    async def aget_publications(self, parameter, api=None):
+        """Coroutine version of ``get_publications``."""
+        return await Publication.afetch(
+            getattr(self, 'id'), parameter, api
+        )
+
+    def aget_all_publications(self, parameter, api=None, raw=False,
+                              compact=False, lazy=False, timestamps=None,
+                              stream=False):
+        """Asynchronous version of ``get_all_publications``. The
+        returned generator must be iterated with ``async for``. The
+        responses can't be streamed: a ValueError is raised if ``stream``
+        is True."""
+        return Publication.afetch_all(
+            getattr(self, 'id'), parameter, api, raw=raw, compact=compact,
+            lazy=lazy, timestamps=timestamps, stream=stream
+        )
+
+    async def aget_influencers(self, parameter, api=None):
+        """Coroutine version of ``get_influencers``."""
+        return await Influencer.afetch(
+            getattr(self, 'id'), parameter, api
+        )
+
+    def aget_all_influencers(self, parameter, api=None):
+        """Asynchronous version of ``get_all_influencers``. The
+        returned generator must be iterated with ``async for``."""
+        return Influencer.afetch_all(
+            getattr(self, 'id'), parameter, api=api
+        )
+
+    async def aget_analytics(self, parameter, api=None):
+        """Coroutine version of ``get_analytics``."""
+        focuses = id_to_value(getattr(self, 'focuses'), 'focuses')
+        return await Analytics.afetch(getattr(self, 'id'), parameter,
+                                      focuses=focuses, api=api)
+
+    async def aget_localizations(self, parameter, api=None):
+        """Coroutine version of ``get_localizations``."""
+        return await Localization.afetch(getattr(self, 'id'), parameter,
+                                         api=api)
+
+    async def aget_cloud(self, parameter, api=None):
+        """Coroutine version of ``get_cloud``."""
+        return await Cloud.afetch(getattr(self, 'id'), parameter, api)
+
+    async def aget_pivot_table(self, parameter, api=None):
+        """Coroutine version of ``get_pivot_table``."""
+        focuses = id_to_value(getattr(self, 'focuses'), 'focuses')
+        fields = id_to_value(getattr(self, 'tags'), 'tags')
+        return await PivotTable.afetch(getattr(self, 'id'), parameter,
+                                       focuses=focuses, fields=fields,
+                                       api=api)
+
+    async def aget_social_performance(self, parameter, api=None):
+        """Coroutine version of ``get_social_performance``."""
+        return await SocialPerformance.afetch(getattr(self, 'id'), parameter,
+                                              api=api)
+
+    async def aget_benchmark(self, parameter, api=None):
+        """Coroutine version of ``get_benchmark``."""
+        return await Benchmark.afetch(getattr(self, 'id'), parameter,
+                                      api=api)
+
+    async def aget_topic_and_entity(self, parameter, api=None):
+        """Coroutine version of ``get_topic_and_entity``."""
+        api = api or AsyncRadarlyApi.get_default_api()
+        url, param = self._topic_request_args(api, parameter)
+        res_data = await api.post(url, data=param)
+        return self._parse_topics(res_data)
+
+    async def aget_geogrid(self, parameter, api=None):
+        """Coroutine version of ``get_geogrid``."""
+        return await GeoGrid.afetch(getattr(self, 'id'), parameter,
+                                    api=api)
+
+    async def aget_clusters(self, parameter, api=None):
+        """Coroutine version of ``get_clusters``."""
+        return await Cluster.afetch(getattr(self, 'id'), parameter,
+                                    api=api)
+
 
 class InfoProject(SourceModel):
     """Object storing information about a project (but not all available
@@ -399,3 +550,12 @@ class InfoProject(SourceModel):
         """
         api = api or RadarlyApi.get_default_api()
         return Project.find(pid=getattr(self, 'id'), api=api)
+
+    async def aexpand(self, api=None):
+        """Coroutine version of ``expand``.
+
+        Returns:
+            Project:
+        """
+        api = api or AsyncRadarlyApi.get_default_api()
+        return await Project.afind(pid=getattr(self, 'id'), api=api)
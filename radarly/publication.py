@@ -4,45 +4,45 @@ your projects.
 """
 
 
+import functools
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from os import getcwd
 from os.path import abspath
 from reprlib import repr as trunc_repr
 
 import requests
+from dateutil.parser import parse
 
 from .api import RadarlyApi
-from .constants import PLATFORM, TONE
+from .asyncapi import STREAM_ERROR, AsyncRadarlyApi
+from .batch import PublicationBatch
+from .constants import INTERVAL, METRIC, PLATFORM, TONE
+from .distribution import Distribution
 from .exceptions import PublicationUpdateFailed
 from .metadata import Metadata
-from .model import GeneratorModel, SourceModel
+from .model import (AsyncGeneratorModel, CompactModel, GeneratorModel,
+                    SourceModel)
+from .parameters import DistributionParameter, SearchPublicationParameter
+from .utils.jsonparser import (RadarlyDecoder, _BLACKLIST_PATH, from_epoch,
+                               parse_date, snake_key)
 from .utils.misc import parse_image_url
-from .utils.jsonparser import snake_dict
-from .utils.checker import check_geocode, check_language, check_list
+from .utils.checker import (check_date, check_geocode, check_language,
+                            check_list)
 
 
-class Publication(SourceModel):
-    """Object base on ``SourceModel`` storing information about the
-    publication. The structure of the model can be drawn with the
-    ``draw_structure`` method.
-
-    Args:
-        uid (str): unique identifier of the publication
-        origin (dict): dictionary which contains information about the
-            platform where the publication comes from.
-        permalink (str): link to the publication
-        lang (str): lang of the publication
-        date (datetime.datetime): creation date of the publication
-        impression (int): number of impressions on the publication
-        reach (int): estimated number of people reached by the publication
-        tone (str): tone of the publication
-        category (str): category of the publications
-        user (dict): information about the author of the publication
+class _PublicationBase(SourceModel):
+    """Fields and methods shared by ``Publication`` and
+    ``CompactPublication``. It doesn't define any ``__dict__``, so that the
+    compact publications only store their fields in slots.
     """
+    __slots__ = ()
+
     def __init__(self, data, project_id):
         super().__init__()
         self.pid = project_id
-        data = snake_dict(data, blacklist=[['radar', 'tag']])
-        super().add_data(data)
+        self.add_data(data)
 
     def __repr__(self):
         try:
@@ -52,9 +52,12 @@ class Publication(SourceModel):
         return '<Publication.uid={}>'.format(publication_uid)
 
     @classmethod
-    def fetch(cls, project_id, parameter, api=None):
+    def fetch(cls, project_id, parameter, api=None, stream=False, raw=False,
+              compact=False, lazy=False, timestamps=None):
         """
-        Get publications stored inside a project.
+        Get publications stored inside a project. With ``stream`` set to True,
+        the response is read incrementally and each publication is yielded as
+        soon as it is received (see ``RadarlyApi.stream``).
 
         Args:
             project_id (int): identifier of a project
@@ -65,20 +68,62 @@ class Publication(SourceModel):
                 object.
             api (RadarlyApi, optional): API object used to perform request. If
                 None, it will use the default API.
+            stream (bool, optional): whether or not decode the publications
+                incrementally. Default to False.
+            raw (bool or str, optional): if True, the publications are
+                returned as the dictionaries sent by the API, without
+                decoding. If ``'bytes'``, the body of the response is
+                returned as is. See ``RadarlyApi.request``. Default to False.
+            compact (bool, optional): whether or not return
+                ``CompactPublication`` objects. Default to False.
+            lazy (bool, optional): whether or not return
+                ``LazyPublication`` objects, which decode each field only
+                when it is read. Default to False.
+            timestamps (str, optional): ``'epoch'`` to get the dates as
+                numbers of milliseconds since the epoch instead of
+                ``datetime`` objects (see ``RadarlyApi``). If None, the
+                option of the API is used.
         Returns:
-            list[Publication]:
+            list[Publication]: a generator of publications if ``stream`` is
+            True.
         """
         api = api or RadarlyApi.get_default_api()
         url = api.router.publication['search'].format(project_id=project_id)
-        data = api.post(url, data=parameter)
+        model = _publication_model(api, url, raw, compact, lazy, timestamps)
+        if stream:
+            data = api.stream('POST', url, data=parameter, raw=raw or lazy,
+                              timestamps=timestamps)
+            if raw:
+                return iter(data['hits'])
+            return (model(item, project_id) for item in data['hits'])
+        data = api.post(url, data=parameter, raw=raw or lazy,
+                        timestamps=timestamps)
+        if raw:
+            return data if raw == 'bytes' else data['hits']
         return [
-            Publication(item, project_id) for item in data['hits']
+            model(item, project_id) for item in data['hits']
         ]
 
     @classmethod
-    def fetch_all(cls, project_id, parameter, api=None):
+    def fetch_all(cls, project_id, parameter, api=None, workers=1,
+                  ordered=None, prefetch=0, shards=0, keyset=False,
+                  stream=False, raw=False, compact=False, lazy=False,
+                  timestamps=None):
         """Get all publications matching given parameters. It yields
-        publications.
+        publications. With ``workers`` greater than 1, the pages are
+        requested concurrently once the number of pages is known.
+
+        >>> for publication in Publication.fetch_all(<project_id>, param,
+        ...                                          workers=8):
+        ...     print(publication)
+
+        For very large searches, ``shards`` cuts the publication date range
+        of the parameter into shards holding roughly the same number of
+        publications (see ``ShardedPublicationsGenerator``). Each shard is
+        paginated independently, by ``workers`` threads, so that no request
+        goes deep into the pagination. The ``prefetch``, ``keyset`` and
+        ``stream`` options apply to the pagination of each shard, and the
+        publications of the shards are not yielded in order.
 
         Args:
             project_id (int): identifier of your project
@@ -89,13 +134,128 @@ class Publication(SourceModel):
                 object.
             api (RadarlyApi, optional): API object used to perform request. If
                 None, it will use the default API.
+            workers (int, optional): number of pages requested
+                simultaneously. Default to 1.
+            ordered (bool, optional): if False, the publications of a page
+                are yielded as soon as the page is received instead of
+                following the order of the pages. Default to True, or False
+                with ``shards``.
+            prefetch (int, optional): number of pages requested in advance
+                in a background thread. Default to 0.
+            shards (int, optional): number of shards of publication dates
+                exported independently. Default to 0 (no sharding).
+            keyset (bool, optional): whether or not paginate by publication
+                date instead of offset (see ``PublicationsGenerator``).
+                Default to False.
+            stream (bool, optional): whether or not decode each page
+                incrementally (see ``PublicationsGenerator``). Default to
+                False.
+            raw (bool, optional): whether or not yield the publications as
+                the dictionaries sent by the API, without decoding. Default
+                to False.
+            compact (bool, optional): whether or not yield
+                ``CompactPublication`` objects, which use less memory.
+                Default to False.
+            lazy (bool, optional): whether or not yield ``LazyPublication``
+                objects, which decode each field only when it is read.
+                Default to False.
+            timestamps (str, optional): ``'epoch'`` to get the dates as
+                numbers of milliseconds since the epoch (see ``fetch``).
+                Default to None.
+        Raises:
+            ValueError: raised if the options can't be combined, for
+                instance ``ordered`` with ``shards``
         Returns:
             PublicationsGenerator: list of publications. On each iterations, a
             Publication is yielded until there is no more publication.
         """
         api = api or RadarlyApi.get_default_api()
+        if shards > 1:
+            if ordered:
+                raise ValueError(("The publications of the shards can't be "
+                                  "yielded in order."))
+            return ShardedPublicationsGenerator(parameter,
+                                                project_id=project_id,
+                                                api=api, shards=shards,
+                                                workers=workers if workers > 1
+                                                else None, prefetch=prefetch,
+                                                keyset=keyset, stream=stream,
+                                                raw=raw, compact=compact,
+                                                lazy=lazy,
+                                                timestamps=timestamps)
         return PublicationsGenerator(parameter,
-                                     project_id=project_id, api=api)
+                                     project_id=project_id, api=api,
+                                     workers=workers,
+                                     ordered=ordered is not False,
+                                     prefetch=prefetch, keyset=keyset,
+                                     stream=stream, raw=raw,
+                                     compact=compact, lazy=lazy,
+                                     timestamps=timestamps)
+
+    @classmethod
+    async def afetch(cls, project_id, parameter, api=None, raw=False,
+                     compact=False, lazy=False, timestamps=None,
+                     stream=False):
+        """Coroutine version of ``fetch``.
+
+        Args:
+            project_id (int): identifier of a project
+            parameter (SearchPublicationParameter): parameters object
+            api (AsyncRadarlyApi, optional): API object used to perform
+                request. If None, it will use the default asynchronous API.
+            raw (bool or str, optional): see ``fetch``. Default to False.
+            compact (bool, optional): see ``fetch``. Default to False.
+            lazy (bool, optional): see ``fetch``. Default to False.
+            timestamps (str, optional): see ``fetch``. Default to None.
+            stream (bool, optional): the responses can't be streamed with
+                an ``AsyncRadarlyApi``: only False is accepted. Default to
+                False.
+        Raises:
+            ValueError: raised if ``stream`` is True
+        Returns:
+            list[Publication]:
+        """
+        if stream:
+            raise ValueError(STREAM_ERROR)
+        api = api or AsyncRadarlyApi.get_default_api()
+        url = api.router.publication['search'].format(project_id=project_id)
+        model = _publication_model(api, url, raw, compact, lazy, timestamps)
+        data = await api.post(url, data=parameter, raw=raw or lazy,
+                              timestamps=timestamps)
+        if raw:
+            return data if raw == 'bytes' else data['hits']
+        return [
+            model(item, project_id) for item in data['hits']
+        ]
+
+    @classmethod
+    def afetch_all(cls, project_id, parameter, api=None, raw=False,
+                   compact=False, lazy=False, timestamps=None, stream=False):
+        """Asynchronous version of ``fetch_all``. The returned generator
+        must be iterated with ``async for``.
+
+        Args:
+            project_id (int): identifier of your project
+            parameter (SearchPublicationParameter): parameters object
+            api (AsyncRadarlyApi, optional): API object used to perform
+                request. If None, it will use the default asynchronous API.
+            raw (bool, optional): see ``fetch_all``. Default to False.
+            compact (bool, optional): see ``fetch_all``. Default to False.
+            lazy (bool, optional): see ``fetch_all``. Default to False.
+            timestamps (str, optional): see ``fetch_all``. Default to None.
+            stream (bool, optional): see ``afetch``. Default to False.
+        Raises:
+            ValueError: raised if ``stream`` is True
+        Returns:
+            AsyncPublicationsGenerator:
+        """
+        if stream:
+            raise ValueError(STREAM_ERROR)
+        api = api or AsyncRadarlyApi.get_default_api()
+        return AsyncPublicationsGenerator(parameter,
+                                          project_id=project_id, api=api,
+                                          raw=raw, compact=compact, lazy=lazy,
+                                          timestamps=timestamps)
 
     def get_metadata(self, params=None, api=None):
         """This method allows users to get document’s metadata.
@@ -108,13 +268,29 @@ class Publication(SourceModel):
         """
         api = api or RadarlyApi.get_default_api()
         url = api.router.publication['metadata'].format(project_id=self.pid)
+        res_data = api.get(url, params=self._metadata_params(params))
+        return Metadata(res_data, self['uid'])
+
+    async def aget_metadata(self, params=None, api=None):
+        """Coroutine version of ``get_metadata``.
+
+        Returns:
+            Metadata: object storing metadata information
+        """
+        api = api or AsyncRadarlyApi.get_default_api()
+        url = api.router.publication['metadata'].format(project_id=self.pid)
+        res_data = await api.get(url, params=self._metadata_params(params))
+        return Metadata(res_data, self['uid'])
+
+    def _metadata_params(self, params=None):
+        """Parameters sent when requesting the metadata of the
+        publication"""
         params = {} if params is None else params
         params.update(dict(
             platform=self['origin']['platform'],
             uid=self['uid'],
         ))
-        res_data = api.get(url, params=params)
-        return Metadata(res_data, self['uid'])
+        return params
 
     def get_raw(self, params=None, api=None):
         """Get the raw content of the publication.
@@ -126,6 +302,24 @@ class Publication(SourceModel):
             dict: dictionary storing the raw content of the publication
         """
         api = api or RadarlyApi.get_default_api()
+        url = api.router.publication['raw'].format(project_id=self.pid)
+        res_data = api.get(url, params=self._raw_params(params))
+        return res_data
+
+    async def aget_raw(self, params=None, api=None):
+        """Coroutine version of ``get_raw``.
+
+        Returns:
+            dict: dictionary storing the raw content of the publication
+        """
+        api = api or AsyncRadarlyApi.get_default_api()
+        url = api.router.publication['raw'].format(project_id=self.pid)
+        res_data = await api.get(url, params=self._raw_params(params))
+        return res_data
+
+    def _raw_params(self, params=None):
+        """Parameters sent when requesting the raw content of the
+        publication"""
         doc_platform = self['origin']['platform']
         available_platform = [
             PLATFORM.FORUM,
@@ -133,14 +327,12 @@ class Publication(SourceModel):
         ]
         assert doc_platform in available_platform, \
             "{} is not compatible with raw content".format(doc_platform)
-        url = api.router.publication['raw'].format(project_id=self.pid)
         params = {} if params is None else params
         params.update(dict(
             platform=doc_platform,
             uid=self['uid'],
         ))
-        res_data = api.get(url, params=params)
-        return res_data
+        return params
 
     def set_tags(self, *args, **kwargs):
         """Update some information about a publication in Radarly. This
@@ -185,6 +377,24 @@ class Publication(SourceModel):
         self.add_data(publication.__dict__)
         return None
 
+    async def aset_tags(self, *args, **kwargs):
+        """Coroutine version of ``set_tags``, based on the
+        ``aset_publication_tags`` coroutine.
+
+        Raises:
+            PublicationUpdateFailed: error raised if the publication failed
+        Returns:
+            None
+        """
+        publication = await aset_publication_tags(
+            *args,
+            project_id=getattr(self, 'pid'),
+            uid=getattr(self, 'uid'),
+            platform=getattr(self, 'origin')['platform'],
+            **kwargs
+        )
+        self.add_data(publication.__dict__)
+        return None
 
     def download(self, output_dir=None, chunk_size=1024):
         """Download the publication if it is an image or video.
@@ -254,38 +464,550 @@ class Publication(SourceModel):
         return media_links
 
 
-class PublicationsGenerator(GeneratorModel):
+class Publication(_PublicationBase):
+    """Object base on ``SourceModel`` storing information about the
+    publication. The structure of the model can be drawn with the
+    ``draw_structure`` method.
+
+    Args:
+        uid (str): unique identifier of the publication
+        origin (dict): dictionary which contains information about the
+            platform where the publication comes from.
+        permalink (str): link to the publication
+        lang (str): lang of the publication
+        date (datetime.datetime): creation date of the publication
+        impression (int): number of impressions on the publication
+        reach (int): estimated number of people reached by the publication
+        tone (str): tone of the publication
+        category (str): category of the publications
+        user (dict): information about the author of the publication
+
+    Only ``date``, ``radar.created`` and ``radar.updated`` are converted
+    into dates when the publications are searched; the other date fields
+    are kept as strings (see ``radarly.schema``).
+    """
+
+
+class CompactPublication(CompactModel, _PublicationBase):
+    """Version of ``Publication`` storing its well-known fields in slots, in
+    order to keep millions of publications in memory (for deduplication or
+    scoring for example). It behaves as a ``Publication`` but isn't an
+    instance of it, given that a ``Publication`` has a ``__dict__``. The
+    fields which are not listed below are stored in an overflow dictionary.
+    See ``CompactModel``.
+    """
+    _FIELDS = (
+        'pid', 'uid', 'id', 'type', 'origin', 'permalink', 'lang', 'date',
+        'text', 'keyword', 'impression', 'reach', 'tone', 'category', 'user',
+        'radar', 'media', 'geo', 'focuses', 'score', 'engagement_score',
+        'emotion', 'affects', 'is_story', 'timezone',
+    )
+    __slots__ = _FIELDS
+
+
+class LazyPublication(Publication):
+    """Version of ``Publication`` wrapping a publication as sent by the API
+    (see the ``raw`` mode of ``RadarlyApi.request``). Each top-level field
+    is decoded (keys converted into snake_case, dates parsed...) the first
+    time it is read, by an attribute, ``__getitem__`` or a ``dpath``
+    lookup, and then cached in the object: the nested fields which are never
+    read (``radar``, ``user``, ``geo``...) are never decoded. Call
+    ``decode`` to decode all the fields at once.
+
+    Args:
+        data (dict): publication as sent by the API
+        project_id (int): identifier of the project
+        decoder (RadarlyDecoder, optional): decoder of the publications (see
+            ``RadarlyApi.decoder``). If None, the generic decoder is used.
+    """
+    def __init__(self, data, project_id, decoder=None):
+        # pylint: disable=W0231
+        self.pid = project_id
+        self._data = data
+        self._decoder = decoder or RadarlyDecoder(
+            blacklist=_BLACKLIST_PATH
+        ).child('hits')
+        self._names = {snake_key(key): key for key in data}
+
+    def __getattr__(self, name):
+        names = self.__dict__.get('_names')
+        if names is None or name not in names:
+            raise AttributeError("'{}' object has no attribute '{}'".format(
+                self.__class__.__name__, name
+            ))
+        key = names.pop(name)
+        value = self._decoder.decode_member(self._data, key)
+        del self._data[key]
+        self.__dict__[name] = value
+        return value
+
+    def keys(self):
+        """Returns a set of available attribute."""
+        return super().keys() | set(self._names)
+
+    def decode(self):
+        """Decode all the fields which are not decoded yet.
+
+        Returns:
+            LazyPublication: the publication itself
+        """
+        for name in list(self._names):
+            getattr(self, name)
+        return self
+
+
+class _PublicationsPageMixin:
+    """Methods shared by the synchronous and asynchronous generators of
+    publications"""
+    _supports_lazy = True
+
+    def _url(self):
+        """URL used to search publications"""
+        return self._api.router.publication['search'].format(
+            project_id=self.project_id
+        )
+
+    def _load_page(self, res_data):
+        """Store the publications of a range"""
+        self.total = res_data['total']
+        if self.raw:
+            self._items = iter(res_data['hits'])
+        else:
+            model = _publication_model(self._api, self._url(),
+                                       compact=self.compact, lazy=self.lazy,
+                                       timestamps=self.timestamps)
+            project_id = self.project_id
+            self._items = (
+                model(item, project_id) for item in res_data['hits']
+            )
+        div = self.total // self.search_param['limit']
+        reste = self.total % self.search_param['limit']
+        self.total_page = div
+        if reste != 0: self.total_page += 1
+
+    def __repr__(self):
+        return '<{}.total={}.total_page={}>'.format(
+            self.__class__.__name__, self.total, self.total_page
+        )
+
+
+class PublicationsGenerator(_PublicationsPageMixin, GeneratorModel):
     """Generator which yields all publications matching some payload.
 
+    With ``keyset`` set to True, the publications are paginated by
+    publication date (see ``KeysetPaginationMixin``) instead of offset: the
+    cost of a page doesn't depend on its depth and the publications indexed
+    during the iteration can't shift the pages, so that no publication is
+    skipped or yielded twice. The publications published at the date where
+    a page ends are requested again with the next page and filtered by uid.
+    The keyset pagination requests the pages one after another and can't be
+    used with ``workers`` or ``prefetch``.
+
+    With ``stream`` set to True, each page is read incrementally (see
+    ``RadarlyApi.stream``): the publications are yielded as soon as they are
+    received and only one publication of the page is decoded at once,
+    instead of the whole page. The pages are requested one after another,
+    so that the streaming mode can't be used with ``workers``, ``prefetch``
+    or ``keyset``.
+
     Args:
         search_param (SearchPublicationParameter):
         project_id (int): identifier of the project
         api (RadarlyApi): api to use to perform requests
+        workers (int, optional): number of pages requested simultaneously.
+            Default to 1.
+        ordered (bool, optional): whether or not yield the publications in
+            the order of the pages. Default to True.
+        prefetch (int, optional): number of pages requested in advance.
+            Default to 0.
+        keyset (bool, optional): whether or not use the keyset pagination.
+            Default to False.
+        stream (bool, optional): whether or not read each page
+            incrementally. Default to False.
+        raw (bool, optional): whether or not yield the publications as the
+            dictionaries sent by the API, without decoding. Default to
+            False.
+        compact (bool, optional): whether or not yield
+            ``CompactPublication`` objects. Default to False.
+        lazy (bool, optional): whether or not yield ``LazyPublication``
+            objects. Default to False.
+        timestamps (str, optional): decoding of the dates, ``'datetime'``
+            or ``'epoch'``. If None, the option of the API is used.
+        checkpoint (str, optional): path of the file where the cursor of the
+            generator is written. See ``GeneratorModel``.
+        checkpoint_every (int, optional): number of pages between two writes
+            of the cursor. Default to 1.
+        cursor (dict, optional): cursor used to restart the iteration.
     Yields:
         Publication:
     """
+    _parameter_class = SearchPublicationParameter
+
+    def __init__(self, search_param, project_id=None, api=None, workers=1,
+                 ordered=True, prefetch=0, keyset=False, stream=False,
+                 checkpoint=None, checkpoint_every=1, cursor=None, raw=False,
+                 compact=False, lazy=False, timestamps=None):
+        self.keyset = keyset
+        self.stream = stream
+        self._boundary = (None, set())
+        if stream and (workers > 1 or prefetch > 0 or keyset):
+            raise ValueError(("The streaming mode can't be used with "
+                              "workers, prefetch or keyset."))
+        if keyset:
+            if workers > 1 or prefetch > 0:
+                raise ValueError(("The keyset pagination can't be used with "
+                                  "workers or prefetch."))
+            if cursor is None:
+                search_param = search_param.thaw().keyset()
+        saved = (cursor or {}).get('options') or {}
+        if bool(saved.get('keyset', keyset)) != bool(keyset):
+            raise ValueError(("The cursor wasn't saved with the same "
+                              "pagination (keyset={}).".format(not keyset)))
+        super().__init__(search_param, project_id=project_id, api=api,
+                         workers=workers, ordered=ordered, prefetch=prefetch,
+                         checkpoint=checkpoint,
+                         checkpoint_every=checkpoint_every, cursor=cursor,
+                         raw=raw, compact=compact, lazy=lazy,
+                         timestamps=timestamps)
+
+    def _cursor_options(self):
+        """Store the pagination mode in the cursor"""
+        options = super()._cursor_options()
+        options.update(keyset=self.keyset, stream=self.stream)
+        return options
+
+    def _cursor_state(self):
+        """Store the publications already received at the boundary of the
+        keyset pagination"""
+        boundary_date, seen = self._boundary
+        if boundary_date is None:
+            return {}
+        return dict(boundary_date=boundary_date.isoformat(),
+                    seen=sorted(seen))
+
+    def _restore(self, cursor):
+        """Restore the position and the boundary of the keyset pagination"""
+        super()._restore(cursor)
+        state = cursor.get('state') or {}
+        if state.get('boundary_date'):
+            self._boundary = (parse(state['boundary_date']),
+                              set(state['seen']))
+
     def _fetch_items(self):
-        """Get next range of publications"""
-        url = self._api.router.publication['search'].format(
-            project_id=self.project_id
+        """Get next range of publications. With the keyset pagination, the
+        next range starts after the oldest publication of this range. In
+        streaming mode, the publications are decoded during the
+        iteration."""
+        if self.stream:
+            res_data = self._api.stream('POST', self._url(),
+                                        data=self.search_param,
+                                        raw=self._raw_pages,
+                                        timestamps=self.timestamps)
+            self._load_page(res_data)
+            self._page_params[self.current_page] = self.search_param
+            self.search_param = self.search_param.next_page()
+            return None
+        if not self.keyset:
+            return super()._fetch_items()
+        boundary_date, seen = self._boundary
+        limit = self.search_param['limit']
+        while True:
+            res_data = self._api.post(self._url(), data=self.search_param,
+                                      raw=self._raw_pages,
+                                      timestamps=self.timestamps)
+            received = res_data['hits']
+            hits = [hit for hit in received if hit['uid'] not in seen]
+            if hits or len(received) < limit:
+                break
+            # the page only holds publications published at the boundary
+            # date and already received: skip them
+            self.search_param = self.search_param.seek(
+                boundary_date, self.search_param['start'] + len(received)
+            )
+        total, total_page = self.total, self.total_page
+        self._load_page(dict(res_data, hits=hits))
+        if total_page:
+            self.total = total
+        if len(received) < limit:
+            self.total_page = self.current_page
+        else:
+            # the pages overlap at the boundary dates, so that the number
+            # of pages is only known at the last page
+            self.total_page = max(total_page, self.total_page,
+                                  self.current_page + 1)
+        if not hits:
+            return None
+
+        last_date = _hit_date(hits[-1], self._raw_pages)
+        if last_date != boundary_date:
+            boundary_date, seen = last_date, set()
+        seen.update(hit['uid'] for hit in hits
+                    if _hit_date(hit, self._raw_pages) == last_date)
+        self._boundary = (boundary_date, seen)
+        self.search_param = self.search_param.seek(last_date)
+        return None
+
+    def iter_batches(self):
+        """Iterate over the remaining publications page after page, each
+        page being stored in a ``PublicationBatch``. The batches are cheaper
+        to build with ``raw`` set to True, given that no ``Publication``
+        object is built.
+
+        >>> generator = Publication.fetch_all(<project_id>, param, raw=True)
+        >>> for batch in generator.iter_batches():
+        ...     frame = batch.to_pandas()
+
+        Yields:
+            PublicationBatch:
+        """
+        while True:
+            batch = PublicationBatch(self._items)
+            self._items = iter(())
+            if len(batch):
+                yield batch
+            if not self._next_page():
+                return
+
+
+class AsyncPublicationsGenerator(_PublicationsPageMixin, AsyncGeneratorModel):
+    """Asynchronous generator which yields all publications matching some
+    payload. It must be iterated with ``async for``.
+
+    Args:
+        search_param (SearchPublicationParameter):
+        project_id (int): identifier of the project
+        api (AsyncRadarlyApi): api to use to perform requests
+    Yields:
+        Publication:
+    """
+    pass
+
+
+class ShardedPublicationsGenerator:
+    """Generator which yields all publications matching some payload by
+    splitting the search into shards of publication dates.
+
+    The distribution of the publications over time is first retrieved with
+    ``Distribution.fetch`` (with the same filters as the search) and the
+    publication date range is cut into ``shards`` ranges storing roughly the
+    same number of publications. Each shard is then paginated independently
+    by a pool of ``workers`` threads. The publications are yielded as soon
+    as they are received, without any specific order, and the publications
+    found in two shards (at their boundary) are yielded only once.
+
+    The parameter must define a publication date range (see
+    ``SearchPublicationParameter.publication_date``).
+
+    Args:
+        search_param (SearchPublicationParameter):
+        project_id (int): identifier of the project
+        api (RadarlyApi): api to use to perform requests
+        shards (int, optional): number of shards. Default to 8.
+        workers (int, optional): number of shards exported simultaneously.
+            Default to the number of shards.
+        prefetch (int, optional): number of pages of each shard requested
+            in advance. Default to 0.
+        keyset (bool, optional): whether or not use the keyset pagination
+            in each shard. Default to False.
+        stream (bool, optional): whether or not read each page
+            incrementally. Default to False.
+        buffer_size (int, optional): maximum number of publications received
+            and not yet yielded. Default to 1000.
+        raw (bool, optional): whether or not yield the publications as the
+            dictionaries sent by the API, without decoding. Default to
+            False.
+        compact (bool, optional): whether or not yield
+            ``CompactPublication`` objects. Default to False.
+        lazy (bool, optional): whether or not yield ``LazyPublication``
+            objects. Default to False.
+        timestamps (str, optional): decoding of the dates of the
+            publications. If None, the option of the API is used.
+    Yields:
+        Publication:
+    """
+    def __init__(self, search_param, project_id=None, api=None, shards=8,
+                 workers=None, prefetch=0, keyset=False, stream=False,
+                 buffer_size=1000, raw=False, compact=False, lazy=False,
+                 timestamps=None):
+        if not ('from' in search_param and 'to' in search_param):
+            raise ValueError(("A publication date range is required to split "
+                              "the search into shards."))
+        if stream and (prefetch > 0 or keyset):
+            raise ValueError(("The streaming mode can't be used with "
+                              "prefetch or keyset."))
+        if keyset and prefetch > 0:
+            raise ValueError(("The keyset pagination can't be used with "
+                              "prefetch."))
+        self._api = api or RadarlyApi.get_default_api()
+        self.project_id = project_id
+        self.search_param = search_param.freeze()
+        self.distribution = Distribution.fetch(
+            project_id, self._distribution_param(), api=self._api,
+            timestamps='datetime'
         )
-        res_data = self._api.post(url, data=self.search_param)
-        self.total = res_data['total']
-        self._items = (
-            Publication(item, self.project_id)
-            for item in res_data['hits']
+        self.total = self.distribution.total
+        self.shards = self._split(shards)
+        self._seen = set()
+        self._queue = queue.Queue(maxsize=buffer_size)
+        self._stop = threading.Event()
+        self._running = len(self.shards)
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers or len(self.shards)
         )
-        div = self.total // self.search_param['limit']
-        reste = self.total % self.search_param['limit']
-        self.total_page = div
-        if reste != 0: self.total_page += 1
-        self.search_param = self.search_param.next_page()
+        options = dict(prefetch=prefetch, keyset=keyset, stream=stream,
+                       raw=raw, compact=compact, lazy=lazy,
+                       timestamps=timestamps)
+        for shard in self.shards:
+            self._executor.submit(
+                _export_shard, shard, project_id, self._api,
+                self._queue, self._stop, **options
+            )
 
     def __repr__(self):
-        return '<PublicationsGenerator.total={}.total_page={}>'.format(
-            self.total, self.total_page
+        return '<ShardedPublicationsGenerator.total={}.shards={}>'.format(
+            self.total, len(self.shards)
         )
 
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while self._running:
+            item = self._queue.get()
+            if item is None:
+                self._running -= 1
+            elif isinstance(item, Exception):
+                self.close()
+                raise item
+            elif item['uid'] not in self._seen:
+                self._seen.add(item['uid'])
+                return item
+        self.close()
+        raise StopIteration
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """Stop the export of the shards. The generator can not be iterated
+        anymore."""
+        if getattr(self, '_executor', None) is None:
+            return None
+        self._running = 0
+        self._stop.set()
+        self._executor.shutdown(wait=False)
+        self._executor = None
+        return None
+
+    def _distribution_param(self):
+        """Distribution parameter with the same filters as the search"""
+        param = DistributionParameter()
+        param.update({
+            key: value for key, value in self.search_param.items()
+            if key not in ['start', 'limit', 'sortBy', 'sortOrder', 'fctx']
+        })
+        span = parse(param['to']) - parse(param['from'])
+        interval = INTERVAL.HOUR if span.days <= 31 else INTERVAL.DAY
+        return param.interval(interval).metrics(METRIC.DOC)
+
+    def _split(self, shards):
+        """Cut the publication date range into shards storing roughly the
+        same number of publications.
+
+        Args:
+            shards (int): maximum number of shards
+        Returns:
+            list[SearchPublicationParameter]: parameters of each shard
+        """
+        total = sum(item.get(METRIC.DOC, 0) for item in self.distribution)
+        bounds = [self.search_param['from']]
+        cumulated, size = 0, total / shards
+        for item, following in zip(self.distribution,
+                                   self.distribution[1:]):
+            cumulated += item.get(METRIC.DOC, 0)
+            if cumulated >= size * len(bounds) and len(bounds) < shards:
+                bounds.append(check_date(following['date']))
+        bounds.append(self.search_param['to'])
+
+        params = []
+        for start, end in zip(bounds, bounds[1:]):
+            params.append(self.search_param.replace({'from': start, 'to': end},
+                                                    start=0))
+        return params
+
+
+def _publication_model(api, url, raw=False, compact=False, lazy=False,
+                       timestamps=None):
+    """Get the callable building the publications of a search, given the
+    mode of the search.
+
+    Args:
+        api (RadarlyApi): api performing the search
+        url (str): url of the search
+        raw (bool, optional): whether or not the search is in raw mode.
+            Default to False.
+        compact (bool, optional): Default to False.
+        lazy (bool, optional): Default to False.
+        timestamps (str, optional): decoding of the dates of the lazy
+            publications. Default to None.
+    Raises:
+        ValueError: raised if the lazy mode is combined with the raw or the
+            compact mode
+    Returns:
+        callable: callable taking a publication and a project identifier
+    """
+    if not lazy:
+        return CompactPublication if compact else Publication
+    if raw or compact:
+        raise ValueError("The lazy mode can't be used with raw or compact.")
+    decoder = api.decoder(url, timestamps).child('hits')
+    return functools.partial(LazyPublication, decoder=decoder)
+
+
+def _hit_date(hit, raw=False):
+    """Publication date of a hit, parsed if the hit is not decoded (or
+    converted if the dates are decoded into epoch values)"""
+    if raw:
+        return parse_date(hit['date'])
+    if isinstance(hit['date'], int):
+        return from_epoch(hit['date'])
+    return hit['date']
+
+
+def _export_shard(param, project_id, api, output, stop, **options):
+    """Paginate the publications of a shard and put them in a queue. The
+    end of the shard is signaled by a None and the error raised during the
+    export, if any, is put in the queue.
+
+    Args:
+        param (SearchPublicationParameter): parameter of the shard
+        project_id (int): identifier of the project
+        api (RadarlyApi): api to use to perform requests
+        output (queue.Queue): queue storing the publications
+        stop (threading.Event): event set when the export must be stopped
+        **options: options of the ``PublicationsGenerator`` paginating the
+            shard (``prefetch``, ``keyset``, ``stream``, ``raw``,
+            ``compact``, ``lazy`` and ``timestamps``)
+    """
+    def put(item):
+        while not stop.is_set():
+            try:
+                output.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    try:
+        for publication in PublicationsGenerator(param, project_id, api,
+                                                 **options):
+            if not put(publication):
+                return
+    except Exception as error: # pylint: disable=W0703
+        put(error)
+        return
+    put(None)
+
 
 def set_publication_tags(project_id, uid, platform,
                          tone=None, language=None, country=None,
@@ -321,28 +1043,55 @@ def set_publication_tags(project_id, uid, platform,
         Publication: publication which was updated
     """
 
-    def check_update(pub, tone, language, country,
-                     keyword, custom_tags):
-        """Check the publication's update."""
-        not_updated_fields = []
-        if tone and pub['tone'] != tone:
-            not_updated_fields.append('tone')
-        if keyword and pub['keyword'] != keyword:
-            not_updated_fields.append('keyword')
-        if language and pub['lang'] != language:
-            not_updated_fields.append('lang')
-        if country and pub['geo']['inferred']['country'] != country:
-            not_updated_fields.append('geo.inferred.country')
-        if custom_tags:
-            _ = [
-                not_updated_fields.append('radar.tag.custom.{}'.format(key))
-                for key in custom_tags
-                if pub['radar']['tag']['custom'][key] != custom_tags[key]
-            ]
-        if not_updated_fields:
-            raise PublicationUpdateFailed(fields=not_updated_fields)
-        return None
+    payload = _tags_payload(tone, language, country, keyword, custom_tags)
+    params = dict(
+        uid=uid,
+        platform=platform,
+    )
+    api = api or RadarlyApi.get_default_api()
+    url = api.router.publication['set_tag'].format(
+        project_id=project_id
+    )
+    publication = api.post(url, params=params, data=payload)
+    publication = Publication(data=publication, project_id=project_id)
+
+    _check_update(publication, tone, language, country,
+                  keyword, custom_tags)
+
+    return publication
 
+
+async def aset_publication_tags(project_id, uid, platform,
+                                tone=None, language=None, country=None,
+                                keyword=None, custom_tags=None, api=None):
+    """Coroutine version of ``set_publication_tags``. The ``api`` must be an
+    ``AsyncRadarlyApi`` (the default one is used if None).
+
+    Raises:
+        PublicationUpdateFailed: error raised if the publication failed
+    Returns:
+        Publication: publication which was updated
+    """
+    payload = _tags_payload(tone, language, country, keyword, custom_tags)
+    params = dict(
+        uid=uid,
+        platform=platform,
+    )
+    api = api or AsyncRadarlyApi.get_default_api()
+    url = api.router.publication['set_tag'].format(
+        project_id=project_id
+    )
+    publication = await api.post(url, params=params, data=payload)
+    publication = Publication(data=publication, project_id=project_id)
+
+    _check_update(publication, tone, language, country,
+                  keyword, custom_tags)
+
+    return publication
+
+
+def _tags_payload(tone, language, country, keyword, custom_tags):
+    """Build the payload sent to update the fields of a publication."""
     payload = {}
     if tone:
         _ = TONE.check(tone)
@@ -366,22 +1115,29 @@ def set_publication_tags(project_id, uid, platform,
             label: {'set': custom_tags[label]} for label in custom_tags
         }
         payload['radar'] = {'tag': {'custom': custom_tags_setter}}
-
-    params = dict(
-        uid=uid,
-        platform=platform,
-    )
-    payload = {
+    return {
         "doc": payload
     }
-    api = api or RadarlyApi.get_default_api()
-    url = api.router.publication['set_tag'].format(
-        project_id=project_id
-    )
-    publication = api.post(url, params=params, data=payload)
-    publication = Publication(data=publication, project_id=project_id)
 
-    check_update(publication, tone, language, country,
-                 keyword, custom_tags)
 
-    return publication
+def _check_update(pub, tone, language, country,
+                  keyword, custom_tags):
+    """Check the publication's update."""
+    not_updated_fields = []
+    if tone and pub['tone'] != tone:
+        not_updated_fields.append('tone')
+    if keyword and pub['keyword'] != keyword:
+        not_updated_fields.append('keyword')
+    if language and pub['lang'] != language:
+        not_updated_fields.append('lang')
+    if country and pub['geo']['inferred']['country'] != country:
+        not_updated_fields.append('geo.inferred.country')
+    if custom_tags:
+        _ = [
+            not_updated_fields.append('radar.tag.custom.{}'.format(key))
+            for key in custom_tags
+            if pub['radar']['tag']['custom'][key] != custom_tags[key]
+        ]
+    if not_updated_fields:
+        raise PublicationUpdateFailed(fields=not_updated_fields)
+    return None
@@ -5,9 +5,10 @@ request's headers and store this rates.
 """
 
 import copy
-import re
+import threading
+import time
 
-from .utils.router import Router
+from .utils.router import Router, into_pattern, match_any
 
 
 class RateConf:
@@ -35,25 +36,9 @@ class RateConf:
         Returns:
             string: category for this URL ('slow', 'medium' or 'default')
         """
-        def into_pattern(path_url):
-            """Transform a string with format option into a compiled regular
-            expression"""
-            if isinstance(path_url, str):
-                format_pattern = r'{[a-zA-Z0-9_]*}'
-                path_url = re.sub(format_pattern, '[a-zA-Z0-9]*', path_url)
-                return re.compile(path_url)
-            elif isinstance(path_url, (list, tuple)):
-                return [into_pattern(url) for url in path_url]
-            raise TypeError("'path_url' must be a string or a list")
-        match_slow = any(
-            [item.search(url) for item in into_pattern(cls.slow)]
-        )
-        match_medium = any(
-            [item.search(url) for item in into_pattern(cls.medium)]
-        )
-        if match_slow:
+        if match_any(url, into_pattern(cls.slow)):
             return 'slow'
-        elif match_medium:
+        elif match_any(url, into_pattern(cls.medium)):
             return 'medium'
         return 'default'
 
@@ -61,7 +46,7 @@ class RateConf:
 class RateLimit:
     """Object which will count the remaining request"""
     def __init__(self):
-        default = dict(limit=0, remaining=5000, reset=0)
+        default = dict(limit=0, remaining=5000, reset=0, updated=0)
         self.slow = copy.deepcopy(default)
         self.medium = copy.deepcopy(default)
         self.default = copy.deepcopy(default)
@@ -92,6 +77,7 @@ class RateLimit:
             data.get('X-Rate-Limit-Remaining', right_limit['remaining'])
         )
         right_limit['reset'] = int(data.get('X-Rate-Limit-Reset', right_limit['reset']))
+        right_limit['updated'] = time.time()
         return None
 
     def is_reached(self, url):
@@ -102,3 +88,102 @@ class RateLimit:
         """
         right_limit = getattr(self, RateConf.get_category(url))
         return right_limit['remaining'] <= 0
+
+
+class RateScheduler:
+    """Scheduler which delays the requests instead of raising a
+    ``RateReached`` error when the rate limit is reached. The scheduler
+    keeps a token bucket for each category of ``RateConf``: the tokens are
+    the remaining requests given by the headers of the last response, minus
+    the requests already scheduled. The requests are spread evenly until the
+    reset of the window (given by ``X-Rate-Limit-Reset``) and, when no token
+    is left, the next request waits exactly until the window reopens.
+
+    The scheduler is used by the API when it is initialized with
+    ``throttle=True``:
+
+    >>> api = RadarlyApi(client_id=<client_id>,
+    ...                  client_secret=<client_secret>,
+    ...                  throttle=True)
+    >>> api.scheduler
+    <RateScheduler.window=900>
+
+    Args:
+        rates (RateLimit): rates of the API, updated after each request
+        window (int, optional): duration in seconds of the rate limit window.
+            Default to 900 (15 minutes).
+    """
+    def __init__(self, rates, window=900):
+        self.rates = rates
+        self.window = window
+        self._lock = threading.Lock()
+        self._buckets = {
+            category: dict(reserved=0, next_slot=0.)
+            for category in ['slow', 'medium', 'default']
+        }
+
+    def __repr__(self):
+        return '<RateScheduler.window={}>'.format(self.window)
+
+    def delay(self, url):
+        """Book a slot for a request and get the number of seconds to wait
+        before sending it. Each call must be followed by a call to
+        ``release`` once the response has been received.
+
+        Args:
+            url (string): url which will be fetched by the pending request
+        Returns:
+            float: number of seconds to wait
+        """
+        category = RateConf.get_category(url)
+        limit = getattr(self.rates, category)
+        with self._lock:
+            now = time.time()
+            bucket = self._buckets[category]
+            reset_at = reset_timestamp(limit)
+            tokens = limit['remaining'] - bucket['reserved']
+            full_rate = self.window / limit['limit'] if limit['limit'] else 0.
+            start = max(now, bucket['next_slot'])
+            if tokens > 0 and start < reset_at:
+                interval = (reset_at - start) / tokens
+            else:
+                start = max(start, reset_at)
+                interval = full_rate
+            bucket['next_slot'] = start + interval
+            bucket['reserved'] += 1
+        return max(start - now, 0.)
+
+    def release(self, url):
+        """Free the slot booked for a request whose response has been
+        received (and so whose cost is included in the rates of the API).
+
+        Args:
+            url (string): url of the request
+        Returns:
+            None:
+        """
+        category = RateConf.get_category(url)
+        with self._lock:
+            bucket = self._buckets[category]
+            bucket['reserved'] = max(bucket['reserved'] - 1, 0)
+        return None
+
+
+def reset_timestamp(limit):
+    """Get the timestamp at which a rate limit window reopens. The
+    ``X-Rate-Limit-Reset`` header can either be a timestamp (in seconds or
+    milliseconds) or a number of seconds counted from the response.
+
+    Args:
+        limit (dict): one of the categories of a ``RateLimit`` object
+    Returns:
+        float: timestamp of the reset (0 if unknown)
+    """
+    reset = limit['reset']
+    if not reset:
+        return 0.
+    if reset > 1e12:
+        return reset / 1000.
+    if reset > 1e9:
+        return float(reset)
+    return limit['updated'] + reset
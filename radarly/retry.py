@@ -0,0 +1,174 @@
+"""
+Requests sent to the API can fail for transient reasons (server errors,
+connection resets, timeouts...). This module defines the policy used by the
+``RadarlyApi`` to retry such requests instead of raising an error straight
+away.
+"""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+
+from .exceptions import RadarlyHTTPError
+from .rate import reset_timestamp
+from .utils.router import Router, into_pattern, match_any
+
+
+TRANSIENT_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+
+class RetryPolicy:
+    """Policy used to retry the requests which failed because of a transient
+    error. The delay between two attempts grows exponentially and is
+    randomized with a full jitter (a random delay between 0 and
+    ``backoff_factor * 2 ** attempt``), except when the server specifies when
+    the request can be sent again (with ``Retry-After`` or
+    ``X-Rate-Limit-Reset`` headers).
+
+    Only the idempotent requests are retried: the GET and PUT requests and
+    the POST requests sent to the read-only roads listed in
+    ``IDEMPOTENT_POST`` (search and insights). The other POST requests (as
+    the update of the tags of a publication) are only retried if
+    ``retry_unsafe`` is set to True.
+
+    >>> from radarly.retry import RetryPolicy
+    >>> api = RadarlyApi(client_id=<client_id>,
+    ...                  client_secret=<client_secret>,
+    ...                  retry=RetryPolicy(max_retries=5))
+
+    Args:
+        max_retries (int, optional): maximum number of retries for a request.
+            Default to 3.
+        backoff_factor (float, optional): base delay (in seconds) of the
+            exponential backoff. Default to 0.5.
+        max_backoff (float, optional): maximum delay between two attempts.
+            Default to 60.
+        max_elapsed (float, optional): maximum cumulated delay (in seconds)
+            spent waiting between the attempts of a request. Default to 300.
+        status_forcelist (tuple[int], optional): status codes which are
+            considered as transient errors. Default to
+            ``(429, 500, 502, 503, 504)``.
+        retry_unsafe (bool, optional): whether or not retry the non
+            idempotent requests. Default to False.
+    """
+    IDEMPOTENT_POST = [
+        Router.analytics['global'],
+        Router.analytics['occupation'],
+        Router.cloud['fetch'],
+        Router.cluster['fetch'],
+        Router.distribution['fetch'],
+        Router.geogrid['fetch'],
+        Router.influencer['search'],
+        Router.localization['fetch'],
+        Router.pivot_table['fetch'],
+        Router.publication['search'],
+        Router.topicwheel['fetch'],
+    ]
+
+    def __init__(self, max_retries=3, backoff_factor=0.5, max_backoff=60,
+                 max_elapsed=300, status_forcelist=(429, 500, 502, 503, 504),
+                 retry_unsafe=False):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_elapsed = max_elapsed
+        self.status_forcelist = status_forcelist
+        self.retry_unsafe = retry_unsafe
+        self._idempotent_post = into_pattern(self.IDEMPOTENT_POST)
+
+    def __repr__(self):
+        return '<RetryPolicy.max_retries={}.max_elapsed={}>'.format(
+            self.max_retries, self.max_elapsed
+        )
+
+    def is_idempotent(self, verb, url):
+        """Whether or not a request can be sent several times without side
+        effects.
+
+        Args:
+            verb (str): method of the request
+            url (str): url of the request
+        Returns:
+            bool:
+        """
+        verb = verb.upper()
+        if verb in ['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE']:
+            return True
+        return verb == 'POST' and match_any(url, self._idempotent_post)
+
+    def is_transient(self, error):
+        """Whether or not an error raised during a request is transient.
+
+        Args:
+            error (Exception):
+        Returns:
+            bool:
+        """
+        if isinstance(error, RadarlyHTTPError):
+            return error.response.status_code in self.status_forcelist
+        return isinstance(error, TRANSIENT_ERRORS)
+
+    def next_delay(self, verb, url, error, attempt, elapsed=0.):
+        """Compute the delay before the next attempt of a failed request.
+
+        Args:
+            verb (str): method of the request
+            url (str): url of the request
+            error (Exception): error raised by the last attempt
+            attempt (int): number of retries already made for the request
+            elapsed (float): cumulated delay already spent between the
+                previous attempts
+        Returns:
+            float or None: number of seconds to wait before the next attempt,
+            or None if the request must not be retried.
+        """
+        if attempt >= self.max_retries or not self.is_transient(error):
+            return None
+        if not (self.retry_unsafe or self.is_idempotent(verb, url)):
+            return None
+        delay = server_delay(getattr(error, 'response', None))
+        if delay is None:
+            ceiling = min(self.max_backoff, self.backoff_factor * 2 ** attempt)
+            delay = random.uniform(0, ceiling)
+        if elapsed + delay > self.max_elapsed:
+            return None
+        return delay
+
+
+def server_delay(response):
+    """Get the delay asked by the server before sending a new request, using
+    the ``Retry-After`` header or, for a response whose rate limit is reached,
+    the ``X-Rate-Limit-Reset`` header.
+
+    Args:
+        response (requests.Response): response of the failed request
+    Returns:
+        float or None: number of seconds to wait, None if the server doesn't
+        specify it.
+    """
+    if response is None:
+        return None
+    headers = response.headers
+    retry_after = headers.get('Retry-After')
+    if retry_after:
+        try:
+            return max(float(retry_after), 0.)
+        except ValueError:
+            pass
+        try:
+            retry_date = parsedate_to_datetime(retry_after)
+            return max(retry_date.timestamp() - time.time(), 0.)
+        except (TypeError, ValueError):
+            pass
+    reset = headers.get('X-Rate-Limit-Reset')
+    if reset and (response.status_code == 429 or
+                  headers.get('X-Rate-Limit-Remaining') == '0'):
+        limit = dict(reset=int(reset), updated=time.time())
+        return max(reset_timestamp(limit) - time.time(), 0.)
+    return None
@@ -0,0 +1,79 @@
+"""
+Decoding schemas of the responses of the API. By default, the ``RadarlyApi``
+tests each string of a response to know if it is a date or a timezone. For
+the routes of the ``Router`` whose responses are known, a ``DecodingSchema``
+declares which fields hold the timestamps, the timezones or the tag maps
+which must be kept as is: only these fields are decoded and the other values
+are left untouched. The schemas also declare the fields holding values
+repeated across many publications (platforms, langs, tones...), which are
+interned (see ``InternTable``). The responses of the other routes (as the
+description of a project, whose nested objects can't be listed exhaustively)
+keep the generic decoding. The schema of the influencers search keeps it too
+and only adds the interned fields.
+
+Only the declared dates are converted: the other date fields of a
+publication (the nested fields which depend on the platform, which were
+decoded by the generic decoding before the schemas) are kept as the
+strings sent by the API and can be converted with
+``radarly.utils.jsonparser.parse_date``.
+
+>>> from radarly.schema import schema_for
+>>> schema_for('/projects/1/inbox/search.json')
+<DecodingSchema.dates=3.timezones=1.blacklist=1.intern=10>
+"""
+
+from .utils.jsonparser import DecodingSchema
+from .utils.router import Router, into_pattern
+
+_PUBLICATION_INTERN = [
+    'hits.origin.platform', 'hits.origin.source', 'hits.lang', 'hits.tone',
+    'hits.category', 'hits.type', 'hits.geo.inferred.country',
+    'hits.radar.focuses', 'hits.user.id', 'hits.user.screenName',
+]
+
+
+SCHEMAS = [
+    (Router.publication['search'], DecodingSchema(
+        dates=['hits.date', 'hits.radar.created', 'hits.radar.updated'],
+        timezones=['hits.timezone'],
+        blacklist=['hits.radar.tag'],
+        intern=_PUBLICATION_INTERN,
+    )),
+    (Router.analytics['global'], DecodingSchema(
+        dates=['dots.date'],
+        blacklist=['dots.stats'],
+    )),
+    (Router.analytics['occupation'], DecodingSchema(
+        dates=['dots.date'],
+        blacklist=['dots.stats'],
+    )),
+    (Router.distribution['fetch'], DecodingSchema(
+        dates=['distribution.distribution.date'],
+    )),
+    (Router.influencer['search'], DecodingSchema(
+        intern=['users.platform', 'users.gender', 'users.user.platform'],
+        generic=True,
+    )),
+]
+_PATTERNS = [
+    (into_pattern(route + '$'), schema) for route, schema in SCHEMAS
+]
+
+# schema of the routes without schema, used to apply the generic decoding
+# with the options of the API
+GENERIC_SCHEMA = DecodingSchema(generic=True)
+
+
+def schema_for(url):
+    """Get the decoding schema of the responses of an URL.
+
+    Args:
+        url (str): url of the request
+    Returns:
+        DecodingSchema: None if the route of the URL has no schema, in which
+        case the generic decoding must be used.
+    """
+    for pattern, schema in _PATTERNS:
+        if pattern.search(url):
+            return schema
+    return None
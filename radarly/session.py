@@ -0,0 +1,87 @@
+"""
+All the requests sent to the Radarly API go through a ``requests.Session``
+which keeps its connections alive between two requests. This way, iterating
+over hundreds of pages of publications doesn't open a new TCP (and TLS)
+connection for each page. The sessions are managed by the ``SessionPool``
+defined in this module and shared between all ``RadarlyApi`` objects pointing
+at the same host.
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class SessionPool:
+    """Registry of the sessions shared between the ``RadarlyApi`` objects.
+    A session is identified by the host it targets and by the size of its
+    connection pool. Each API acquires a session during its initialization
+    and releases it when it is closed: the session (and so all its
+    connections) is closed as soon as no API uses it anymore.
+
+    >>> from radarly.session import SessionPool
+    >>> session = SessionPool.acquire('https://radarly.linkfluence.com')
+    >>> SessionPool.release('https://radarly.linkfluence.com')
+    """
+    _sessions = {}
+    _counters = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def acquire(cls, host, pool_size=10):
+        """Get the session used for a host. The session is built if it
+        doesn't exist yet.
+
+        Args:
+            host (str): root URL of the API
+            pool_size (int, optional): maximum number of connections kept
+                alive for the host. Default to 10.
+        Returns:
+            requests.Session:
+        """
+        key = (host, pool_size)
+        with cls._lock:
+            if key not in cls._sessions:
+                cls._sessions[key] = build_session(pool_size)
+                cls._counters[key] = 0
+            cls._counters[key] += 1
+            return cls._sessions[key]
+
+    @classmethod
+    def release(cls, host, pool_size=10):
+        """Release a session previously acquired. The session is closed
+        if it is not used anymore.
+
+        Args:
+            host (str): root URL of the API
+            pool_size (int, optional): size of the connection pool used
+                when the session was acquired. Default to 10.
+        Returns:
+            None:
+        """
+        key = (host, pool_size)
+        with cls._lock:
+            if key not in cls._sessions:
+                return None
+            cls._counters[key] -= 1
+            if cls._counters[key] <= 0:
+                cls._sessions.pop(key).close()
+                del cls._counters[key]
+        return None
+
+
+def build_session(pool_size=10):
+    """Build a session whose adapters keep ``pool_size`` connections alive
+    for each host.
+
+    Args:
+        pool_size (int, optional): Default to 10.
+    Returns:
+        requests.Session:
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
@@ -4,6 +4,7 @@ This module defines an object in order to retrieve information about that.
 """
 
 from .api import RadarlyApi
+from .asyncapi import AsyncRadarlyApi
 
 
 class SocialPerformance(list):
@@ -41,7 +42,7 @@ class SocialPerformance(list):
         )
 
     @classmethod
-    def fetch(cls, project_id, parameter, api=None):
+    def fetch(cls, project_id, parameter, api=None, timestamps=None):
         """Retrieve information about social account performance from the API.
 
         Args:
@@ -51,17 +52,44 @@ class SocialPerformance(list):
                 how to build this object.
             api (RadarlyApi, optional): API used to make the
                 request. If None, the default API will be used.
+            timestamps (str, optional): ``'epoch'`` to get the dates as
+                numbers of milliseconds since the epoch instead of
+                ``datetime`` objects (see ``RadarlyApi``). If None, the
+                option of the API is used.
         Returns:
             SocialPerformance: list-like object compatible with ``pandas``
         """
         api = api or RadarlyApi.get_default_api()
-        platform = parameter['platform']
-        parameter = parameter()
+        data = api.get(cls._url(api, project_id, parameter),
+                       timestamps=timestamps)
+        return [cls(item, parameter['platform'])
+                for item in data if item['stats']]
 
+    @classmethod
+    async def afetch(cls, project_id, parameter, api=None,
+                     timestamps=None):
+        """Coroutine version of ``fetch``.
+
+        Args:
+            project_id (int): identifier of the project
+            parameter (SocialPerformanceParameter): object sent as
+                payload to the API.
+            api (AsyncRadarlyApi, optional): API used to make the
+                request. If None, the default asynchronous API will be used.
+            timestamps (str, optional): see ``fetch``.
+        Returns:
+            SocialPerformance: list-like object compatible with ``pandas``
+        """
+        api = api or AsyncRadarlyApi.get_default_api()
+        data = await api.get(cls._url(api, project_id, parameter),
+                             timestamps=timestamps)
+        return [cls(item, parameter['platform'])
+                for item in data if item['stats']]
+
+    @staticmethod
+    def _url(api, project_id, parameter):
+        """Build the URL requested to get the social performance"""
         url = api.router.social_performance['fetch'].format(
             project_id=project_id
         )
-        url = "{}?{}".format(url, parameter)
-        data = api.get(url)
-
-        return [cls(item, platform) for item in data if item['stats']]
+        return "{}?{}".format(url, parameter())
@@ -0,0 +1,195 @@
+"""
+Incremental synchronization of the publications of a project. Instead of
+retrieving all the publications of a search each time a project is polled,
+``IncrementalSync`` stores a high-water mark for each couple (project,
+parameter) and only requests the publications indexed after this mark.
+
+>>> from radarly.sync import IncrementalSync, SyncStore
+>>> sync = IncrementalSync(<project_id>, param,
+...                        store=SyncStore('sync_state.json'))
+>>> publications, watermark = sync.poll()
+"""
+
+import collections
+import copy
+import json
+from datetime import datetime, timedelta
+from os.path import exists
+
+import pytz
+from dateutil.parser import parse
+
+from .api import RadarlyApi
+from .publication import Publication
+from .utils.misc import atomic_dump
+
+
+_NOT_FILTERS = ('start', 'limit', 'date')
+
+
+def _utc(date):
+    """Consider a naive datetime as an UTC datetime"""
+    if date.tzinfo is None:
+        return date.replace(tzinfo=pytz.utc)
+    return date
+
+
+class SyncStore:
+    """Store of the states of the incremental synchronizations (high-water
+    mark and identifiers of the last publications received). The states
+    are kept in a JSON file, rewritten atomically each time a state is
+    updated. If no path is given, the states are only kept in memory.
+
+    Args:
+        path (str, optional): path of the JSON file storing the states.
+    """
+    def __init__(self, path=None):
+        self.path = path
+        self._states = {}
+        if path and exists(path):
+            with open(path, mode='r') as state_file:
+                self._states = json.load(state_file)
+
+    def __repr__(self):
+        return '<SyncStore.path={}.length={}>'.format(
+            self.path, len(self._states)
+        )
+
+    def get(self, key):
+        """Get the state of a synchronization.
+
+        Args:
+            key (str): identifier of the synchronization
+        Returns:
+            dict: state of the synchronization, None if it has never been
+            synchronized.
+        """
+        return copy.deepcopy(self._states.get(key))
+
+    def set(self, key, state):
+        """Update the state of a synchronization.
+
+        Args:
+            key (str): identifier of the synchronization
+            state (dict): serializable state
+        Returns:
+            None:
+        """
+        self._states[key] = copy.deepcopy(state)
+        if self.path:
+            atomic_dump(self._states, self.path, indent=2, sort_keys=True)
+        return None
+
+
+class IncrementalSync:
+    """Synchronize the publications of a project matching some parameter.
+    Each call to ``poll`` requests the publications indexed since the
+    previous call (using ``DateMixin.creation_date``), so that the cost of a
+    poll depends on the number of new publications and not on the size of
+    the publication date range of the parameter.
+
+    The high-water mark is the time at which the previous poll started.
+    In order to not miss the publications indexed while a poll runs (or
+    because of a clock skew), the publications are requested from
+    ``watermark - overlap``: the publications received twice are discarded
+    thanks to the identifiers of the last ``recent_size`` publications,
+    stored with the high-water mark. An indexation range given by the
+    parameter (``creation_date``) is kept: the lower bound of each poll is
+    the latest of its lower bound and ``watermark - overlap``.
+
+    Args:
+        project_id (int): identifier of the project
+        parameter (SearchPublicationParameter): parameter of the search. It
+            must contain the pagination parameters.
+        store (SyncStore, optional): store of the states. If None, the
+            states are kept in memory.
+        api (RadarlyApi, optional): API used to perform the requests. If
+            None, the default API will be used.
+        since (datetime.datetime, optional): high-water mark used for the
+            first poll. If None, the first poll retrieves all the
+            publications matching the parameter.
+        overlap (datetime.timedelta, optional): duration requested again
+            before the high-water mark. Default to 5 minutes.
+        recent_size (int, optional): number of identifiers of publications
+            kept to discard the duplicates. Default to 10000.
+    """
+    def __init__(self, project_id, parameter, store=None, api=None,
+                 since=None, overlap=timedelta(minutes=5),
+                 recent_size=10000):
+        self.project_id = project_id
+        self.parameter = parameter.freeze()
+        self.store = store or SyncStore()
+        self._api = api
+        self.since = since
+        self.overlap = overlap
+        self.recent_size = recent_size
+
+    def __repr__(self):
+        return '<IncrementalSync.project_id={}.key={}>'.format(
+            self.project_id, self.key
+        )
+
+    @property
+    def key(self):
+        """Identifier of the synchronization in the store, built from the
+        project and the digest of the filters of the parameter"""
+        return '{}:{}'.format(self.project_id,
+                              self.parameter.digest(exclude=_NOT_FILTERS))
+
+    @property
+    def watermark(self):
+        """High-water mark of the synchronization (an UTC datetime), None if
+        the synchronization has never been made"""
+        state = self._state()
+        if state is None:
+            return self.since
+        return parse(state['watermark'])
+
+    def _state(self):
+        """State of the synchronization in the store"""
+        return self.store.get(self.key)
+
+    def poll(self):
+        """Retrieve the publications indexed since the last poll and update
+        the high-water mark.
+
+        Returns:
+            tuple(list[Publication], datetime.datetime): new publications and
+            new high-water mark.
+        """
+        api = self._api or RadarlyApi.get_default_api()
+        started_at = datetime.now(pytz.utc)
+        state = self._state() or {}
+        watermark = self.watermark
+        recent = collections.OrderedDict.fromkeys(state.get('recent', []))
+
+        parameter = self.parameter.thaw().pagination(
+            0, self.parameter.get('limit', 25)
+        )
+        if watermark is not None:
+            created_after = _utc(watermark) - self.overlap
+            # intersect with the indexation range given by the user
+            user_range = self.parameter.get('date') or {}
+            if user_range.get('createdAfter'):
+                created_after = max(created_after,
+                                    _utc(parse(user_range['createdAfter'])))
+            parameter.creation_date(
+                created_before=user_range.get('createdBefore'),
+                created_after=created_after,
+            )
+
+        publications = []
+        for publication in Publication.fetch_all(self.project_id,
+                                                 parameter, api=api):
+            if publication['uid'] in recent:
+                continue
+            recent[publication['uid']] = None
+            publications.append(publication)
+        while len(recent) > self.recent_size:
+            recent.popitem(last=False)
+
+        self.store.set(self.key, dict(
+            watermark=started_at.isoformat(),
+            recent=list(recent),
+        ))
+        return publications, started_at
@@ -5,6 +5,7 @@ current user of the API.
 """
 
 from .api import RadarlyApi
+from .asyncapi import AsyncRadarlyApi
 from .model import SourceModel
 from .project import InfoProject
 
@@ -61,3 +62,20 @@ class User(SourceModel):
             user_data = api.get(api.router.user['me'])
             return cls(user_data)
         raise ValueError("The 'uid' argument must be set to 'me'.")
+
+    @classmethod
+    async def afind(cls, uid, api=None):
+        """Coroutine version of ``find``.
+
+        Args:
+            uid (string): must be set to ``me``
+            api (AsyncRadarlyApi, optional): API used to make the
+                request. If None, the default asynchronous API will be used.
+        Returns:
+            User:
+        """
+        api = api or AsyncRadarlyApi.get_default_api()
+        if uid == 'me':
+            user_data = await api.get(api.router.user['me'])
+            return cls(user_data)
+        raise ValueError("The 'uid' argument must be set to 'me'.")
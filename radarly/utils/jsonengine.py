@@ -0,0 +1,234 @@
+"""
+JSON engines used to serialize the payloads sent to the API and to decode
+its responses. The fastest engine installed is used: ``orjson``, then
+``ujson`` and finally the ``json`` module of the standard library. The
+engine can be chosen with ``set_engine``.
+
+>>> from radarly.utils.jsonengine import set_engine
+>>> set_engine('json')
+
+Whatever the engine, the objects which are not natively serializable (the
+objects of ``radarly-py``, the datetimes and the timezones) are serialized
+following the rules of ``RadarlyEncoder`` and the hooks given to ``loads``
+(as the ``RadarlyDecoder``) receive the same pairs as with ``json.loads``.
+
+Only the ``json`` engine calls the hooks while parsing the document. The
+other engines load the whole document first, so that the decoding of a
+response (see ``RadarlyDecoder.decode``) takes two passes. It is still
+faster than a single pass of ``json``; use ``set_engine('json')`` if the
+responses must be decoded in a single pass.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class JsonEngine:
+    """JSON engine relying on the ``json`` module of the standard library.
+    It is always available and the other engines fall back on it for the
+    options they don't support. Its hooks are called while parsing the
+    document (``native_hooks``) whereas the other engines apply them on the
+    loaded document."""
+    name = 'json'
+    native_hooks = True
+
+    def __repr__(self):
+        return '<JsonEngine.name={}>'.format(self.name)
+
+    def loads(self, content, object_pairs_hook=None):
+        """Deserialize a JSON document.
+
+        Args:
+            content (bytes or str): JSON document
+            object_pairs_hook (callable, optional): function called with the
+                list of the (key, value) pairs of each object of the
+                document, from the innermost to the outermost. Its result
+                replaces the object.
+        Raises:
+            ValueError: raised if the document is not valid JSON
+        Returns:
+            object:
+        """
+        return json.loads(content, object_pairs_hook=object_pairs_hook)
+
+    def dumps(self, obj, default=None, **kwargs):
+        """Serialize an object into a JSON string.
+
+        Args:
+            obj (object): object to serialize
+            default (callable, optional): function called on the objects
+                which are not natively serializable. It must return a
+                serializable version of the object or raise a
+                ``TypeError``.
+            **kwargs: keywords arguments supported by ``json.dumps``
+        Returns:
+            str:
+        """
+        return json.dumps(obj, default=default, **kwargs)
+
+    def dumpb(self, obj, default=None, **kwargs):
+        """Same as ``dumps`` but return UTF-8 encoded bytes, which can be
+        sent as payload of a request.
+
+        Returns:
+            bytes:
+        """
+        return self.dumps(obj, default=default, **kwargs).encode('utf-8')
+
+
+class OrjsonEngine(JsonEngine):
+    """JSON engine relying on ``orjson``. The ``sort_keys`` and ``indent``
+    (only 2) options are supported, the other options of ``json.dumps``
+    fall back on the standard library. ``orjson`` has no hook: the hooks
+    are applied on the loaded document, in a second pass."""
+    name = 'orjson'
+    native_hooks = False
+
+    def loads(self, content, object_pairs_hook=None):
+        data = orjson.loads(content)
+        if object_pairs_hook is None:
+            return data
+        return _apply_hook(data, object_pairs_hook)
+
+    def dumps(self, obj, default=None, **kwargs):
+        option = self._option(kwargs)
+        if option is None:
+            return super().dumps(obj, default=default, **kwargs)
+        return orjson.dumps(obj, default=default, option=option).decode('utf-8')
+
+    def dumpb(self, obj, default=None, **kwargs):
+        option = self._option(kwargs)
+        if option is None:
+            return super().dumpb(obj, default=default, **kwargs)
+        return orjson.dumps(obj, default=default, option=option)
+
+    @staticmethod
+    def _option(kwargs):
+        """Translate the keywords arguments of ``json.dumps`` into orjson
+        options. Return None if some of them are not supported."""
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        for key, value in kwargs.items():
+            if key == 'sort_keys':
+                option |= orjson.OPT_SORT_KEYS if value else 0
+            elif key == 'indent' and value in (None, 2):
+                option |= orjson.OPT_INDENT_2 if value else 0
+            else:
+                return None
+        return option
+
+
+class UjsonEngine(JsonEngine):
+    """JSON engine relying on ``ujson``. The ``sort_keys``, ``indent`` and
+    ``ensure_ascii`` options are supported, the other options of
+    ``json.dumps`` fall back on the standard library. As with ``orjson``,
+    the hooks are applied on the loaded document, in a second pass."""
+    name = 'ujson'
+    native_hooks = False
+
+    def loads(self, content, object_pairs_hook=None):
+        data = ujson.loads(content)
+        if object_pairs_hook is None:
+            return data
+        return _apply_hook(data, object_pairs_hook)
+
+    def dumps(self, obj, default=None, **kwargs):
+        if any(key not in ['sort_keys', 'indent', 'ensure_ascii']
+               for key in kwargs):
+            return super().dumps(obj, default=default, **kwargs)
+        if kwargs.get('indent') is None:
+            kwargs.pop('indent', None)
+        return ujson.dumps(obj, default=default,
+                           escape_forward_slashes=False, **kwargs)
+
+
+ENGINES = dict(
+    orjson=(OrjsonEngine, lambda: orjson is not None),
+    ujson=(UjsonEngine, lambda: ujson is not None),
+    json=(JsonEngine, lambda: True),
+)
+_ENGINE = None
+
+
+def get_engine():
+    """Get the JSON engine in use. By default, it is the first installed
+    engine among ``orjson``, ``ujson`` and ``json``.
+
+    Returns:
+        JsonEngine:
+    """
+    global _ENGINE # pylint: disable=W0603
+    if _ENGINE is None:
+        for name in ['orjson', 'ujson', 'json']:
+            engine_class, available = ENGINES[name]
+            if available():
+                _ENGINE = engine_class()
+                break
+    return _ENGINE
+
+
+def set_engine(name):
+    """Choose the JSON engine used by ``radarly-py``.
+
+    Args:
+        name (str): name of the engine (``'orjson'``, ``'ujson'`` or
+            ``'json'``). If None, the default engine is restored.
+    Raises:
+        ValueError: raised if the engine is unknown
+        ImportError: raised if the package of the engine is not installed
+    Returns:
+        JsonEngine: the new engine
+    """
+    global _ENGINE # pylint: disable=W0603
+    if name is None:
+        _ENGINE = None
+        return get_engine()
+    if name not in ENGINES:
+        raise ValueError("Unknown JSON engine '{}'. Available engines: "
+                         "{}.".format(name, ', '.join(ENGINES)))
+    engine_class, available = ENGINES[name]
+    if not available():
+        raise ImportError("The '{0}' JSON engine requires the {0} "
+                          "package.".format(name))
+    _ENGINE = engine_class()
+    return _ENGINE
+
+
+def _apply_hook(data, hook):
+    """Call an ``object_pairs_hook`` on each object of a loaded document,
+    from the innermost to the outermost, as ``json.loads`` does"""
+    if isinstance(data, dict):
+        return _hook_dict(data, hook)
+    if isinstance(data, list):
+        return _hook_list(data, hook)
+    return data
+
+
+def _hook_dict(data, hook):
+    """Apply the hook on a loaded object and on its children. The children
+    are replaced in place and the hook receives the items of the object,
+    which avoids building a list of pairs for each object."""
+    for key, value in data.items():
+        if value.__class__ is dict:
+            data[key] = _hook_dict(value, hook)
+        elif value.__class__ is list:
+            _hook_list(value, hook)
+    return hook(data.items())
+
+
+def _hook_list(data, hook):
+    """Apply the hook on the objects of a loaded list"""
+    for index, value in enumerate(data):
+        if value.__class__ is dict:
+            data[index] = _hook_dict(value, hook)
+        elif value.__class__ is list:
+            data[index] = _hook_list(value, hook)
+    return data
@@ -2,13 +2,18 @@
 Hooks used to parse JSON data contained in the response of a request.
 """
 
+import calendar
+import copy
 import re
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
+from functools import lru_cache
 import json
 
 import pytz
 from dateutil.parser import parse
 
+from .jsonengine import get_engine
 from .misc import to_snake_case
 
 
@@ -19,69 +24,879 @@ _BLACKLIST_PATH = [
 ]
 
 
-def decode_value(value, key=None):
-    """Try to convert a string into a specific Python object"""
-    pattern_date = re.compile(
-        r'^ *\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}.\d{3}Z *$'
+_EPOCH = datetime(1970, 1, 1)
+_MILLISECOND = timedelta(milliseconds=1)
+_PATTERN_DATE = re.compile(
+    r'^ *(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2}).(\d{3})Z *$'
+)
+
+
+def decode_value(value, key=None, date_parser=None):
+    """Try to convert a string into a specific Python object. The dates
+    are converted by ``date_parser`` (``parse_date`` by default)."""
+    if isinstance(value, str):
+        if _PATTERN_DATE.match(value):
+            return (date_parser or parse_date)(value)
+        elif key == 'timezone':
+            return parse_timezone(value)
+    return value
+
+
+@lru_cache(maxsize=4096)
+def parse_date(value):
+    """Parse a date with the format used by the API
+    (``YYYY-MM-DDTHH:MM:SS.mmmZ``) into a naive datetime. The dates already
+    parsed are cached, given that a response often contains the same date
+    many times. The dates which don't match this format are parsed by
+    ``dateutil``.
+
+    Args:
+        value (str): date to parse
+    Returns:
+        datetime.datetime:
+    """
+    match = _PATTERN_DATE.match(value)
+    if match:
+        year, month, day, hour, minute, second, millisecond = map(
+            int, match.groups()
+        )
+        try:
+            return datetime(year, month, day, hour, minute, second,
+                            millisecond * 1000)
+        except ValueError:
+            pass
+    return parse(value.strip(), ignoretz=True)
+
+
+@lru_cache(maxsize=4096)
+def parse_epoch(value):
+    """Parse a date with the format used by the API into a number of
+    milliseconds since the epoch (UTC), without building a ``datetime``.
+    The dates which don't match this format are parsed by ``dateutil``.
+
+    Args:
+        value (str): date to parse
+    Returns:
+        int:
+    """
+    match = _PATTERN_DATE.match(value)
+    if match is None:
+        return to_epoch(parse_date(value))
+    year, month, day, hour, minute, second, millisecond = map(
+        int, match.groups()
     )
+    if not (year and 1 <= month <= 12 and 1 <= day <= 28 and hour < 24 and
+            minute < 60 and second < 60) and \
+            not _is_valid(year, month, day, hour, minute, second):
+        # invalid dates are handled (and rejected) as by ``parse_date``
+        return to_epoch(parse_date(value))
+    # number of days since the epoch of a date of the proleptic Gregorian
+    # calendar (see http://howardhinnant.github.io/date_algorithms.html)
+    year -= month <= 2
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    day_of_era = (year_of_era * 365 + year_of_era // 4 - year_of_era // 100 +
+                  day_of_year)
+    days = era * 146097 + day_of_era - 719468
+    return (((days * 24 + hour) * 60 + minute) * 60 + second) * 1000 + \
+        millisecond
+
+
+def _is_valid(year, month, day, hour, minute, second):
+    """Check the fields of a date matching the format used by the API"""
+    return year > 0 and 1 <= month <= 12 and hour < 24 and minute < 60 and \
+        second < 60 and 1 <= day <= calendar.monthrange(year, month)[1]
+
 
-    if isinstance(value, str) and pattern_date.match(value):
-        return parse(value.strip(), ignoretz=True)
-    elif key == 'timezone' and value in pytz.all_timezones_set:
-        return pytz.timezone(value)
+def to_epoch(value):
+    """Convert a datetime into a number of milliseconds since the epoch.
+    The naive datetimes are considered as UTC datetimes, as those decoded
+    from the API.
+
+    Args:
+        value (datetime.datetime):
+    Returns:
+        int:
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(pytz.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // _MILLISECOND
+
+
+def from_epoch(value):
+    """Convert a number of milliseconds since the epoch into a naive UTC
+    datetime, as those decoded from the API.
+
+    Args:
+        value (int):
+    Returns:
+        datetime.datetime:
+    """
+    return _EPOCH + timedelta(milliseconds=value)
+
+
+DATE_PARSERS = dict(
+    datetime=parse_date,
+    epoch=parse_epoch,
+)
+
+
+def date_parser(timestamps):
+    """Get the function parsing the dates for a decoding option.
+
+    Args:
+        timestamps (str): ``'datetime'`` to decode the dates into naive UTC
+            datetimes, ``'epoch'`` to decode them into numbers of
+            milliseconds since the epoch.
+    Raises:
+        ValueError: raised if the option is unknown
+    Returns:
+        callable:
+    """
+    try:
+        return DATE_PARSERS[timestamps or 'datetime']
+    except KeyError:
+        raise ValueError("'timestamps' must be one of {}, not {!r}.".format(
+            sorted(DATE_PARSERS), timestamps
+        ))
 
+
+_TIMEZONE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1024)
+def parse_timezone(value):
+    """Convert the name of a timezone into a timezone object. The value is
+    returned unchanged if it is not a known timezone. The cache of ``pytz``
+    is filled under a lock: two threads loading the same timezone would
+    otherwise get two distinct (and unequal) timezone objects.
+
+    Args:
+        value (str): name of the timezone
+    Returns:
+        pytz.tzinfo.BaseTzInfo or str:
+    """
+    if value in pytz.all_timezones_set:
+        with _TIMEZONE_LOCK:
+            return pytz.timezone(value)
     return value
 
 
+snake_key = lru_cache(maxsize=8192)(to_snake_case)
+snake_key.__doc__ = """Cached version of ``to_snake_case``, used to convert
+the keys of the JSON objects (a response uses the same keys over and over)"""
+
+
 def radarly_decoder(obj):
     """Hook which can be used in the `dumps` function of `json` module."""
     return dict(
-        (to_snake_case(key), decode_value(obj[key], key)) for key in obj
+        (snake_key(key), decode_value(obj[key], key)) for key in obj
     )
 
 
 class RadarlyEncoder(json.JSONEncoder):
     """Encoder to serialize an object which inherits from SourceModel"""
     def default(self, obj):
-        if 'radarly' in str(type(obj)):
-            return dict(
-                (key, dict(obj)[key]) for key in obj.keys()
-                if not key.startswith('_') and not callable(dict(obj)[key])
+        return encode_default(obj)
+
+
+def encode_default(obj):
+    """Serialize the objects which are not natively serializable: the objects
+    of ``radarly-py``, the timezones and the datetimes. This function is the
+    ``default`` function given to the JSON engines (see
+    ``radarly.utils.jsonengine``).
+
+    Args:
+        obj (object): object to serialize
+    Raises:
+        TypeError: raised if the object is not serializable
+    Returns:
+        object: serializable version of the object
+    """
+    if 'radarly' in str(type(obj)):
+        return dict(
+            (key, dict(obj)[key]) for key in obj.keys()
+            if not key.startswith('_') and not callable(dict(obj)[key])
+        )
+    if 'pytz.' in str(type(obj)):
+        return obj.zone
+    elif isinstance(obj, datetime):
+        return obj.strftime('%Y-%m-%dT%H:%M:%SZ')
+    raise TypeError('Object of type {} is not JSON serializable'.format(
+        obj.__class__.__name__
+    ))
+
+
+class InternTable:
+    """Bounded table of the values shared between the decoded documents.
+    A project repeats the same few values (platforms, langs, tones, country
+    codes, focus identifiers...) in millions of publications: interning them
+    makes all the publications point to the same string (or integer) object
+    instead of one copy per publication. Only the strings and the integers
+    are interned.
+
+    When the table is full, the oldest value is evicted: it stays shared by
+    the documents already decoded, but the next occurrences are interned
+    again as a new value. A table whose ``maxsize`` is 0 doesn't intern
+    any value.
+
+    >>> table = InternTable(maxsize=10000)
+    >>> table.intern('twitter') is table.intern(''.join(['twit', 'ter']))
+    True
+
+    Args:
+        maxsize (int, optional): maximum number of values of the table.
+            Default to 65536.
+    """
+    def __init__(self, maxsize=65536):
+        self.maxsize = maxsize
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return '<InternTable.length={}.maxsize={}>'.format(len(self),
+                                                           self.maxsize)
+
+    def __len__(self):
+        return len(self._values)
+
+    def intern(self, value):
+        """Get the shared object equal to a value. The values of a list
+        are interned one by one.
+
+        Args:
+            value (object): value to intern
+        Returns:
+            object: the shared object, or the value itself if it can't be
+            interned.
+        """
+        cls = value.__class__
+        if cls is str or cls is int:
+            shared = self._values.get(value)
+            if shared is not None:
+                return shared
+            if self.maxsize <= 0:
+                return value
+            with self._lock:
+                if len(self._values) >= self.maxsize:
+                    del self._values[next(iter(self._values))]
+                return self._values.setdefault(value, value)
+        if cls is list:
+            return [self.intern(item) for item in value]
+        return value
+
+    def clear(self):
+        """Remove all the values of the table"""
+        with self._lock:
+            self._values.clear()
+
+
+INTERN_TABLE = InternTable()
+
+
+class RadarlyDecoder:
+    """Hook decoding a JSON document in a single pass: it must be given as
+    ``object_pairs_hook`` to ``json.loads`` and then the ``finish`` method
+    must be called on the loaded document. The keys are converted into
+    snake_case format and the values are decoded (see ``decode_value``) as
+    soon as an object is parsed, so that the document is never copied.
+
+    The hook doesn't know where an object is located in the document, so
+    the keys of the objects located at a blacklisted path are converted too.
+    The original keys of the converted objects are stored on the side and
+    ``finish`` restores the blacklisted objects, walking only the
+    blacklisted paths. For the same reason, when some paths are
+    blacklisted, the hook only collects the dates: ``finish`` parses those
+    which are not located in a blacklisted object, so that the dates of the
+    blacklisted objects are kept as sent by the API (and never parsed). A
+    decoder must be used for only one document.
+
+    If a ``DecodingSchema`` is given, only the values located at the paths
+    declared by the schema are decoded, by ``finish``: the other values are
+    left untouched. The values located at the ``intern`` paths of the schema
+    (or of the decoder) are interned in ``intern_table`` (see
+    ``InternTable``), so that the same values are shared across the
+    documents.
+
+    >>> decoder = RadarlyDecoder(blacklist=[['radar', 'tag']])
+    >>> data = decoder.finish(json.loads(document, object_pairs_hook=decoder))
+
+    Args:
+        blacklist (list[list[str]]): paths of the objects which must not be
+            converted. Example: ``[['radar', 'tag', 'custom']]``
+        schema (DecodingSchema): schema of the document. If given,
+            ``blacklist`` and ``intern`` are ignored.
+        intern (list[list[str]]): paths of the values to intern. Example:
+            ``[['hits', 'origin', 'platform']]``
+        intern_table (InternTable): table storing the interned values.
+            Default to ``INTERN_TABLE``, shared by all the decoders.
+        timestamps (str): ``'datetime'`` to decode the dates into
+            ``datetime`` objects, ``'epoch'`` to decode them into numbers of
+            milliseconds since the epoch (see ``date_parser``). Default to
+            ``'datetime'``.
+    """
+    def __init__(self, blacklist=None, schema=None, intern=None,
+                 intern_table=None, timestamps='datetime'):
+        if schema is None:
+            self.trie = compile_blacklist(blacklist, intern)
+            self._decode = True
+            self._track = bool(blacklist)
+        else:
+            self.trie = schema.trie
+            self._decode = False
+            self._track = bool(schema.blacklist)
+        self.intern_table = INTERN_TABLE if intern_table is None \
+            else intern_table
+        self._date_parser = date_parser(timestamps)
+        self._converted = []
+        self._raw_keys = []
+        self._key_sets = {}
+        self._dates = []
+
+    def __call__(self, pairs):
+        obj = {}
+        changed = False
+        if self._decode and self._track:
+            defer, match = self._dates.append, _PATTERN_DATE.match
+            for key, value in pairs:
+                snake = snake_key(key)
+                changed = changed or snake != key
+                if value.__class__ is str:
+                    if match(value):
+                        defer((obj, snake, value))
+                    elif key == 'timezone':
+                        value = parse_timezone(value)
+                elif value.__class__ is list:
+                    value = self._defer_list(value, key)
+                obj[snake] = value
+        elif self._decode:
+            for key, value in pairs:
+                snake = snake_key(key)
+                changed = changed or snake != key
+                if isinstance(value, list):
+                    obj[snake] = _decode_list(value, key, self._date_parser)
+                elif isinstance(value, dict):
+                    obj[snake] = value
+                else:
+                    obj[snake] = decode_value(value, key, self._date_parser)
+        else:
+            for key, value in pairs:
+                snake = snake_key(key)
+                changed = changed or snake != key
+                obj[snake] = value
+        if self._track and (changed or len(obj) != len(pairs)):
+            self._record(obj, pairs)
+        return obj
+
+    def _defer_list(self, data, key):
+        """Decode in place the scalar values of a list, except the dates
+        which are collected for ``finish`` (the objects of the list are
+        already decoded by the hook)"""
+        for index, value in enumerate(data):
+            if value.__class__ is str:
+                if _PATTERN_DATE.match(value):
+                    self._dates.append((data, index, value))
+                elif key == 'timezone':
+                    data[index] = parse_timezone(value)
+            elif value.__class__ is list:
+                self._defer_list(value, key)
+        return data
+
+    def _record(self, obj, pairs):
+        """Store the original keys of a converted object"""
+        if len(obj) != len(pairs):
+            raw_keys = list(pairs)
+        else:
+            raw_keys = tuple(key for key, _ in pairs)
+            raw_keys = self._key_sets.setdefault(raw_keys, raw_keys)
+        self._converted.append(obj)
+        self._raw_keys.append(raw_keys)
+
+    def child(self, key):
+        """Build a decoder of the values located under ``key`` in the
+        documents of this decoder (as the items of the ``hits`` array of a
+        search), for the documents read piece by piece.
+
+        Args:
+            key (str): original key of the value
+        Returns:
+            RadarlyDecoder:
+        """
+        decoder = copy.copy(self)
+        decoder.trie = self.trie.get(key) if self.trie else None
+        decoder._track = self._track and decoder.trie is not None
+        decoder._converted, decoder._raw_keys, decoder._key_sets = [], [], {}
+        decoder._dates = []
+        return decoder
+
+    def decode_member(self, data, key):
+        """Decode a single member of a loaded (and not converted) object,
+        the other members being left untouched. The decoder itself is not
+        modified, so that it can decode the members of many objects.
+
+        Args:
+            data (dict): loaded object
+            key (str): original key of the member
+        Returns:
+            object: the decoded value of the member
+        """
+        value = data[key]
+        if value.__class__ is not dict and value.__class__ is not list:
+            node = self.trie.get(key) if self.trie else None
+            kind = node and node.get(None)
+            if kind in ('date', 'timezone'):
+                return _decode_kind(value, kind, self._date_parser)
+            if kind == 'intern':
+                return self.intern_table.intern(value)
+            if node is None:
+                if self._decode:
+                    return decode_value(value, key, self._date_parser)
+                return value
+        decoder = copy.copy(self)
+        decoder._converted, decoder._raw_keys, decoder._key_sets = [], [], {}
+        decoder._dates = []
+        decoded = decoder.finish(decoder.convert({key: value}))
+        return decoded[snake_key(key)]
+
+    def convert(self, data):
+        """Decode a document loaded without this decoder as hook (by a JSON
+        engine which doesn't support hooks). The objects are converted as
+        the hook would do, in a single walk of the document, except that
+        the blacklisted objects are left untouched (the path of each object
+        is known here); ``finish`` must then be called on the result.
+
+        Args:
+            data (object): loaded document
+        Returns:
+            object: the converted document
+        """
+        if data.__class__ is dict:
+            return self._convert_dict(data, self.trie)
+        if data.__class__ is list:
+            return self._convert_list(data, None, self.trie)
+        if self._decode:
+            return decode_value(data, None, self._date_parser)
+        return data
+
+    def _convert_dict(self, data, node):
+        """Convert a loaded object and its children. ``node`` is the node
+        of the trie matching the path of the object (None if no path goes
+        through the object)."""
+        obj = {}
+        changed = False
+        decode = self._decode
+        for key, value in data.items():
+            snake = snake_key(key)
+            if snake != key:
+                changed = True
+            child = node.get(key) if node is not None else None
+            if child is not None and child.get(None) == 'blacklist':
+                value = self._convert_blacklisted(value, key)
+            elif value.__class__ is dict:
+                value = self._convert_dict(value, child)
+            elif value.__class__ is list:
+                value = self._convert_list(value, key, child)
+            elif decode:
+                value = decode_value(value, key, self._date_parser)
+            obj[snake] = value
+        if self._track and (changed or len(obj) != len(data)):
+            self._record(obj, data.items())
+        return obj
+
+    def _convert_list(self, data, key, node):
+        """Convert in place the items of a loaded list"""
+        decode = self._decode
+        for index, value in enumerate(data):
+            if value.__class__ is dict:
+                data[index] = self._convert_dict(value, node)
+            elif value.__class__ is list:
+                self._convert_list(value, key, node)
+            elif decode:
+                data[index] = decode_value(value, key, self._date_parser)
+        return data
+
+    def _convert_blacklisted(self, data, key):
+        """Convert a value located at a blacklisted path: the objects are
+        left untouched, the other values are decoded"""
+        if data.__class__ is list:
+            for index, value in enumerate(data):
+                data[index] = self._convert_blacklisted(value, key)
+            return data
+        if data.__class__ is dict or not self._decode:
+            return data
+        return decode_value(data, key, self._date_parser)
+
+    def decode(self, content, engine=None):
+        """Load and decode a JSON document. The decoder is given as hook to
+        the engines supporting hooks natively, so that the document is
+        decoded while it is parsed. The other engines (``orjson``,
+        ``ujson``) can't call a hook: the loaded document is converted with
+        ``convert``, which walks it a second time. This second walk is kept
+        because these engines parse much faster than ``json``: on a search
+        response, ``orjson`` with ``convert`` is still faster and uses less
+        memory at its peak than ``json`` with the hook. Select the ``json``
+        engine (see ``set_engine``) to decode in a single pass.
+
+        Args:
+            content (bytes or str): JSON document
+            engine (JsonEngine, optional): engine used to load the document.
+                If None, the engine in use (see ``get_engine``) is used.
+        Returns:
+            object: the decoded document
+        """
+        engine = engine or get_engine()
+        if engine.native_hooks:
+            data = engine.loads(content, object_pairs_hook=self)
+        else:
+            data = self.convert(engine.loads(content))
+        return self.finish(data)
+
+    def finish(self, data):
+        """Restore the blacklisted objects of a document and, if the decoder
+        uses a schema, decode the values declared by the schema.
+
+        Args:
+            data (object): document loaded with this decoder as hook
+        Returns:
+            object: the decoded document
+        """
+        inside = ()
+        if self.trie is not None:
+            blacklisted = []
+            self._find(data, self.trie, blacklisted)
+            if blacklisted:
+                inside = _blacklisted_ids(
+                    parent[key] for parent, key in blacklisted
+                )
+                raw_keys = self._lookup(inside)
+                for parent, key in blacklisted:
+                    parent[key] = _restore(parent[key], raw_keys)
+        dates, parser = self._dates, self._date_parser
+        for container, key, value in dates:
+            if id(container) in inside:
+                continue
+            # a date overwritten by a duplicated key is parsed all the same
+            parsed = parser(value)
+            if container[key] is value:
+                container[key] = parsed
+        self._converted, self._raw_keys, self._key_sets = [], [], {}
+        self._dates = []
+        return data
+
+    def _find(self, data, node, blacklisted):
+        """Walk the paths of the trie going through data, decode the values
+        located at the paths of dates and timezones, intern the values
+        located at the ``intern`` paths and collect the blacklisted objects,
+        as (parent, key) couples"""
+        if isinstance(data, list):
+            items = data
+        elif isinstance(data, dict):
+            items = (data,)
+        else:
+            return
+        entries = [
+            (snake_key(key), child_node, child_node.get(None))
+            for key, child_node in node.items() if key is not None
+        ]
+        for item in items:
+            if not isinstance(item, dict):
+                if isinstance(item, list):
+                    self._find(item, node, blacklisted)
+                continue
+            for snake, child_node, kind in entries:
+                if snake not in item:
+                    continue
+                if kind is None:
+                    self._find(item[snake], child_node, blacklisted)
+                elif kind == 'blacklist':
+                    blacklisted.append((item, snake))
+                elif kind == 'intern':
+                    item[snake] = self.intern_table.intern(item[snake])
+                else:
+                    item[snake] = _decode_kind(item[snake], kind,
+                                               self._date_parser)
+
+    def _lookup(self, wanted):
+        """Get the original keys of the objects contained in the
+        blacklisted objects.
+
+        Args:
+            wanted (set): identifiers of the blacklisted objects and of
+                their children (see ``_blacklisted_ids``)
+        Returns:
+            dict: original keys of the objects, by identifier of object
+        """
+        return {
+            id(obj): raw_keys
+            for obj, raw_keys in zip(self._converted, self._raw_keys)
+            if id(obj) in wanted
+        }
+
+
+def _blacklisted_ids(values):
+    """Get the identifiers of the blacklisted objects, and of the objects and
+    lists they contain, given the values located at the blacklisted paths.
+    As with ``snake_dict``, only the objects located at a blacklisted path
+    are blacklisted: the lists found at the path are walked and the other
+    values are decoded as usual.
+
+    Args:
+        values (iterable): values located at the blacklisted paths
+    Returns:
+        set:
+    """
+    found, stack = [], list(values)
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            found.append(item)
+        elif isinstance(item, list):
+            stack.extend(item)
+    inside = set()
+    while found:
+        item = found.pop()
+        if isinstance(item, dict):
+            inside.add(id(item))
+            found.extend(item.values())
+        elif isinstance(item, list):
+            inside.add(id(item))
+            found.extend(item)
+    return inside
+
+
+def _restore(data, raw_keys):
+    """Rebuild the objects located at a blacklisted path (walking the lists
+    found at the path) as they were before their conversion"""
+    if isinstance(data, list):
+        for index, item in enumerate(data):
+            data[index] = _restore(item, raw_keys)
+        return data
+    if isinstance(data, dict):
+        return _raw(data, raw_keys)
+    return data
+
+
+def _raw(data, raw_keys):
+    """Rebuild an object as it was before its conversion by a
+    ``RadarlyDecoder``
+
+    Args:
+        data (object): converted object
+        raw_keys (dict): original keys of the converted objects, by
+            identifier of object
+    Returns:
+        object:
+    """
+    if isinstance(data, list):
+        return [_raw(item, raw_keys) for item in data]
+    if not isinstance(data, dict):
+        return encode_value(data)
+    keys = raw_keys.get(id(data))
+    if keys is None:
+        pairs = data.items()
+    elif isinstance(keys, list):
+        pairs = keys
+    else:
+        pairs = zip(keys, data.values())
+    return {key: _raw(value, raw_keys) for key, value in pairs}
+
+
+def _decode_kind(data, kind, date_parser=parse_date):
+    """Decode a value declared as a date or a timezone by a schema"""
+    if isinstance(data, list):
+        return [_decode_kind(item, kind, date_parser) for item in data]
+    if not isinstance(data, str):
+        return data
+    if kind == 'date':
+        return date_parser(data) if _PATTERN_DATE.match(data) else data
+    return parse_timezone(data)
+
+
+def _decode_list(data, key, date_parser=None):
+    """Decode the scalar values of a list (the objects of the list are
+    already decoded by the hook)"""
+    return [
+        _decode_list(item, key, date_parser) if isinstance(item, list)
+        else item if isinstance(item, dict)
+        else decode_value(item, key, date_parser)
+        for item in data
+    ]
+
+
+def encode_value(value):
+    """Convert back a value decoded by ``decode_value`` into its JSON
+    representation"""
+    if isinstance(value, datetime):
+        return '{}.{:03d}Z'.format(value.strftime('%Y-%m-%dT%H:%M:%S'),
+                                   value.microsecond // 1000)
+    if isinstance(value, pytz.tzinfo.BaseTzInfo) or value is pytz.utc:
+        return value.zone
+    return value
+
+
+class DecodingSchema:
+    """Declaration of the fields of a document which must be decoded. Only
+    the values located at the declared paths are converted (the keys are
+    always converted into snake_case format), so that the strings of the
+    document don't need to be tested one by one. The paths are written with
+    the original keys, separated by dots; the lists are ignored in the
+    paths.
+
+    >>> schema = DecodingSchema(dates=['hits.date'],
+    ...                         blacklist=['hits.radar.tag'])
+    >>> decoder = schema.decoder()
+    >>> data = decoder.finish(json.loads(document, object_pairs_hook=decoder))
+
+    Args:
+        dates (list[str], optional): paths of the dates
+        timezones (list[str], optional): paths of the timezones names
+        blacklist (list[str], optional): paths of the objects which must be
+            kept as is
+        intern (list[str], optional): paths of the values to intern (see
+            ``InternTable``)
+        generic (bool, optional): if True, all the values of the document
+            are decoded as by the generic decoder and the schema only adds
+            its ``blacklist`` and ``intern`` paths. It is used for the
+            documents whose dates can't be listed. Default to False.
+    """
+    def __init__(self, dates=None, timezones=None, blacklist=None,
+                 intern=None, generic=False):
+        self.generic = generic
+        self.dates = list(dates or [])
+        self.timezones = list(timezones or [])
+        self.blacklist = list(blacklist or [])
+        self.intern = list(intern or [])
+        self.trie = _compile_paths(tuple(
+            (tuple(path.split('.')), kind)
+            for kind, paths in [('date', self.dates),
+                                ('timezone', self.timezones),
+                                ('blacklist', self.blacklist),
+                                ('intern', self.intern)]
+            for path in paths
+        ))
+
+    def __repr__(self):
+        return ('<DecodingSchema.dates={}.timezones={}.blacklist={}.'
+                'intern={}>').format(len(self.dates), len(self.timezones),
+                                     len(self.blacklist), len(self.intern))
+
+    def decoder(self, timestamps='datetime', intern=None, intern_table=None):
+        """Build a decoder of a document following this schema.
+
+        Args:
+            timestamps (str, optional): decoding of the dates (see
+                ``RadarlyDecoder``). Default to ``'datetime'``.
+            intern (list[str] or bool, optional): paths of values to intern
+                in addition to the ``intern`` paths of the schema. If
+                False, no value is interned. Default to None.
+            intern_table (InternTable, optional): table storing the
+                interned values. Default to ``INTERN_TABLE``.
+        Returns:
+            RadarlyDecoder:
+        """
+        schema = self
+        if intern is False:
+            schema = DecodingSchema(self.dates, self.timezones,
+                                    self.blacklist, generic=self.generic)
+        elif intern:
+            schema = DecodingSchema(
+                self.dates, self.timezones, self.blacklist,
+                intern=self.intern + [
+                    path for path in intern if path not in self.intern
+                ],
+                generic=self.generic,
             )
-        if 'pytz.' in str(type(obj)):
-            return obj.zone
-        elif isinstance(obj, datetime):
-            return obj.strftime('%Y-%m-%dT%H:%M:%SZ')
-        return json.JSONEncoder.default(self, obj)
+        if schema.generic:
+            return RadarlyDecoder(
+                blacklist=_BLACKLIST_PATH + [
+                    path.split('.') for path in schema.blacklist
+                ],
+                intern=[path.split('.') for path in schema.intern],
+                intern_table=intern_table,
+                timestamps=timestamps,
+            )
+        return RadarlyDecoder(schema=schema, intern_table=intern_table,
+                              timestamps=timestamps)
+
 
+def compile_blacklist(blacklist, intern=None):
+    """Build the trie matching some paths of a dictionary. Each node of the
+    trie is a dictionary whose keys are the keys of the path; the node ending
+    a path contains the key None, whose value is the kind of the path
+    (``'blacklist'`` or ``'intern'`` here, ``'date'`` or ``'timezone'`` for
+    the tries built by a ``DecodingSchema``).
+
+    Args:
+        blacklist (list[list[str]]): paths to match.
+        intern (list[list[str]], optional): paths of the values to intern.
+    Returns:
+        dict: root of the trie
+    """
+    if not (blacklist or intern):
+        return None
+    return _compile_paths(tuple(
+        [(tuple(path), 'blacklist') for path in blacklist or []] +
+        [(tuple(path), 'intern') for path in intern or []]
+    ))
 
-def snake_dict(data, blacklist=None, path=[]):
+
+@lru_cache(maxsize=64)
+def _compile_paths(paths):
+    """Build the trie of some paths, given as a tuple of (path, kind)
+    couples. See ``compile_blacklist``."""
+    root = {}
+    for path, kind in paths:
+        node = root
+        for key in path:
+            node = node.setdefault(key, {})
+        node[None] = kind
+    return root
+
+
+def snake_dict(data, blacklist=None, path=None):
     """Convert all the keys of a dictionary into snake case format. It will
     also convert some values into Python object (like all the dates or timezone
     field).
     Map automatically if the element is a list. Some path can be blacklisted
     and so they will not be converted in to snake_case format.
 
+    The conversion of the keys is cached and the blacklist is compiled into a
+    trie which is walked alongside the data, so that the cost of the
+    conversion only depends on the size of the data.
+
     Args:
         data (object): dictionary or list to convert
         blacklist (list[list[str]]): path to ignored during the parsing.
             Example: ``[['radar', 'tag', 'custom']]``
-        path (list[str]): internal use.
+        path (list[str]): path of ``data`` in the whole document, if data is
+            not the root of the document. Default to None.
     Returns:
         object: the same object with all keys converted into snake cas format
             and some values converted into Python object.
     """
-    if isinstance(data, list):
-        return [snake_dict(item,
-                           blacklist=blacklist,
-                           path=path) for item in data]
+    node = compile_blacklist(blacklist)
+    for key in path or []:
+        node = node.get(key) if node else None
+    return _snake(data, node, path[-1] if path else None)
+
 
-    if isinstance(data, dict) and path not in blacklist:
+def _snake(data, node, key):
+    """Convert recursively ``data`` whose (original) key is ``key``. ``node``
+    is the node of the blacklist trie matching the path of data (None if no
+    blacklisted path goes through data)."""
+    if isinstance(data, dict):
+        if node is None:
+            return {
+                snake_key(child): _snake(value, None, child)
+                for child, value in data.items()
+            }
+        if None in node:
+            return data
         return {
-            to_snake_case(key): snake_dict(data[key],
-                                           path=path + [key],
-                                           blacklist=blacklist)
-            for key in data
+            snake_key(child): _snake(value, node.get(child), child)
+            for child, value in data.items()
         }
-
-    return decode_value(data, path[-1])
+    if isinstance(data, list):
+        return [_snake(item, node, key) for item in data]
+    return decode_value(data, key)
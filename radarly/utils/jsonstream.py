@@ -0,0 +1,229 @@
+"""
+Incremental parsing of the responses of the API. A page of publications can
+hold thousands of hits: instead of waiting for the whole body of the
+response, ``StreamedResponse`` reads it chunk after chunk and decodes each
+item of the ``hits`` array as soon as it is complete, so that only one item
+(and one chunk) is kept in memory at once.
+"""
+
+import codecs
+import collections
+import json
+import re
+
+from .jsonparser import snake_key
+
+
+_SPACES = re.compile(r'[ \t\n\r]*')
+_DECODER = json.JSONDecoder()
+_NUMBER_CHARS = '0123456789.eE+-'
+
+
+class JsonMemberStream:
+    """Incremental reader of a JSON object whose member ``key`` is an
+    array. Iterating over the reader yields each item of the array, loaded
+    but not decoded (the keys are not converted), as soon as it is entirely
+    read; the other members of the object are stored in ``members``.
+
+    Each value is loaded by the scanner of the ``json`` module. A value
+    which is not entirely read yet is loaded again once the next chunk is
+    received.
+
+    >>> stream = JsonMemberStream(response.iter_content(65536), 'hits')
+    >>> for item in stream:
+    ...     print(item)
+
+    Args:
+        chunks (iterable[bytes]): chunks of the JSON document
+        key (str): name of the member holding the array to iterate over
+    """
+    def __init__(self, chunks, key):
+        self.key = key
+        self.members = collections.OrderedDict()
+        self._chunks = iter(chunks)
+        self._unicode = codecs.getincrementaldecoder('utf-8')()
+        self._text = ''
+        self._pos = 0
+        self._eof = False
+
+    def __repr__(self):
+        return '<JsonMemberStream.key={}>'.format(self.key)
+
+    def __iter__(self):
+        self._expect('{')
+        while True:
+            char = self._peek()
+            if char == '}':
+                self._pos += 1
+                return
+            if char == ',':
+                self._pos += 1
+                continue
+            name = self._read_value()
+            self._expect(':')
+            if name != self.key:
+                self.members[name] = self._read_value()
+                continue
+            self._expect('[')
+            while True:
+                char = self._peek()
+                if char == ']':
+                    self._pos += 1
+                    break
+                if char == ',':
+                    self._pos += 1
+                    continue
+                yield self._read_value()
+
+    def _fill(self):
+        """Read the next chunk. Return False if the document is entirely
+        read."""
+        if self._pos > 65536:
+            self._text = self._text[self._pos:]
+            self._pos = 0
+        for chunk in self._chunks:
+            text = self._unicode.decode(chunk)
+            if text:
+                self._text += text
+                return True
+        self._text += self._unicode.decode(b'', final=True)
+        self._eof = True
+        return False
+
+    def _peek(self):
+        """Skip the spaces and return the next character"""
+        while True:
+            self._pos = _SPACES.match(self._text, self._pos).end()
+            if self._pos < len(self._text):
+                return self._text[self._pos]
+            if not self._fill():
+                raise ValueError('Unexpected end of the JSON document.')
+
+    def _expect(self, char):
+        """Consume the next character, which must be ``char``"""
+        found = self._peek()
+        if found != char:
+            raise ValueError("Expected {!r} at position {} of the JSON "
+                             "document, found {!r}.".format(char, self._pos,
+                                                            found))
+        self._pos += 1
+
+    def _read_value(self):
+        """Consume and load the next value. A value is loaded only once the
+        character following it is read, so that a number cut by the end of
+        a chunk is not loaded partially."""
+        self._peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._text, self._pos)
+                if self._eof or (end < len(self._text) and
+                                 self._text[end] not in _NUMBER_CHARS):
+                    break
+            except ValueError:
+                if self._eof:
+                    raise
+            self._fill()
+        self._pos = end
+        return value
+
+
+class StreamedResponse:
+    """Response of the API whose array ``key`` is decoded incrementally.
+    Iterating over the response yields the decoded items of the array as
+    soon as they are received. The other members of the response (as the
+    ``total`` of a search) can be read with ``response[<name>]``: if a member
+    is located after the array, the items of the array are decoded and kept
+    in memory until the member is read. ``response[key]`` returns the
+    response itself, so that a ``StreamedResponse`` can replace the
+    dictionary of a decoded response.
+
+    The connection is released once the response is entirely read or when
+    ``close`` is called.
+
+    Args:
+        response (requests.Response): response sent with ``stream=True``
+        key (str): name of the array to stream (as sent by the API)
+        decoder (RadarlyDecoder): decoder of the whole document. If None,
+            the items and the members are only loaded.
+        chunk_size (int, optional): size of the chunks read from the
+            connection. Default to 65536.
+    """
+    def __init__(self, response, key, decoder, chunk_size=65536):
+        self.key = key
+        self.fields = {}
+        self._response = response
+        self._decoder = decoder
+        self._item_decoder = decoder and decoder.child(key)
+        self._stream = JsonMemberStream(response.iter_content(chunk_size), key)
+        self._items = iter(self._stream)
+        self._pending = collections.deque()
+        self._done = False
+
+    def __repr__(self):
+        return '<StreamedResponse.key={}.done={}>'.format(self.key,
+                                                          self._done)
+
+    def __getitem__(self, name):
+        if name == self.key or name == self._field(self.key):
+            return self
+        while not self._done:
+            self._update_fields()
+            if self._field(name) in self.fields:
+                break
+            self._pull()
+        self._update_fields()
+        return self.fields[self._field(name)]
+
+    def get(self, name, default=None):
+        """Same as ``response[name]`` but return ``default`` if the response
+        has no member ``name``."""
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def __iter__(self):
+        try:
+            while self._pending or not self._done:
+                if not self._pending and not self._pull():
+                    break
+                yield self._pending.popleft()
+        except GeneratorExit:
+            self.close()
+            raise
+
+    def close(self):
+        """Release the connection of the response."""
+        self._done = True
+        self._items = iter(())
+        self._response.close()
+
+    def _pull(self):
+        """Decode the next item of the array. Return False if there is no
+        more item."""
+        try:
+            item = next(self._items)
+        except StopIteration:
+            self._done = True
+            self._update_fields()
+            self._response.close()
+            return False
+        decoder = self._item_decoder
+        if decoder is not None:
+            item = decoder.finish(decoder.convert(item))
+        self._pending.append(item)
+        return True
+
+    def _field(self, name):
+        """Name of a member in ``fields``"""
+        return name if self._decoder is None else snake_key(name)
+
+    def _update_fields(self):
+        """Decode the members of the response read so far"""
+        for name, value in self._stream.members.items():
+            if self._field(name) in self.fields:
+                continue
+            if self._decoder is not None:
+                decoder = self._decoder.child(name)
+                value = decoder.finish(decoder.convert(value))
+            self.fields[self._field(name)] = value
@@ -3,12 +3,14 @@ Miscellaneous functions and classes
 """
 
 import json
+import os
 import re
+import tempfile
 import textwrap
 from collections import UserList, namedtuple
 from datetime import datetime
 from functools import reduce
-from os.path import dirname, join, pardir
+from os.path import abspath, dirname, join, pardir
 from urllib.parse import urlparse
 
 from dateutil.relativedelta import relativedelta
@@ -23,6 +25,32 @@ def load_data(filepath):
     return data
 
 
+def atomic_dump(data, filepath, **kwargs):
+    """Write data as JSON in a file. The data is first written in a temporary
+    file which then replaces the target file, so that the file is never left
+    half-written (in case of crash for example).
+
+    Args:
+        data (object): data to serialize
+        filepath (str): path of the file
+        **kwargs: keywords arguments given to ``json.dump``
+    Returns:
+        None:
+    """
+    directory = dirname(abspath(filepath))
+    descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, mode='w') as temp_file:
+            json.dump(data, temp_file, **kwargs)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.replace(temp_path, filepath)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return None
+
+
 def dict_to_namedtuple(name, data):
     """Converts a dictionary into a namedtuple"""
     return namedtuple(name, data.keys())(**data)
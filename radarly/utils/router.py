@@ -2,6 +2,8 @@
 Module to handle all roads used to retrieve data.
 """
 
+import re
+
 
 class Router:
     """Roads defined by the Radarly API. Each attribute is a dictionary
@@ -62,3 +64,27 @@ class Router:
     user = {
         'me': '/users.json',
     }
+
+
+def into_pattern(path_url):
+    """Transform a road of the ``Router`` (with format options) into a
+    compiled regular expression. If a list of roads is given, a list of
+    compiled regular expressions is returned.
+
+    Args:
+        path_url (str or list[str]): road(s) of the ``Router``
+    Returns:
+        re.Pattern or list[re.Pattern]:
+    """
+    if isinstance(path_url, str):
+        format_pattern = r'{[a-zA-Z0-9_]*}'
+        path_url = re.sub(format_pattern, '[a-zA-Z0-9]*', path_url)
+        return re.compile(path_url)
+    elif isinstance(path_url, (list, tuple)):
+        return [into_pattern(url) for url in path_url]
+    raise TypeError("'path_url' must be a string or a list")
+
+
+def match_any(url, patterns):
+    """Whether or not an URL matches one of the compiled roads"""
+    return any(pattern.search(url) for pattern in patterns)
@@ -28,6 +28,12 @@ setup(
         'python-dateutil',
         'pycountry',
     ],
+    extras_require={
+        'async': ['aiohttp'],
+        'arrow': ['pyarrow'],
+        'fastjson': ['orjson'],
+        'pandas': ['pandas'],
+    },
     include_package_data=True,
     keywords='radarly linkfluence api',
     license='Apache-2.0',
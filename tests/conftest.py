@@ -0,0 +1,254 @@
+"""
+Fixtures shared by the tests. The requests of the ``RadarlyApi`` are sent to
+a ``MockSession`` answering with in-memory handlers, so that the tests never
+reach the network.
+"""
+
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from radarly.api import RadarlyApi
+from radarly.utils.jsonengine import ENGINES, set_engine
+
+
+SEARCH_TOTAL = 53
+INSTALLED_ENGINES = sorted(
+    name for name, (_, available) in ENGINES.items() if available()
+)
+
+
+def make_hit(index):
+    """Publication of a search, with the shape sent by the API"""
+    date = datetime(2018, 1, 1) + timedelta(hours=SEARCH_TOTAL - index)
+    return {
+        'uid': 'u{:03d}'.format(index),
+        'date': date.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+        'lang': 'en',
+        'tone': 'positive',
+        'category': 'social',
+        'reach': index * 10,
+        'impression': index * 100,
+        'timezone': 'Europe/Paris',
+        'origin': {'platform': 'twitter', 'source': 'twitter'},
+        'radar': {
+            'tag': {'custom': {'My Tag': ['A']}},
+            'created': '2018-01-02T00:00:00.000Z',
+            'updated': '2018-01-03T00:00:00.000Z',
+        },
+        'user': {'screenName': 'bob', 'id': index},
+        'geo': {'inferred': {'country': 'fr'}},
+    }
+
+
+HITS = [make_hit(index) for index in range(SEARCH_TOTAL)]
+
+
+def make_response(status=200, body=None, headers=None, url=''):
+    """Build a ``requests.Response`` whose body is already read"""
+    response = requests.Response()
+    response.status_code = status
+    response.url = url
+    response.encoding = 'utf-8'
+    response.headers = CaseInsensitiveDict(headers or {})
+    if isinstance(body, bytes):
+        response._content = body # pylint: disable=W0212
+    else:
+        response._content = b'' if body is None else \
+            json.dumps(body).encode('utf-8') # pylint: disable=W0212
+    response._content_consumed = True # pylint: disable=W0212
+    return response
+
+
+def search_handler(verb, payload, kwargs):
+    """Answer a publication search like the API: the hits are sorted by
+    date (from the most recent) and filtered by the publication date"""
+    hits = HITS
+    if 'to' in payload:
+        hits = [hit for hit in hits if hit['date'][:19] <= payload['to'][:19]]
+    if 'from' in payload:
+        hits = [hit for hit in hits
+                if hit['date'][:19] >= payload['from'][:19]]
+    start, limit = payload.get('start', 0), payload.get('limit', 25)
+    return 200, {'total': len(hits), 'hits': hits[start:start + limit]}, {
+        'X-Rate-Limit-Remaining': '150', 'X-Rate-Limit-Limit': '180',
+    }
+
+
+def distribution_handler(verb, payload, kwargs):
+    """Answer a distribution of the publications by hour"""
+    counts = {}
+    for hit in HITS:
+        key = hit['date'][:13] + ':00:00.000Z'
+        counts[key] = counts.get(key, 0) + 1
+    items = [
+        {'date': key, 'counts': {'doc': value}}
+        for key, value in sorted(counts.items())
+    ]
+    return 200, {'distribution': {'total': len(HITS), 'distribution': items}}
+
+
+def analytics_handler(verb, payload, kwargs):
+    """Answer the analytics, echoing the fields asked"""
+    return 200, {'dots': [{
+        'date': '2018-01-01T00:00:00.000Z',
+        'total': 12,
+        'counts': {'doc': 12},
+        'stats': {
+            field: [{'term': 'x', 'counts': {'doc': 12}}]
+            for field in payload.get('fields', ['occupations'])
+        },
+    }]}
+
+
+def project_handler(verb, payload, kwargs):
+    """Answer the description of a project"""
+    return 200, {
+        'id': 1, 'label': 'Project', 'created': '2018-01-02T00:00:00.000Z',
+        'timezone': 'Europe/Paris',
+    }, {'ETag': '"v1"'}
+
+
+USERS = [{
+    'user': {'id': 'bob', 'platform': 'twitter', 'screenName': 'bob',
+             'created': '2010-03-04T05:06:07.000Z'},
+    'platform': 'twitter',
+    'count': index,
+} for index in range(3)]
+
+
+def influencer_handler(verb, payload, kwargs):
+    """Answer a search of influencers"""
+    return 200, {'total': len(USERS), 'users': USERS}
+
+
+def oauth_handler(verb, payload, kwargs):
+    """Answer an authentication"""
+    return 200, {'access_token': 'token', 'refresh_token': 'refresh',
+                 'scope': 'listening social-performance'}
+
+
+class MockSession:
+    """Session answering the requests with handlers. Each handler is
+    associated to a fragment of the path of the URLs it answers and returns
+    a (status, body[, headers]) tuple or a ``requests.Response``. The
+    requests are recorded in ``calls``.
+
+    Args:
+        handlers (dict, optional): handlers added to the default handlers
+    """
+    def __init__(self, handlers=None):
+        self.handlers = {
+            'oauth2/token': oauth_handler,
+            'inbox/search.json': search_handler,
+            'inbox/distribution.json': distribution_handler,
+            'insights.json': analytics_handler,
+            'insights/occupation.json': analytics_handler,
+            'projects/1.json': project_handler,
+        }
+        self.handlers.update(handlers or {})
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def request(self, verb, url, **kwargs):
+        path = url.split('?')[0]
+        data = kwargs.get('data')
+        payload = json.loads(data) if isinstance(data, (bytes, str)) and \
+            data else {}
+        with self._lock:
+            self.calls.append((verb, path, payload, kwargs))
+        for fragment, handler in self.handlers.items():
+            if path.endswith(fragment):
+                result = handler(verb, payload, kwargs)
+                if isinstance(result, requests.Response):
+                    return result
+                return make_response(*result, url=url)
+        return make_response(404, {'error': 'Unknown route'}, url=url)
+
+    def close(self):
+        pass
+
+    def count(self, fragment):
+        """Number of requests sent to the URLs ending with ``fragment``"""
+        return sum(1 for _, path, _, _ in self.calls
+                   if path.endswith(fragment))
+
+    def wait(self, fragment, count, timeout=5):
+        """Wait until ``count`` requests have been sent to the URLs ending
+        with ``fragment`` (by background threads for example) and return
+        the number of requests sent"""
+        deadline = time.monotonic() + timeout
+        while self.count(fragment) < count and time.monotonic() < deadline:
+            time.sleep(0.005)
+        return self.count(fragment)
+
+
+@pytest.fixture
+def session():
+    return MockSession()
+
+
+@pytest.fixture
+def api(session):
+    return RadarlyApi(client_id='client', client_secret='secret',
+                      session=session, authenticate=False)
+
+
+@pytest.fixture
+def hits():
+    """Publications of the search answered by the session"""
+    return HITS
+
+
+@pytest.fixture(name='make_hit')
+def make_hit_fixture():
+    """Factory of the publications, see ``make_hit``"""
+    return make_hit
+
+
+@pytest.fixture(name='make_response')
+def make_response_fixture():
+    """Factory of the responses, see ``make_response``"""
+    return make_response
+
+
+@pytest.fixture(name='search_handler')
+def search_handler_fixture():
+    """Handler of the publication searches, to wrap in other handlers"""
+    return search_handler
+
+
+@pytest.fixture(name='distribution_handler')
+def distribution_handler_fixture():
+    """Handler of the distributions of the publications"""
+    return distribution_handler
+
+
+@pytest.fixture(name='project_handler')
+def project_handler_fixture():
+    """Handler of the description of a project"""
+    return project_handler
+
+
+@pytest.fixture
+def users():
+    """Influencers of the search answered by ``influencer_handler``"""
+    return USERS
+
+
+@pytest.fixture(name='influencer_handler')
+def influencer_handler_fixture():
+    """Handler of the influencer searches, not installed by default"""
+    return influencer_handler
+
+
+@pytest.fixture(params=INSTALLED_ENGINES)
+def engine(request):
+    """Use each installed engine, then restore the default engine"""
+    yield set_engine(request.param)
+    set_engine(None)
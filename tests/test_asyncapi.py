@@ -0,0 +1,91 @@
+"""Tests of the asynchronous client: the coroutines must return what the
+synchronous methods return."""
+
+import asyncio
+
+import pytest
+
+from radarly.analytics import Analytics
+from radarly.api import RadarlyApi
+from radarly.asyncapi import AsyncRadarlyApi
+from radarly.distribution import Distribution
+from radarly.parameters import AnalyticsParameter, SearchPublicationParameter
+from radarly.project import Project
+from radarly.publication import Publication
+
+
+@pytest.fixture
+def aapi(session):
+    """Asynchronous API sending its requests to the ``MockSession``"""
+    api = AsyncRadarlyApi(client_id='client', client_secret='secret')
+
+    async def send(verb, url, **kwargs):
+        return session.request(verb, url, **kwargs)
+
+    api._send = send # pylint: disable=W0212
+    return api
+
+
+def _run(coroutine):
+    return asyncio.run(coroutine)
+
+
+async def _collect(generator):
+    return [item async for item in generator]
+
+
+def _items(objects):
+    return [dict(item) for item in objects]
+
+
+def test_authentication_on_first_request(aapi, session):
+    _run(Project.afind(1, api=aapi))
+    assert session.calls[0][1].endswith('oauth2/token')
+    assert aapi.access_token == 'token'
+
+
+def test_afetch_publications(api, aapi):
+    param = SearchPublicationParameter().pagination(0, 10)
+    assert _items(_run(Publication.afetch(1, param, api=aapi))) == \
+        _items(Publication.fetch(1, param, api=api))
+
+
+def test_afetch_all_publications(api, aapi):
+    param = SearchPublicationParameter().pagination(0, 10)
+    publications = _run(_collect(Publication.afetch_all(1, param, api=aapi)))
+    assert len(publications) == 53
+    assert _items(publications) == \
+        _items(Publication.fetch_all(1, param, api=api))
+
+
+def test_afetch_insights(api, aapi):
+    param = AnalyticsParameter().fields('tones', 'occupations')
+    assert _run(Analytics.afetch(1, param, api=aapi)) == \
+        Analytics.fetch(1, param, api=api)
+    assert _items(_run(Distribution.afetch(1, {}, api=aapi))) == \
+        _items(Distribution.fetch(1, {}, api=api))
+
+
+def test_afind_project(api, aapi):
+    project = _run(Project.afind(1, api=aapi))
+    assert project['label'] == Project.find(1, api=api)['label']
+
+
+def test_sync_context_manager_is_rejected(aapi):
+    with pytest.raises(TypeError):
+        with aapi:
+            pass
+
+
+def test_default_apis(api, aapi):
+    with pytest.raises(TypeError):
+        RadarlyApi.set_default_api(aapi)
+    with pytest.raises(TypeError):
+        AsyncRadarlyApi.set_default_api(api)
+    with pytest.raises(TypeError):
+        RadarlyApi.set_default_api(object())
+    AsyncRadarlyApi.set_default_api(aapi)
+    try:
+        assert AsyncRadarlyApi.get_default_api() is aapi
+    finally:
+        AsyncRadarlyApi._default_api = None # pylint: disable=W0212
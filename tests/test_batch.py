@@ -0,0 +1,87 @@
+"""Tests of the columnar batches of publications: the columns must hold the
+fields of the publications."""
+
+import math
+from datetime import timezone
+
+import pytest
+
+from radarly import batch as batch_module
+from radarly.batch import PublicationBatch
+from radarly.parameters import SearchPublicationParameter
+from radarly.publication import Publication
+
+
+def _expected(publications):
+    return dict(
+        uid=[item['uid'] for item in publications],
+        date=[item['date'].replace(tzinfo=timezone.utc)
+              for item in publications],
+        platform=[item['origin']['platform'] for item in publications],
+        lang=[item['lang'] for item in publications],
+        tone=[item['tone'] for item in publications],
+        reach=[float(item['reach']) for item in publications],
+        impression=[float(item['impression']) for item in publications],
+    )
+
+
+@pytest.mark.parametrize('options', [{}, {'raw': True},
+                                     {'timestamps': 'epoch'},
+                                     {'compact': True}])
+def test_batch_columns(api, options):
+    param = {'start': 0, 'limit': 10}
+    expected = _expected(Publication.fetch(1, param, api=api))
+    batch = PublicationBatch(Publication.fetch(1, param, api=api, **options))
+    assert len(batch) == 10
+    for column in PublicationBatch.COLUMNS:
+        assert batch[column] == expected[column]
+    assert batch.categories['platform'] == ['twitter']
+
+
+def test_batch_missing_fields(hits):
+    hit = {key: value for key, value in hits[0].items()
+           if key not in ['date', 'tone', 'reach', 'origin']}
+    batch = PublicationBatch([hit])
+    assert batch['date'] == [None] and batch['tone'] == [None]
+    assert batch['platform'] == [None] and math.isnan(batch['reach'][0])
+    with pytest.raises(KeyError):
+        batch['text'] # pylint: disable=W0104
+
+
+def test_iter_batches(api, hits):
+    param = SearchPublicationParameter().pagination(0, 10)
+    generator = Publication.fetch_all(1, param, api=api, raw=True)
+    first = next(generator)
+    batches = list(generator.iter_batches())
+    assert [len(batch) for batch in batches] == [9, 10, 10, 10, 10, 3]
+    assert [first['uid']] + [uid for batch in batches for uid in batch.uid] \
+        == [hit['uid'] for hit in hits]
+
+
+def test_missing_dependencies(hits):
+    batch = PublicationBatch(hits)
+    for module, convert in [('numpy', batch.to_numpy),
+                            ('pandas', batch.to_pandas),
+                            ('pyarrow', batch.to_arrow)]:
+        if getattr(batch_module, module) is None:
+            with pytest.raises(ImportError):
+                convert()
+
+
+def test_to_pandas(hits):
+    pytest.importorskip('pandas')
+    frame = PublicationBatch(hits).to_pandas()
+    assert list(frame['uid']) == [hit['uid'] for hit in hits]
+    assert list(frame['tone'].cat.categories) == ['positive']
+    assert frame['date'].iloc[0].to_pydatetime() == \
+        PublicationBatch(hits)['date'][0]
+
+
+def test_to_arrow(hits):
+    pytest.importorskip('pyarrow')
+    table = PublicationBatch(hits[:2] + [{'uid': 'empty'}]).to_arrow()
+    assert table.column('uid').to_pylist() == ['u000', 'u001', 'empty']
+    assert table.column('reach').to_pylist() == [0., 10., None]
+    assert table.column('date').to_pylist()[2] is None
+    assert table.column('platform').to_pylist() == ['twitter', 'twitter',
+                                                    None]
@@ -0,0 +1,170 @@
+"""Tests of the cache of the responses: the responses read from the cache must
+be the responses sent by the server."""
+
+from datetime import datetime
+
+import pytest
+import pytz
+
+from radarly.analytics import Analytics
+from radarly.api import RadarlyApi
+from radarly.cache import DEFAULT_INSIGHT_TTL, ResponseCache
+from radarly.distribution import Distribution
+from radarly.exceptions import RadarlyHTTPError
+from radarly.parameters import AnalyticsParameter
+from radarly.utils.router import Router
+
+
+PROJECT = Router.project['find'].format(project_id=1)
+
+
+def _api(session, cache):
+    return RadarlyApi(client_id='client', client_secret='secret',
+                      session=session, authenticate=False, cache=cache)
+
+
+def _expire(cache):
+    for entry in cache._entries.values(): # pylint: disable=W0212
+        entry.stored -= 3600
+
+
+def _ttls(cache):
+    return [entry.ttl for entry in cache._entries.values()] # pylint: disable=W0212
+
+
+@pytest.fixture
+def conditional_handler(project_handler):
+    def build(before=None):
+        """Answer 304 to the requests revalidating the first version of the
+        project"""
+        def handler(verb, payload, kwargs):
+            headers = kwargs.get('headers') or {}
+            if headers.get('If-None-Match') == '"v1"':
+                if before is not None:
+                    before()
+                return 304, None, {'ETag': '"v1"'}
+            return project_handler(verb, payload, kwargs)
+        return handler
+    return build
+
+
+def test_cache_hit(session):
+    api = _api(session, ResponseCache())
+    first = api.get(PROJECT)
+    assert api.get(PROJECT) == first == _api(session, None).get(PROJECT)
+    assert session.count('projects/1.json') == 2
+
+
+def test_cache_revalidation(session, conditional_handler):
+    cache = ResponseCache()
+    session.handlers['projects/1.json'] = conditional_handler()
+    api = _api(session, cache)
+    first = api.get(PROJECT)
+    _expire(cache)
+    assert api.get(PROJECT) == first
+    assert session.calls[-1][3]['headers']['If-None-Match'] == '"v1"'
+    assert api.get(PROJECT) == first
+    assert session.count('projects/1.json') == 2
+
+
+def test_cache_revalidation_of_a_removed_entry(session, conditional_handler):
+    cache = ResponseCache()
+    session.handlers['projects/1.json'] = conditional_handler(cache.clear)
+    api = _api(session, cache)
+    first = api.get(PROJECT)
+    _expire(cache)
+    assert api.get(PROJECT) == first
+    assert api.get(PROJECT) == first
+    assert session.count('projects/1.json') == 2
+
+
+def test_cache_eviction(session, project_handler):
+    session.handlers['projects/2.json'] = project_handler
+    api = _api(session, ResponseCache(maxsize=1))
+    for project_id in [1, 2, 1]:
+        api.get(Router.project['find'].format(project_id=project_id))
+    assert session.count('projects/1.json') == 2
+    assert session.count('projects/2.json') == 1
+
+
+def test_cache_on_disk(session, tmp_path):
+    path = str(tmp_path / 'cache.db')
+    first = _api(session, ResponseCache(maxsize=1, path=path)).get(PROJECT)
+    cache = ResponseCache(path=path)
+    assert _api(session, cache).get(PROJECT) == first
+    assert session.count('projects/1.json') == 1
+    cache.close()
+
+
+def test_uncached_routes(session):
+    cache = ResponseCache()
+    api = _api(session, cache)
+    url = Router.publication['search'].format(project_id=1)
+    for _ in range(2):
+        api.post(url, data={'start': 0, 'limit': 5})
+    assert session.count('inbox/search.json') == 2
+    assert cache.key('POST', url) is None
+
+
+@pytest.mark.parametrize('status', [404, 500])
+def test_failed_responses_are_not_cached(session, status):
+    session.handlers['projects/1.json'] = lambda *args: (status, {})
+    cache = ResponseCache()
+    api = _api(session, cache)
+    for _ in range(2):
+        with pytest.raises(RadarlyHTTPError):
+            api.get(PROJECT)
+    assert session.count('projects/1.json') == 2
+    assert not cache._entries # pylint: disable=W0212
+
+
+def _insight_param(end, *fields):
+    return AnalyticsParameter() \
+        .publication_date(datetime(2018, 1, 1), end).fields(*fields)
+
+
+def test_closed_insights_never_expire(session):
+    cache = ResponseCache()
+    api = _api(session, cache)
+    first = Analytics.fetch(1, _insight_param(datetime(2018, 2, 1), 'tones',
+                                              'platforms'), api=api)
+    second = Analytics.fetch(1, _insight_param(datetime(2018, 2, 1),
+                                               'platforms', 'tones'), api=api)
+    assert first == second == Analytics.fetch(
+        1, _insight_param(datetime(2018, 2, 1), 'tones', 'platforms'),
+        api=_api(session, None)
+    )
+    assert session.count('insights.json') == 2
+    assert _ttls(cache) == [float('inf')]
+
+
+def test_open_insights_expire(session):
+    cache = ResponseCache()
+    api = _api(session, cache)
+    param = _insight_param(datetime.now(pytz.utc), 'tones')
+    Analytics.fetch(1, param, api=api)
+    Analytics.fetch(1, param, api=api)
+    assert session.count('insights.json') == 1
+    assert _ttls(cache) == [DEFAULT_INSIGHT_TTL[Router.analytics['global']]]
+    _expire(cache)
+    Analytics.fetch(1, param, api=api)
+    assert session.count('insights.json') == 2
+
+
+def test_insights_of_distinct_parameters(session):
+    api = _api(session, ResponseCache())
+    for fields in [('tones',), ('platforms',), ('tones',)]:
+        Analytics.fetch(1, _insight_param(datetime(2018, 2, 1), *fields),
+                        api=api)
+    Distribution.fetch(1, {'from': '2018-01-01T00:00:00+00:00',
+                           'to': '2018-02-01T00:00:00+00:00'}, api=api)
+    assert session.count('insights.json') == 2
+    assert session.count('inbox/distribution.json') == 1
+
+
+def test_insights_cache_disabled(session):
+    api = _api(session, ResponseCache(insight_ttl={}))
+    param = _insight_param(datetime(2018, 2, 1), 'tones')
+    Analytics.fetch(1, param, api=api)
+    Analytics.fetch(1, param, api=api)
+    assert session.count('insights.json') == 2
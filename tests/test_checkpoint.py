@@ -0,0 +1,97 @@
+"""Tests of the checkpoints of the generators: a generator resumed from a
+checkpoint must yield the publications which were not yielded yet."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from radarly.parameters import SearchPublicationParameter
+from radarly.publication import Publication, PublicationsGenerator
+
+
+@pytest.fixture
+def expected(hits):
+    return [hit['uid'] for hit in hits]
+
+
+def _param():
+    return SearchPublicationParameter() \
+        .publication_date(datetime(2018, 1, 1), datetime(2018, 1, 4)) \
+        .pagination(0, 10)
+
+
+def _consume(generator, count):
+    return [next(generator)['uid'] for _ in range(count)]
+
+
+def _check_resumed(expected, first, rest, limit=10):
+    """Check that a resumed generator yields the publications which were not
+    yielded yet, after the page being read when the generator stopped"""
+    start = expected.index(rest[0])
+    assert len(first) - limit < start <= len(first)
+    assert first[:start] + rest == expected
+
+
+@pytest.mark.parametrize('options', [{}, {'keyset': True}, {'workers': 2}])
+def test_resume_from_checkpoint(api, tmp_path, expected, options):
+    checkpoint = str(tmp_path / 'export.json')
+    generator = PublicationsGenerator(_param(), project_id=1, api=api,
+                                      checkpoint=checkpoint, **options)
+    first = _consume(generator, 25)
+    generator.close()
+    with open(checkpoint) as checkpoint_file:
+        assert json.load(checkpoint_file)['current_page'] == 3
+    resumed = PublicationsGenerator.resume_from(checkpoint, api=api,
+                                                **options)
+    _check_resumed(expected, first,
+                   [publication['uid'] for publication in resumed])
+
+
+@pytest.mark.parametrize('options', [{'keyset': True}, {'workers': 2}])
+def test_resume_with_the_options_of_the_checkpoint(api, tmp_path, expected,
+                                                  options):
+    checkpoint = str(tmp_path / 'export.json')
+    generator = PublicationsGenerator(_param(), project_id=1, api=api,
+                                      checkpoint=checkpoint, **options)
+    first = _consume(generator, 25)
+    generator.close()
+    resumed = PublicationsGenerator.resume_from(checkpoint, api=api)
+    for name, value in options.items():
+        assert getattr(resumed, name) == value
+    _check_resumed(expected, first, [item['uid'] for item in resumed])
+
+
+def test_resume_with_another_pagination(api, tmp_path):
+    checkpoint = str(tmp_path / 'export.json')
+    generator = PublicationsGenerator(_param(), project_id=1, api=api,
+                                      checkpoint=checkpoint, keyset=True)
+    _consume(generator, 25)
+    generator.close()
+    with pytest.raises(ValueError):
+        PublicationsGenerator.resume_from(checkpoint, api=api, keyset=False)
+
+
+def test_resume_from_cursor(api, expected):
+    generator = Publication.fetch_all(1, _param(), api=api)
+    first = _consume(generator, 15)
+    cursor = json.loads(json.dumps(generator.cursor(), default=str))
+    assert cursor['current_page'] == 2
+    resumed = PublicationsGenerator.resume_from(cursor, api=api)
+    assert first[:10] + [item['uid'] for item in resumed] == expected
+
+
+def test_resume_finished_generator(api, session, tmp_path):
+    checkpoint = str(tmp_path / 'export.json')
+    assert len(list(PublicationsGenerator(_param(), project_id=1, api=api,
+                                          checkpoint=checkpoint))) == 53
+    calls = len(session.calls)
+    assert list(PublicationsGenerator.resume_from(checkpoint, api=api)) == []
+    assert len(session.calls) == calls
+
+
+def test_checkpoint_of_unordered_generator(api, tmp_path):
+    with pytest.raises(ValueError):
+        PublicationsGenerator(_param(), project_id=1, api=api, workers=2,
+                              ordered=False,
+                              checkpoint=str(tmp_path / 'export.json'))
@@ -0,0 +1,79 @@
+"""Tests of the compact models: a compact object must expose the fields of the
+regular object."""
+
+import json
+import tracemalloc
+
+import pytest
+
+from radarly.influencer import CompactInfluencer, Influencer
+from radarly.parameters import SearchPublicationParameter
+from radarly.publication import CompactPublication, Publication
+
+
+def _compare(compact, regular):
+    assert compact.keys() == regular.keys()
+    for key in regular.keys():
+        assert getattr(compact, key) == getattr(regular, key)
+        assert compact[key] == regular[key]
+    assert json.loads(compact.json()) == json.loads(regular.json())
+    assert not hasattr(compact, '__dict__')
+
+
+def test_compact_publications(api):
+    param = SearchPublicationParameter().pagination(0, 10)
+    regular = Publication.fetch(1, param, api=api)
+    compact = Publication.fetch(1, param, api=api, compact=True)
+    assert all(isinstance(item, CompactPublication) for item in compact)
+    for compact_item, regular_item in zip(compact, regular):
+        _compare(compact_item, regular_item)
+    assert compact[0]['$radar.tag.custom'] == regular[0]['$radar.tag.custom']
+    assert repr(compact[0]) == repr(regular[0])
+
+
+def test_compact_pagination(api):
+    param = SearchPublicationParameter().pagination(0, 10)
+    compact = list(Publication.fetch_all(1, param, api=api, compact=True))
+    assert [item.uid for item in compact] == \
+        [item['uid'] for item in Publication.fetch_all(1, param, api=api)]
+
+
+def test_compact_influencers(api, session, influencer_handler):
+    session.handlers['influencers.json'] = influencer_handler
+    regular = Influencer.fetch(1, {}, api=api)
+    compact = Influencer.fetch(1, {}, api=api, compact=True)
+    assert all(isinstance(item, CompactInfluencer) for item in compact)
+    for compact_item, regular_item in zip(compact, regular):
+        _compare(compact_item, regular_item)
+
+
+def test_compact_attributes(api):
+    publication = Publication.fetch(1, {'start': 0, 'limit': 1}, api=api,
+                                    compact=True)[0]
+    publication.note = 'checked'
+    assert publication.note == 'checked' and 'note' in publication.keys()
+    del publication.note
+    assert 'note' not in publication.keys()
+
+
+
+def _allocated(model, hit, count=1000):
+    """Memory allocated per object built from a copy of ``hit``"""
+    tracemalloc.start()
+    try:
+        objects = [model(dict(hit), 1) for _ in range(count)]
+        allocated = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert len(objects) == count
+    return allocated / count
+
+
+@pytest.mark.parametrize('dense', [False, True])
+def test_compact_publications_are_smaller(api, dense):
+    hit = api.post('/projects/1/inbox/search.json',
+                   data={'start': 0, 'limit': 1})['hits'][0]
+    if dense:
+        fields = CompactPublication._FIELDS # pylint: disable=W0212
+        hit = dict({field: None for field in fields}, **hit)
+    assert _allocated(CompactPublication, hit) < _allocated(Publication, hit)
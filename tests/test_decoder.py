@@ -0,0 +1,209 @@
+"""Tests of the decoding of the dates and timezones sent by the API."""
+
+import copy
+import json
+import random
+import re
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+from dateutil.parser import parse
+
+from radarly.utils.jsonparser import (_BLACKLIST_PATH, RadarlyDecoder,
+                                      parse_date, parse_epoch,
+                                      parse_timezone, radarly_decoder,
+                                      snake_dict)
+from radarly.utils.misc import to_snake_case
+
+
+def _api_dates(count=500):
+    generator = random.Random(0)
+    start = datetime(1960, 1, 1)
+    for _ in range(count):
+        date = start + timedelta(
+            milliseconds=generator.randrange(100 * 365 * 86400000)
+        )
+        yield '{}.{:03d}Z'.format(date.strftime('%Y-%m-%dT%H:%M:%S'),
+                                  date.microsecond // 1000)
+
+
+def test_parse_date_matches_dateutil():
+    for value in _api_dates():
+        expected = parse(value, ignoretz=True)
+        assert parse_date(value) == expected
+        assert parse_epoch(value) == \
+            (expected - datetime(1970, 1, 1)) // timedelta(milliseconds=1)
+
+
+def test_parse_date_fallback():
+    with pytest.raises(ValueError):
+        parse_date('2018-02-30T00:00:00.000Z')
+    assert parse_date('2018-01-03 05:00') == datetime(2018, 1, 3, 5)
+    assert parse_date(' 2018-01-03T05:00:00+02:00 ') == \
+        datetime(2018, 1, 3, 5)
+
+
+def test_parse_timezone():
+    assert parse_timezone('Europe/Paris') is pytz.timezone('Europe/Paris')
+    assert parse_timezone('Mars/Olympus') == 'Mars/Olympus'
+
+
+def test_parse_timezone_in_threads():
+    name = 'Pacific/Chatham'
+    parse_timezone.cache_clear()
+    pytz._tzinfo_cache.pop(name, None) # pylint: disable=W0212
+    barrier, results = threading.Barrier(8), []
+
+    def parse_in_thread():
+        barrier.wait()
+        results.append(parse_timezone(name))
+
+    threads = [threading.Thread(target=parse_in_thread) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(result is pytz.timezone(name) for result in results)
+
+
+_BASELINE_PATTERN = re.compile(
+    r'^ *\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}.\d{3}Z *$'
+)
+
+
+def _baseline_snake_dict(data, blacklist, path=()):
+    """Conversion of the documents before the decoders were compiled, used
+    as reference"""
+    if isinstance(data, list):
+        return [_baseline_snake_dict(item, blacklist, path) for item in data]
+    if isinstance(data, dict) and list(path) not in blacklist:
+        return {
+            to_snake_case(key): _baseline_snake_dict(value, blacklist,
+                                                     path + (key,))
+            for key, value in data.items()
+        }
+    key = path[-1] if path else None
+    if isinstance(data, str) and _BASELINE_PATTERN.match(data):
+        return parse(data.strip(), ignoretz=True)
+    if key == 'timezone' and data in pytz.all_timezones_set:
+        return pytz.timezone(data)
+    return data
+
+
+@pytest.fixture
+def document(make_hit):
+    return {
+        'totalCount': 2,
+        'hits': [
+            make_hit(0),
+            dict(make_hit(1), timezone='Mars/Olympus', fooBar=1, foo_bar=2,
+                 nullValue=None, emptyObject={}, publishedDates=[
+                     '2018-01-03T05:00:00.000Z', ' 2018-01-03T05:00:00.000Z ',
+                     'not a date',
+                 ], nestedLists=[[{'deepKey': '2018-01-03T05:00:00.000Z'}]],
+                 radar={'tag': {'custom': {'My Tag': ['A'], 'otherTag': {
+                     'subKey': '2018-01-03T05:00:00.000Z', 'sub_key': 1,
+                 }}}, 'createdAt': '2018-01-02T00:00:00.000Z'}),
+        ],
+        'dots': [{'date': '2018-01-01T00:00:00.000Z', 'stats': {
+            'tagOffset': [{'term': '2018-01-01T00:00:00.000Z'}],
+        }}],
+        'radar': {'tag': {'camelKey': [{'innerKey': 1}]}},
+    }
+
+
+@pytest.mark.parametrize('blacklist', [[], _BLACKLIST_PATH,
+                                       [['hits', 'radar']]])
+def test_snake_dict_matches_baseline(document, blacklist):
+    expected = _baseline_snake_dict(copy.deepcopy(document), blacklist)
+    assert snake_dict(copy.deepcopy(document), blacklist) == expected
+    assert snake_dict(copy.deepcopy(document['hits']), blacklist,
+                      path=['hits']) == expected['hits']
+
+
+@pytest.mark.parametrize('blacklist', [[], _BLACKLIST_PATH,
+                                       [['hits', 'radar']]])
+def test_decoder_matches_baseline(document, blacklist, engine):
+    content = json.dumps(document).encode('utf-8')
+    expected = _baseline_snake_dict(json.loads(content), blacklist)
+    decoder = RadarlyDecoder(blacklist=blacklist)
+    assert decoder.decode(content, engine) == expected
+    # a decoder can be used again once a document is finished
+    assert decoder.decode(content, engine) == expected
+
+
+_RANDOM_KEYS = ['hits', 'radar', 'tag', 'dots', 'stats', 'date', 'timezone',
+                'fooBar', 'foo_bar', 'custom', 'createdAt', 'x']
+_RANDOM_VALUES = ['2018-01-03T05:00:00.000Z', '2018-02-30T00:00:00.000Z',
+                  ' 2018-01-03T05:00:00.000Z ', 'Europe/Paris',
+                  'Mars/Olympus', 'text', 1, 2.5, None, True]
+
+
+def _random_value(generator, depth=1):
+    draw = generator.random()
+    if depth < 4 and draw < 0.3:
+        return {generator.choice(_RANDOM_KEYS):
+                _random_value(generator, depth + 1)
+                for _ in range(generator.randrange(4))}
+    if depth < 4 and draw < 0.45:
+        return [_random_value(generator, depth + 1)
+                for _ in range(generator.randrange(3))]
+    return generator.choice(_RANDOM_VALUES)
+
+
+def _random_documents(count, seed=0):
+    """Documents mixing the blacklisted paths, valid and invalid dates,
+    timezones and keys converted into the same snake_case key"""
+    generator = random.Random(seed)
+    for _ in range(count):
+        yield {generator.choice(_RANDOM_KEYS): _random_value(generator)
+               for _ in range(generator.randrange(1, 5))}
+
+
+def _outcome(decode):
+    """Decoded document, or 'error' if the document can't be decoded"""
+    try:
+        return decode()
+    except ValueError:
+        return 'error'
+
+
+def test_decoder_matches_baseline_on_random_documents(engine):
+    for document in _random_documents(1000):
+        content = json.dumps(document).encode('utf-8')
+        expected = _outcome(lambda: _baseline_snake_dict(
+            json.loads(content), _BLACKLIST_PATH
+        ))
+        decoder = RadarlyDecoder(blacklist=_BLACKLIST_PATH)
+        assert _outcome(lambda: decoder.decode(content, engine)) == \
+            expected, content
+
+
+def test_blacklisted_invalid_dates(engine):
+    document = {
+        'dots': [{'date': '2018-01-01T00:00:00.000Z',
+                  'stats': {'tagOffset': '2018-02-30T00:00:00.000Z'}}],
+        'hits': [{'radar': {'tag': {'custom': {
+            'myDate': ['2018-02-30T00:00:00.000Z'],
+        }}}}],
+    }
+    content = json.dumps(document).encode('utf-8')
+    decoder = RadarlyDecoder(blacklist=_BLACKLIST_PATH)
+    decoded = decoder.decode(content, engine)
+    assert decoded == _baseline_snake_dict(document, _BLACKLIST_PATH)
+    assert decoded['dots'][0]['stats'] == document['dots'][0]['stats']
+    content = content.replace(b'"2018-01-01T00', b'"2018-02-30T00')
+    with pytest.raises(ValueError):
+        decoder.decode(content, engine)
+
+
+def test_radarly_decoder_hook(document):
+    content = json.dumps(document)
+    assert json.loads(content, object_hook=radarly_decoder) == \
+        json.loads(content, object_hook=lambda obj: {
+            to_snake_case(key): _baseline_snake_dict(value, [], (key,))
+            if not isinstance(value, (dict, list)) else value
+            for key, value in obj.items()
+        })
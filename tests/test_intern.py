@@ -0,0 +1,89 @@
+"""Tests of the interning of the values repeated in the responses."""
+
+import json
+
+from radarly.api import RadarlyApi
+from radarly.influencer import Influencer
+from radarly.publication import Publication
+from radarly.utils.jsonparser import (INTERN_TABLE, InternTable,
+                                      RadarlyDecoder)
+
+
+def _new(value):
+    """Equal string which is not the same object"""
+    return json.loads(json.dumps(value))
+
+
+def test_intern_table():
+    table = InternTable(maxsize=2)
+    first = table.intern(_new('twitter'))
+    assert table.intern(_new('twitter')) is first
+    assert table.intern([_new('twitter'), 3]) == ['twitter', 3]
+    assert table.intern(1.5) == 1.5 and len(table) == 2
+    table.intern(_new('instagram'))
+    # the oldest value is evicted
+    assert table.intern(_new('twitter')) is not first
+    table.clear()
+    assert len(table) == 0
+
+
+def test_disabled_intern_table():
+    table = InternTable(maxsize=0)
+    value = _new('twitter')
+    assert table.intern(value) is value and len(table) == 0
+
+
+def test_decoder_intern_paths():
+    table = InternTable()
+    content = json.dumps({'hits': [{'lang': 'en-GB', 'text': 'en-GB'}]})
+    decoder = RadarlyDecoder(intern=[['hits', 'lang']], intern_table=table)
+    first, second = decoder.decode(content), decoder.decode(content)
+    assert first == json.loads(content)
+    assert first['hits'][0]['lang'] is second['hits'][0]['lang']
+    assert first['hits'][0]['text'] is not second['hits'][0]['text']
+    assert len(table) == 1
+
+
+def test_publications_share_their_values(api):
+    first = Publication.fetch(1, {'start': 0, 'limit': 5}, api=api)
+    second = Publication.fetch(1, {'start': 5, 'limit': 5}, api=api)
+    assert first[0]['$origin.platform'] is second[4]['$origin.platform']
+    assert first[0]['lang'] is second[0]['lang']
+    assert first[0]['user']['screen_name'] is second[0]['user']['screen_name']
+    assert INTERN_TABLE.intern(_new('twitter')) is \
+        first[0]['$origin.platform']
+
+
+def test_influencers_share_their_values(api, session, influencer_handler):
+    session.handlers['influencers.json'] = influencer_handler
+    first, second = Influencer.fetch(1, {}, api=api)[:2]
+    assert first['platform'] is second['platform']
+
+
+def test_api_intern_paths(api):
+    api.intern = ['hits.uid']
+    first = Publication.fetch(1, {'start': 0, 'limit': 5}, api=api)
+    second = Publication.fetch(1, {'start': 0, 'limit': 5}, api=api)
+    assert first[0]['uid'] is second[0]['uid']
+    # the paths of the schema are still interned
+    assert first[0]['lang'] is second[0]['lang']
+    url = api.router.project['find'].format(project_id=1)
+    api.intern = ['label']
+    assert api.get(url)['label'] is api.get(url)['label']
+
+
+def test_api_intern_table(session):
+    table = InternTable()
+    api = RadarlyApi(client_id='client', client_secret='secret',
+                     session=session, authenticate=False, intern_table=table)
+    publication = Publication.fetch(1, {'start': 0, 'limit': 5}, api=api)[0]
+    assert table.intern(_new('twitter')) is publication['$origin.platform']
+    assert len(table) > 0
+
+
+def test_api_without_interning(api):
+    api.intern = False
+    first = Publication.fetch(1, {'start': 0, 'limit': 5}, api=api)
+    second = Publication.fetch(1, {'start': 0, 'limit': 5}, api=api)
+    assert first[0]['lang'] == second[0]['lang']
+    assert first[0]['lang'] is not second[0]['lang']
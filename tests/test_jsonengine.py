@@ -0,0 +1,79 @@
+"""Tests of the JSON engines: each engine must serialize and decode the
+documents as the ``json`` module does."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from radarly.parameters import SearchPublicationParameter
+from radarly.publication import Publication
+from radarly.utils.jsonengine import ENGINES, get_engine, set_engine
+from radarly.utils.jsonparser import RadarlyEncoder
+
+
+def _param():
+    return SearchPublicationParameter() \
+        .publication_date(datetime(2018, 1, 1), datetime(2018, 1, 4)) \
+        .platforms('twitter').query('café "bar"').pagination(0, 10)
+
+
+def test_payload(api, session, engine):
+    param = _param()
+    Publication.fetch(1, param, api=api)
+    assert session.calls[-1][3]['data'] == engine.dumpb(param)
+    assert session.calls[-1][2] == json.loads(json.dumps(param))
+
+
+@pytest.mark.parametrize('options', [{}, {'sort_keys': True},
+                                     {'indent': 2}, {'indent': 4},
+                                     {'ensure_ascii': False}])
+def test_model_serialization(api, engine, options):
+    publication = Publication.fetch(1, _param(), api=api)[0]
+    expected = json.dumps(publication, cls=RadarlyEncoder, **options)
+    serialized = publication.json(**options)
+    assert json.loads(serialized) == json.loads(expected)
+    if options.get('sort_keys'):
+        assert list(json.loads(serialized)) == sorted(json.loads(serialized))
+
+
+def test_unserializable_object(engine):
+    with pytest.raises(TypeError):
+        engine.dumps({'value': object()},
+                     default=RadarlyEncoder().default)
+
+
+def test_loads_with_hook(engine, make_hit):
+    content = json.dumps({'hits': [make_hit(0), make_hit(1)],
+                          'nested': [[{'a': 1}], {'b': [{'c': 2}]}]})
+    pairs = []
+
+    def hook(items):
+        items = list(items)
+        pairs.append(items)
+        return dict(items)
+
+    assert engine.loads(content, object_pairs_hook=hook) == \
+        json.loads(content)
+    expected = []
+    json.loads(content, object_pairs_hook=lambda items: (
+        expected.append(items) or dict(items)
+    ))
+    assert sorted(map(repr, pairs)) == sorted(map(repr, expected))
+
+
+def test_set_engine():
+    try:
+        assert set_engine('json') is get_engine()
+        assert get_engine().name == 'json'
+        with pytest.raises(ValueError):
+            set_engine('simplejson')
+        for name, (_, available) in ENGINES.items():
+            if not available():
+                with pytest.raises(ImportError):
+                    set_engine(name)
+    finally:
+        set_engine(None)
+    default = [name for name in ['orjson', 'ujson', 'json']
+               if ENGINES[name][1]()][0]
+    assert get_engine().name == default
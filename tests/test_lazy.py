@@ -0,0 +1,60 @@
+"""Tests of the lazy publications: each field read on a lazy publication must
+be the field of the regular publication."""
+
+import json
+
+import pytest
+
+from radarly.parameters import SearchPublicationParameter
+from radarly.publication import LazyPublication, Publication
+
+
+PARAM = {'start': 0, 'limit': 10}
+
+
+def test_lazy_fields(api):
+    regular = Publication.fetch(1, PARAM, api=api)
+    lazy = Publication.fetch(1, PARAM, api=api, lazy=True)
+    assert all(isinstance(item, LazyPublication) for item in lazy)
+    for lazy_item, regular_item in zip(lazy, regular):
+        assert lazy_item.keys() == regular_item.keys()
+        assert lazy_item['date'] == regular_item['date']
+        assert lazy_item['$radar.tag.custom'] == \
+            regular_item['$radar.tag.custom']
+        assert lazy_item.decode() is lazy_item
+        assert {key: getattr(lazy_item, key) for key in lazy_item.keys()} == \
+            {key: getattr(regular_item, key) for key in regular_item.keys()}
+        assert json.loads(lazy_item.json()) == json.loads(regular_item.json())
+
+
+def test_fields_are_decoded_on_access(api):
+    publication = Publication.fetch(1, PARAM, api=api, lazy=True)[0]
+    assert set(publication._data) >= {'radar', 'user', 'date'} # pylint: disable=W0212
+    assert publication.date == Publication.fetch(1, PARAM, api=api)[0].date
+    assert 'date' not in publication._data # pylint: disable=W0212
+    assert 'radar' in publication._data # pylint: disable=W0212
+    with pytest.raises(AttributeError):
+        publication.missing_field # pylint: disable=W0104
+
+
+def test_lazy_epoch(api):
+    epochs = Publication.fetch(1, PARAM, api=api, timestamps='epoch')
+    lazy = Publication.fetch(1, PARAM, api=api, lazy=True,
+                             timestamps='epoch')
+    assert [item.date for item in lazy] == [item.date for item in epochs]
+
+
+def test_lazy_pagination(api):
+    param = SearchPublicationParameter().pagination(0, 10)
+    lazy = list(Publication.fetch_all(1, param, api=api, lazy=True))
+    assert [item.uid for item in lazy] == \
+        [item.uid for item in Publication.fetch_all(1, param, api=api)]
+
+
+@pytest.mark.parametrize('options', [{'raw': True}, {'compact': True}])
+def test_lazy_mode_exclusions(api, options):
+    with pytest.raises(ValueError):
+        Publication.fetch(1, PARAM, api=api, lazy=True, **options)
+    with pytest.raises(ValueError):
+        Publication.fetch_all(1, SearchPublicationParameter(), api=api,
+                              lazy=True, **options)
@@ -0,0 +1,196 @@
+"""Tests of the pagination modes of the publications: each mode must yield the
+publications of the pagination by offset."""
+
+import gc
+import threading
+import time
+import weakref
+from datetime import datetime
+
+import pytest
+
+from radarly.exceptions import RadarlyHTTPError
+from radarly.parameters import SearchPublicationParameter
+from radarly.publication import Publication
+
+def _param(limit=10):
+    return SearchPublicationParameter() \
+        .publication_date(datetime(2018, 1, 1), datetime(2018, 1, 4)) \
+        .pagination(0, limit)
+
+
+def _uids(publications):
+    return [publication['uid'] for publication in publications]
+
+
+@pytest.mark.parametrize('options', [
+    {}, {'workers': 2}, {'prefetch': 1}, {'keyset': True}, {'stream': True},
+])
+def test_sharded_pagination(api, hits, options):
+    publications = Publication.fetch_all(1, _param(), api=api, shards=3,
+                                         **options)
+    uids = _uids(publications)
+    assert len(publications.shards) == 3
+    assert sorted(uids) == sorted(hit['uid'] for hit in hits)
+
+
+@pytest.mark.parametrize('options', [
+    {'ordered': True}, {'stream': True, 'prefetch': 1},
+    {'stream': True, 'keyset': True}, {'keyset': True, 'prefetch': 1},
+])
+def test_sharded_pagination_rejects_options(api, session, options):
+    with pytest.raises(ValueError):
+        Publication.fetch_all(1, _param(), api=api, shards=3, **options)
+    assert session.count('inbox/search.json') == 0
+
+
+@pytest.mark.parametrize('workers', [2, 4])
+def test_concurrent_pagination(api, session, hits, workers):
+    expected = _uids(Publication.fetch_all(1, _param(), api=api))
+    requests = session.count('inbox/search.json')
+    assert expected == [hit['uid'] for hit in hits]
+    assert _uids(Publication.fetch_all(1, _param(), api=api,
+                                       workers=workers)) == expected
+    unordered = _uids(Publication.fetch_all(1, _param(), api=api,
+                                            workers=workers, ordered=False))
+    assert sorted(unordered) == sorted(expected)
+    assert session.count('inbox/search.json') == 3 * requests
+
+
+@pytest.mark.parametrize('workers', [2, 4])
+def test_workers_start_with_the_first_page(api, session, workers):
+    publications = Publication.fetch_all(1, _param(), api=api,
+                                         workers=workers)
+    # the 5 remaining pages, within the window of 2 * workers pages
+    expected = 1 + min(5, 2 * workers)
+    assert session.wait('inbox/search.json', expected) == expected
+    publications.close()
+
+
+@pytest.mark.parametrize('prefetch', [1, 3])
+def test_prefetched_pagination(api, session, hits, prefetch):
+    expected = [hit['uid'] for hit in hits]
+    publications = Publication.fetch_all(1, _param(), api=api,
+                                         prefetch=prefetch)
+    assert next(publications)['uid'] == expected[0]
+    # the first page and, at most, the pages prefetched
+    assert session.count('inbox/search.json') <= 1 + prefetch
+    assert [expected[0]] + _uids(publications) == expected
+
+
+@pytest.mark.parametrize('prefetch', [1, 3])
+def test_prefetch_starts_with_the_first_page(api, session, prefetch):
+    publications = Publication.fetch_all(1, _param(), api=api,
+                                         prefetch=prefetch)
+    # the next pages are in flight while the first one is consumed
+    assert session.wait('inbox/search.json', 1 + prefetch) == 1 + prefetch
+    next(publications)
+    assert session.wait('inbox/search.json', 1 + prefetch) == 1 + prefetch
+    publications.close()
+
+
+def test_dropped_generator_cancels_its_requests(api, session,
+                                                search_handler):
+    release = threading.Event()
+
+    def handler(verb, payload, kwargs):
+        if payload.get('start'):
+            release.wait(5)
+        return search_handler(verb, payload, kwargs)
+
+    session.handlers['inbox/search.json'] = handler
+    publications = Publication.fetch_all(1, _param(), api=api, prefetch=3)
+    reference = weakref.ref(publications)
+    gc.disable()
+    try:
+        del publications
+        assert reference() is None
+    finally:
+        gc.enable()
+    release.set()
+    time.sleep(0.1)
+    # only the page being requested when the generator was dropped is sent
+    assert session.count('inbox/search.json') <= 2
+
+
+def test_prefetched_pagination_is_closed(api):
+    publications = Publication.fetch_all(1, _param(), api=api, prefetch=2)
+    next(publications)
+    publications.close()
+    assert list(publications) == []
+
+
+def test_prefetched_page_failure(api, session, search_handler):
+    def handler(verb, payload, kwargs):
+        if payload.get('start') == 20:
+            return 503, {'error': 'Unavailable'}
+        return search_handler(verb, payload, kwargs)
+
+    session.handlers['inbox/search.json'] = handler
+    publications = Publication.fetch_all(1, _param(), api=api, prefetch=2)
+    assert len([next(publications) for _ in range(20)]) == 20
+    with pytest.raises(RadarlyHTTPError):
+        next(publications)
+
+
+@pytest.fixture
+def tied_search_handler(hits):
+    def build(size=3, late=None):
+        """Build a search whose publications are published ``size`` by
+        ``size`` at the same date, so that the pages end in the middle of a
+        date. The publications of a date are sent in a different order at
+        each request and the ``late`` publication is indexed after the first
+        request."""
+        calls = []
+
+        def handler(verb, payload, kwargs):
+            tied = [dict(hit, date=hits[index - index % size]['date'])
+                    for index, hit in enumerate(hits)]
+            if late and calls:
+                tied.append(late)
+            tied.sort(key=lambda hit: hit['uid'],
+                      reverse=len(calls) % 2 == 1)
+            tied.sort(key=lambda hit: hit['date'], reverse=True)
+            calls.append(payload)
+            if 'to' in payload:
+                tied = [hit for hit in tied
+                        if hit['date'][:19] <= payload['to'][:19]]
+            start, limit = payload.get('start', 0), payload.get('limit', 25)
+            return 200, {'total': len(tied),
+                         'hits': tied[start:start + limit]}
+
+        return handler
+    return build
+
+
+@pytest.mark.parametrize('raw', [False, True])
+def test_keyset_pagination(api, session, tied_search_handler, raw):
+    expected = _uids(Publication.fetch_all(1, _param(limit=4), api=api,
+                                           raw=raw))
+    session.handlers['inbox/search.json'] = tied_search_handler()
+    calls = len(session.calls)
+    publications = Publication.fetch_all(1, _param(limit=4), api=api,
+                                         keyset=True, raw=raw)
+    uids = _uids(publications)
+    assert sorted(uids) == sorted(expected) and len(expected) == 53
+    payloads = [payload for _, _, payload, _ in session.calls[calls:]]
+    assert payloads[0]['sortBy'] == 'date'
+    assert all(payload['start'] == 0 for payload in payloads)
+
+
+@pytest.mark.parametrize('size', [4, 9])
+def test_keyset_pagination_of_full_pages_of_ties(api, session, hits,
+                                                 tied_search_handler, size):
+    session.handlers['inbox/search.json'] = tied_search_handler(size)
+    uids = _uids(Publication.fetch_all(1, _param(limit=4), api=api,
+                                       keyset=True))
+    assert sorted(uids) == sorted(hit['uid'] for hit in hits)
+
+
+def test_keyset_pagination_of_late_publication(api, session, hits,
+                                               tied_search_handler):
+    late = dict(hits[6], uid='late')
+    session.handlers['inbox/search.json'] = tied_search_handler(late=late)
+    uids = _uids(Publication.fetch_all(1, _param(limit=4), api=api,
+                                       keyset=True))
+    assert sorted(uids) == sorted([hit['uid'] for hit in hits] + ['late'])
@@ -0,0 +1,172 @@
+"""Tests of the parameters: canonical form, digest, frozen parameters and
+their use by the resource classes."""
+
+import copy
+import pickle
+from datetime import datetime
+
+import pytest
+import pytz
+
+from radarly.analytics import Analytics
+from radarly.cluster import Cluster
+from radarly.parameters import AnalyticsParameter, SearchPublicationParameter
+from radarly.publication import Publication
+
+
+def _cluster(api):
+    return Cluster({'stats': {}, 'story': 's1', 'size': 3, 'project_id': 1},
+                   api=api)
+
+
+@pytest.mark.parametrize('frozen', [False, True])
+def test_analytics_keeps_the_parameter(api, session, frozen):
+    param = AnalyticsParameter().fields('tones', 'occupations')
+    if frozen:
+        param = param.freeze()
+    fields = param['fields']
+    stats = Analytics.fetch(1, param, api=api)
+    assert param['fields'] is fields
+    assert fields == ['tones', 'occupations']
+    assert {'tones', 'occupations'} <= set(stats)
+    payloads = [payload for _, _, payload, _ in session.calls[1:]]
+    assert payloads == [{'fields': ['tones']}, {}]
+
+
+def test_analytics_only_occupations(api, session):
+    param = AnalyticsParameter().fields('occupations')
+    Analytics.fetch(1, param, api=api)
+    assert session.count('insights.json') == 0
+    assert session.count('insights/occupation.json') == 1
+    assert param['fields'] == ['occupations']
+
+
+@pytest.mark.parametrize('frozen', [False, True])
+def test_cluster_analytics_keeps_the_parameter(api, session, frozen):
+    param = AnalyticsParameter().fields('tones', 'occupations')
+    if frozen:
+        param = param.freeze()
+    _cluster(api).get_analytics(param)
+    assert param['fields'] == ['tones', 'occupations']
+    assert 'stories' not in param
+    assert session.calls[-1][2] == {'stories': ['s1']}
+
+
+def test_next_page_in_place():
+    param = SearchPublicationParameter().pagination(0, 10)
+    assert param.next_page() is param
+    param.next_page()
+    assert param['start'] == 20
+
+
+def test_next_page_of_frozen_parameter():
+    param = SearchPublicationParameter().platforms('twitter') \
+        .pagination(0, 10).freeze()
+    following = param.next_page()
+    assert following is not param
+    assert (param['start'], following['start']) == (0, 10)
+    assert following.frozen
+    assert following['platforms'] is param['platforms']
+
+
+def test_seek():
+    param = SearchPublicationParameter().pagination(0, 10)
+    assert param.seek(datetime(2018, 1, 1), 2) is param
+    assert param['to'] == '2018-01-01T00:00:00+00:00'
+    frozen = param.freeze()
+    assert frozen.seek(datetime(2018, 1, 2))['to'] != frozen['to']
+
+
+def test_frozen_parameter_is_read_only():
+    param = SearchPublicationParameter().pagination(0, 10).freeze()
+    for modify in [lambda: param.update(start=1),
+                   lambda: param.__setitem__('start', 1),
+                   lambda: param.pop('start'),
+                   lambda: param.setdefault('query', 'x'),
+                   lambda: param.clear(),
+                   lambda: param.platforms('twitter')]:
+        with pytest.raises(TypeError):
+            modify()
+    assert param == {'start': 0, 'limit': 10}
+
+
+def test_freeze_copies_and_thaw_is_independent():
+    param = SearchPublicationParameter().platforms('twitter')
+    frozen = param.freeze()
+    param['platforms'].append('instagram')
+    assert frozen['platforms'] == ['twitter']
+    assert frozen.freeze() is frozen
+    thawed = frozen.thaw()
+    thawed['platforms'].append('facebook')
+    assert frozen['platforms'] == ['twitter']
+    assert not thawed.frozen
+
+
+def test_frozen_parameter_copies():
+    frozen = SearchPublicationParameter().pagination(0, 10).freeze()
+    for other in [copy.copy(frozen), copy.deepcopy(frozen),
+                  pickle.loads(pickle.dumps(frozen))]:
+        assert other.frozen and other == frozen
+        assert type(other) is SearchPublicationParameter
+
+
+def test_digest_is_canonical():
+    first = SearchPublicationParameter() \
+        .publication_date(datetime(2020, 1, 1, 1,
+                                   tzinfo=pytz.timezone('Etc/GMT-1')),
+                          '2020-02-01') \
+        .platforms('twitter', 'instagram').pagination(0, 10)
+    second = SearchPublicationParameter().pagination(0, 10) \
+        .platforms('instagram', 'twitter') \
+        .publication_date(datetime(2020, 1, 1, tzinfo=pytz.utc),
+                          datetime(2020, 2, 1))
+    assert first.canonical() == second.canonical()
+    assert first.digest() == second.digest()
+    assert hash(first.freeze()) == hash(second.freeze())
+    following = first.freeze().next_page()
+    assert first.digest() != following.digest()
+    assert first.digest(exclude=['start']) == \
+        following.digest(exclude=['start'])
+
+
+def test_mutable_parameter_is_not_hashable():
+    with pytest.raises(TypeError):
+        hash(SearchPublicationParameter())
+
+
+def test_generator_keeps_the_parameter(api):
+    param = SearchPublicationParameter().pagination(0, 10)
+    publications = list(Publication.fetch_all(1, param, api=api))
+    assert len(publications) == 53
+    assert param == {'start': 0, 'limit': 10}
+
+
+@pytest.mark.parametrize('frozen', [False, True])
+def test_cluster_publications_keeps_the_parameter(api, session, frozen):
+    param = SearchPublicationParameter().pagination(0, 10)
+    if frozen:
+        param = param.freeze()
+    publications = _cluster(api).get_publications(param)
+    assert len(publications) == 10
+    assert param == {'start': 0, 'limit': 10}
+    assert session.calls[-1][2]['stories'] == ['s1']
+
+
+@pytest.mark.parametrize('options', [{}, {'prefetch': 2}, {'keyset': True}])
+def test_generator_keeps_the_frozen_parameter(api, options):
+    param = SearchPublicationParameter().pagination(0, 10).freeze()
+    publications = list(Publication.fetch_all(1, param, api=api, **options))
+    assert [item['uid'] for item in publications] == \
+        [item['uid'] for item in Publication.fetch_all(
+            1, SearchPublicationParameter().pagination(0, 10), api=api)]
+    assert param == {'start': 0, 'limit': 10} and param.frozen
+
+
+def test_cluster_accepts_a_dictionary(api, session):
+    cluster = _cluster(api)
+    param = {'start': 0, 'limit': 10}
+    assert len(cluster.get_publications(param)) == 10
+    assert session.calls[-1][2] == {'start': 0, 'limit': 10, 'stories': ['s1']}
+    cluster.get_analytics({'fields': ['tones']})
+    assert session.calls[-1][2] == {'fields': ['tones'], 'stories': ['s1']}
+    assert param == {'start': 0, 'limit': 10}
@@ -0,0 +1,76 @@
+"""Tests of the rate limits and of the scheduler delaying the requests."""
+
+import pytest
+
+from radarly.api import RadarlyApi
+from radarly.exceptions import RateReached
+from radarly.rate import RateLimit, RateScheduler, reset_timestamp
+from radarly.utils.router import Router
+
+
+NOW = 1500000000.
+SEARCH = Router.publication['search'].format(project_id=1)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze the time of the scheduler and record the sleeps of the API"""
+    sleeps = []
+    monkeypatch.setattr('radarly.rate.time.time', lambda: NOW)
+    monkeypatch.setattr('radarly.api.time.sleep', sleeps.append)
+    return sleeps
+
+
+def _rates(remaining, reset, limit=180):
+    rates = RateLimit()
+    rates.update(SEARCH, {'X-Rate-Limit-Limit': limit,
+                          'X-Rate-Limit-Remaining': remaining,
+                          'X-Rate-Limit-Reset': reset})
+    return rates
+
+
+def test_reset_timestamp(clock):
+    limit = dict(reset=0, updated=NOW)
+    assert reset_timestamp(limit) == 0.
+    for reset in [NOW + 60, (NOW + 60) * 1000, 60]:
+        limit['reset'] = reset
+        assert reset_timestamp(limit) == NOW + 60
+
+
+def test_scheduler_spreads_the_requests(clock):
+    scheduler = RateScheduler(_rates(10, 100))
+    assert [scheduler.delay(SEARCH) for _ in range(3)] == [0., 10., 20.]
+    for _ in range(3):
+        scheduler.release(SEARCH)
+    assert scheduler.delay(SEARCH) == 30.
+
+
+def test_scheduler_waits_for_the_reset(clock):
+    scheduler = RateScheduler(_rates(1, 90, limit=900), window=900)
+    assert scheduler.delay(SEARCH) == 0.
+    assert scheduler.delay(SEARCH) == 90.
+    assert scheduler.delay(SEARCH) == 91.
+
+
+def test_scheduler_categories(clock):
+    scheduler = RateScheduler(_rates(1, 100))
+    scheduler.delay(SEARCH)
+    assert scheduler.delay(Router.project['find'].format(project_id=1)) == 0.
+
+
+def test_rate_reached_without_scheduler(api, session):
+    api.rates = _rates(0, 100)
+    with pytest.raises(RateReached):
+        api.post(SEARCH, data={})
+    assert session.count('inbox/search.json') == 0
+
+
+def test_throttled_api(session, clock):
+    api = RadarlyApi(client_id='client', client_secret='secret',
+                     session=session, authenticate=False, throttle=True)
+    expected = api.post(SEARCH, data={'start': 0, 'limit': 5})
+    api.rates.update(SEARCH, {'X-Rate-Limit-Remaining': 0,
+                              'X-Rate-Limit-Reset': 30})
+    assert api.post(SEARCH, data={'start': 0, 'limit': 5}) == expected
+    assert clock == [30.]
+    assert api.scheduler._buckets['medium']['reserved'] == 0 # pylint: disable=W0212
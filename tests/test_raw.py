@@ -0,0 +1,41 @@
+"""Tests of the raw mode: the documents must be returned as sent by the
+API."""
+
+import json
+
+import pytest
+
+from radarly.influencer import Influencer
+from radarly.parameters import SearchPublicationParameter
+from radarly.publication import Publication
+from radarly.utils.router import Router
+
+
+def test_raw_request(api, session, hits):
+    url = Router.publication['search'].format(project_id=1)
+    content = api.post(url, data={'start': 0, 'limit': 5}, raw='bytes')
+    assert isinstance(content, bytes)
+    assert api.post(url, data={'start': 0, 'limit': 5}, raw=True) == \
+        json.loads(content)
+    assert json.loads(content)['hits'] == hits[:5]
+
+
+def test_raw_publications(api, hits):
+    param = {'start': 0, 'limit': 10}
+    assert Publication.fetch(1, param, api=api, raw=True) == hits[:10]
+    content = Publication.fetch(1, param, api=api, raw='bytes')
+    assert json.loads(content)['hits'] == hits[:10]
+
+
+def test_raw_pagination(api, hits):
+    param = SearchPublicationParameter().pagination(0, 10)
+    assert list(Publication.fetch_all(1, param, api=api, raw=True)) == hits
+    with pytest.raises(ValueError):
+        Publication.fetch_all(1, param, api=api, raw='bytes')
+
+
+def test_raw_influencers(api, session, users, influencer_handler):
+    session.handlers['influencers.json'] = influencer_handler
+    assert Influencer.fetch(1, {}, api=api, raw=True) == users
+    decoded = Influencer.fetch(1, {}, api=api)
+    assert [influencer['count'] for influencer in decoded] == [0, 1, 2]
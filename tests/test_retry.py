@@ -0,0 +1,97 @@
+"""Tests of the retry of the requests which failed because of a transient
+error."""
+
+import pytest
+import requests
+
+from radarly.api import RadarlyApi
+from radarly.exceptions import RadarlyHTTPError
+from radarly.retry import RetryPolicy, server_delay
+from radarly.utils.router import Router
+
+SEARCH = Router.publication['search'].format(project_id=1)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr('radarly.api.time.sleep', delays.append)
+    return delays
+
+
+def _api(session, **kwargs):
+    return RadarlyApi(client_id='client', client_secret='secret',
+                      session=session, authenticate=False,
+                      retry=RetryPolicy(**kwargs))
+
+
+@pytest.fixture
+def failing(search_handler):
+    def build(failures, error=None, status=503, headers=None):
+        """Search handler failing ``failures`` times before answering"""
+        state = dict(failures=failures)
+
+        def handler(verb, payload, kwargs):
+            if state['failures'] > 0:
+                state['failures'] -= 1
+                if error is not None:
+                    raise error
+                return status, {'error': 'Unavailable'}, headers or {}
+            return search_handler(verb, payload, kwargs)
+        return handler
+    return build
+
+
+@pytest.mark.parametrize('error', [None, requests.exceptions.ConnectionError])
+def test_transient_failures_are_retried(api, session, sleeps, failing,
+                                       error):
+    expected = api.post(SEARCH, data={'start': 0, 'limit': 5})
+    session.handlers['inbox/search.json'] = failing(2, error)
+    assert _api(session).post(SEARCH, data={'start': 0, 'limit': 5}) == \
+        expected
+    assert session.count('inbox/search.json') == 4
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 0.5 and 0 <= sleeps[1] <= 1
+
+
+def test_retries_are_limited(session, sleeps, failing):
+    session.handlers['inbox/search.json'] = failing(5)
+    with pytest.raises(RadarlyHTTPError):
+        _api(session, max_retries=2).post(SEARCH, data={})
+    assert session.count('inbox/search.json') == 3
+
+
+def test_retry_after(session, sleeps, failing):
+    session.handlers['inbox/search.json'] = failing(
+        1, status=429, headers={'Retry-After': '2'}
+    )
+    _api(session).post(SEARCH, data={})
+    assert sleeps == [2.]
+
+
+@pytest.mark.parametrize('status', [400, 404])
+def test_client_errors_are_not_retried(session, sleeps, failing, status):
+    session.handlers['inbox/search.json'] = failing(1, status=status)
+    with pytest.raises(RadarlyHTTPError):
+        _api(session).post(SEARCH, data={})
+    assert session.count('inbox/search.json') == 1
+
+
+def test_unsafe_requests():
+    policy, error = RetryPolicy(), requests.exceptions.ConnectionError()
+    url = Router.publication['set_tag'].format(project_id=1)
+    assert policy.next_delay('POST', url, error, 0) is None
+    assert RetryPolicy(retry_unsafe=True).next_delay('POST', url, error, 0) \
+        is not None
+    assert policy.next_delay('GET', url, error, 0) is not None
+    assert policy.next_delay('GET', url, error, 0, elapsed=300) is None
+
+
+def test_server_delay(make_response):
+    assert server_delay(None) is None
+    assert server_delay(make_response(503)) is None
+    assert server_delay(make_response(429, headers={
+        'Retry-After': 'Thu, 01 Jan 1970 00:00:00 GMT'
+    })) == 0.
+    response = make_response(429, headers={'X-Rate-Limit-Reset': '10'})
+    assert 9 <= server_delay(response) <= 10
@@ -0,0 +1,92 @@
+"""Tests of the decoding schemas: each schema must decode the responses of its
+route as the generic decoder does."""
+
+import json
+from datetime import datetime
+
+import pytest
+import pytz
+
+from radarly.distribution import Distribution
+from radarly.schema import SCHEMAS, schema_for
+from radarly.utils.jsonparser import _BLACKLIST_PATH, RadarlyDecoder
+from radarly.utils.router import Router
+
+
+ROUTES = sorted(route for route, _ in SCHEMAS)
+
+
+@pytest.fixture
+def samples(hits, distribution_handler):
+    """Response of each route with a schema"""
+    return {
+        Router.publication['search']: {'total': 3, 'hits': hits[:3]},
+        Router.analytics['global']: {'dots': [{
+            'date': '2018-01-01T00:00:00.000Z',
+            'total': 3,
+            'counts': {'doc': 3, 'impression': 30},
+            'stats': {'tagOffset': [{
+                'term': '2018-01-01T00:00:00.000Z', 'counts': {'doc': 3},
+            }]},
+        }]},
+        Router.analytics['occupation']: {'dots': [{
+            'date': '2018-01-01T00:00:00.000Z',
+            'total': 1,
+            'counts': {'doc': 1},
+            'stats': {'occupations': [{'term': 'Chef', 'counts': {'doc': 1}}]},
+        }]},
+        Router.distribution['fetch']: distribution_handler('POST', {}, {})[1],
+        Router.influencer['search']: {'users': [{
+            'user': {'id': 'bob', 'platform': 'twitter', 'screenName': 'bob',
+                     'created': '2010-03-04T05:06:07.000Z'},
+            'platform': 'twitter',
+            'gender': 'male',
+            'count': 3,
+            'stats': {'tones': [{'term': 'positive', 'counts': {'doc': 3}}]},
+        }]},
+    }
+
+
+def _json(body):
+    return json.dumps(body).encode('utf-8')
+
+
+def test_every_schema_has_a_sample(samples):
+    assert ROUTES == sorted(samples)
+
+
+@pytest.mark.parametrize('route', ROUTES)
+def test_schema_decodes_as_generic_decoder(samples, route, engine):
+    url = route.format(project_id=1)
+    content = _json(samples[route])
+    generic = RadarlyDecoder(blacklist=_BLACKLIST_PATH)
+    expected = generic.decode(content, engine)
+    assert schema_for(url).decoder().decode(content, engine) == expected
+
+
+def test_publication_schema_decodes_dates_and_timezones(make_hit):
+    url = Router.publication['search'].format(project_id=1)
+    data = schema_for(url).decoder().decode(_json({'hits': [make_hit(0)]}))
+    hit = data['hits'][0]
+    assert hit['date'] == datetime(2018, 1, 3, 5)
+    assert hit['radar']['created'] == datetime(2018, 1, 2)
+    assert hit['timezone'] == pytz.timezone('Europe/Paris')
+    assert hit['radar']['tag'] == {'custom': {'My Tag': ['A']}}
+
+
+def test_publication_schema_keeps_undeclared_dates(make_hit):
+    url = Router.publication['search'].format(project_id=1)
+    hit = dict(make_hit(0), extra={'published': '2018-01-04T00:00:00.000Z'})
+    data = schema_for(url).decoder().decode(_json({'hits': [hit]}))
+    assert data['hits'][0]['extra']['published'] == \
+        '2018-01-04T00:00:00.000Z'
+
+
+def test_distribution_fetch_decodes_dates(api):
+    distribution = Distribution.fetch(1, {}, api=api)
+    assert len(distribution) == 53
+    assert all(isinstance(item['date'], datetime) for item in distribution)
+
+
+def test_route_without_schema_uses_generic_decoding():
+    assert schema_for(Router.project['find'].format(project_id=1)) is None
@@ -0,0 +1,47 @@
+"""Tests of the sessions shared by the APIs."""
+
+from radarly.api import RadarlyApi
+from radarly.session import SessionPool, build_session
+from radarly.utils.router import Router
+
+
+HOST = Router.host['prod']
+
+
+def _api(**kwargs):
+    return RadarlyApi(client_id='client', client_secret='secret',
+                      authenticate=False, **kwargs)
+
+
+def test_build_session():
+    adapter = build_session(4).get_adapter(HOST)
+    assert adapter._pool_maxsize == 4 # pylint: disable=W0212
+
+
+def test_session_shared_by_the_apis():
+    first, second, other = _api(), _api(), _api(pool_size=2)
+    session = first._acquire_session() # pylint: disable=W0212
+    assert second._acquire_session() is session # pylint: disable=W0212
+    assert other._acquire_session() is not session # pylint: disable=W0212
+    first.close()
+    assert (HOST, 10) in SessionPool._sessions # pylint: disable=W0212
+    first.close()
+    with second:
+        pass
+    assert second.session is None
+    assert (HOST, 10) not in SessionPool._sessions # pylint: disable=W0212
+    other.close()
+    assert (HOST, 2) not in SessionPool._sessions # pylint: disable=W0212
+
+
+def test_given_session(session):
+    closed = []
+    session.close = lambda: closed.append(True)
+    with RadarlyApi(client_id='client', client_secret='secret',
+                    session=session) as api:
+        project = api.get(Router.project['find'].format(project_id=1))
+    assert project['label'] == 'Project'
+    assert api.session is session and not closed
+    assert [path.split('/')[-1] for _, path, _, _ in session.calls] == \
+        ['token', '1.json']
+    assert session.calls[1][3]['auth'].token == 'token'
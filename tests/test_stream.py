@@ -0,0 +1,93 @@
+"""Tests of the streaming mode: the publications decoded incrementally must be
+the publications decoded from the whole response."""
+
+import asyncio
+import json
+
+import pytest
+
+from radarly.asyncapi import AsyncRadarlyApi
+from radarly.parameters import SearchPublicationParameter
+from radarly.project import Project
+from radarly.publication import Publication
+from radarly.utils.jsonstream import JsonMemberStream
+from radarly.utils.router import Router
+
+
+def _items(publications):
+    return [dict(publication) for publication in publications]
+
+
+def test_streamed_response(api):
+    url = Router.publication['search'].format(project_id=1)
+    response = api.stream('POST', url, data={'start': 0, 'limit': 5})
+    hits = list(response)
+    assert [hit['uid'] for hit in hits] == ['u000', 'u001', 'u002', 'u003',
+                                            'u004']
+    assert response['total'] == 53
+    assert hits == api.post(url, data={'start': 0, 'limit': 5})['hits']
+
+
+def test_streamed_raw_bytes_are_rejected(api):
+    url = Router.publication['search'].format(project_id=1)
+    with pytest.raises(ValueError):
+        api.stream('POST', url, data={}, raw='bytes')
+
+
+@pytest.mark.parametrize('raw', [False, True])
+def test_fetch_stream(api, raw):
+    param = {'start': 0, 'limit': 10}
+    streamed = list(Publication.fetch(1, param, api=api, stream=True,
+                                      raw=raw))
+    decoded = Publication.fetch(1, param, api=api, raw=raw)
+    if raw:
+        assert streamed == decoded
+    else:
+        assert _items(streamed) == _items(decoded)
+
+
+def test_fetch_all_stream(api):
+    param = SearchPublicationParameter().pagination(0, 10)
+    streamed = _items(Publication.fetch_all(1, param, api=api, stream=True))
+    assert len(streamed) == 53
+    assert streamed == _items(Publication.fetch_all(1, param, api=api))
+
+
+def test_stream_options_are_exclusive(api):
+    for options in [{'workers': 2}, {'prefetch': 1}, {'keyset': True}]:
+        with pytest.raises(ValueError):
+            Publication.fetch_all(1, {}, api=api, stream=True, **options)
+
+
+def test_async_stream_is_rejected():
+    api = AsyncRadarlyApi(client_id='client', client_secret='secret')
+    project = Project({'id': 1}, api=api)
+    with pytest.raises(ValueError):
+        asyncio.run(Publication.afetch(1, {}, api=api, stream=True))
+    with pytest.raises(ValueError):
+        Publication.afetch_all(1, {}, api=api, stream=True)
+    with pytest.raises(ValueError):
+        project.aget_all_publications({}, api=api, stream=True)
+    url = Router.publication['search'].format(project_id=1)
+    with pytest.raises(ValueError):
+        asyncio.run(api.stream('POST', url, data={}))
+
+
+@pytest.mark.parametrize('size', [1, 7, 4096])
+def test_member_stream_chunks(make_hit, size):
+    document = {'total': 2, 'hits': [make_hit(0), {'text': 'café ☕'}],
+                'after': {'nested': [1, 2]}, 'empty': []}
+    content = json.dumps(document, ensure_ascii=False).encode('utf-8')
+    chunks = [content[index:index + size]
+              for index in range(0, len(content), size)]
+    stream = JsonMemberStream(chunks, 'hits')
+    assert list(stream) == document['hits']
+    assert dict(stream.members) == {key: value
+                                    for key, value in document.items()
+                                    if key != 'hits'}
+
+
+def test_member_stream_without_array():
+    stream = JsonMemberStream([b'{"total": 0, "hits": []}'], 'hits')
+    assert list(stream) == []
+    assert stream.members['total'] == 0
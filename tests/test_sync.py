@@ -0,0 +1,100 @@
+"""Tests of the incremental synchronization of the publications."""
+
+from datetime import datetime, timedelta
+
+import pytz
+
+from radarly.parameters import SearchPublicationParameter
+from radarly.sync import IncrementalSync, SyncStore
+
+def _param():
+    return SearchPublicationParameter().platforms('twitter') \
+        .pagination(0, 20)
+
+
+def test_first_poll(api, session, hits):
+    sync = IncrementalSync(1, _param(), api=api)
+    assert sync.watermark is None
+    publications, watermark = sync.poll()
+    assert [item['uid'] for item in publications] == \
+        [hit['uid'] for hit in hits]
+    assert sync.watermark == watermark
+    assert all('date' not in payload for _, _, payload, _ in session.calls)
+
+
+def test_poll_since_watermark(api, session, hits, search_handler):
+    sync = IncrementalSync(1, _param(), api=api)
+    _, watermark = sync.poll()
+    calls = len(session.calls)
+    new_hit = dict(hits[0], uid='new')
+
+    def handler(verb, payload, kwargs):
+        status, body, headers = search_handler(verb, payload, kwargs)
+        if payload.get('start') == 0:
+            body['hits'] = [new_hit] + body['hits']
+        return status, body, headers
+
+    session.handlers['inbox/search.json'] = handler
+    publications, _ = sync.poll()
+    # the publications already received are discarded
+    assert [item['uid'] for item in publications] == ['new']
+    payload = session.calls[calls][2]
+    assert payload['date']['createdAfter'] == \
+        (watermark - timedelta(minutes=5)).isoformat()
+
+
+def test_first_poll_since(api, session):
+    since = datetime(2018, 1, 1, tzinfo=pytz.utc)
+    IncrementalSync(1, _param(), api=api, since=since,
+                    overlap=timedelta(0)).poll()
+    assert session.calls[1][2]['date'] == \
+        {'createdAfter': since.isoformat()}
+
+
+def test_poll_keeps_creation_range(api, session):
+    since = datetime(2018, 1, 1, tzinfo=pytz.utc)
+    after = datetime(2018, 3, 1, tzinfo=pytz.utc)
+    before = datetime(2018, 6, 1, tzinfo=pytz.utc)
+    param = _param().creation_date(created_before=before, created_after=after)
+    IncrementalSync(1, param, api=api, since=since).poll()
+    # the lower bound of the user is later than the high-water mark
+    assert session.calls[1][2]['date'] == {
+        'createdAfter': after.isoformat(), 'createdBefore': before.isoformat(),
+    }
+
+    session.calls.clear()
+    since = datetime(2018, 4, 1)
+    IncrementalSync(1, param, api=api, since=since,
+                    overlap=timedelta(0)).poll()
+    assert session.calls[1][2]['date'] == {
+        'createdAfter': since.replace(tzinfo=pytz.utc).isoformat(),
+        'createdBefore': before.isoformat(),
+    }
+
+
+def test_sync_key():
+    first = IncrementalSync(1, _param())
+    second = IncrementalSync(1, SearchPublicationParameter()
+                             .pagination(40, 10).platforms('twitter'))
+    assert first.key == second.key
+    assert first.key != IncrementalSync(2, _param()).key
+    assert first.key != IncrementalSync(
+        1, _param().platforms('instagram')
+    ).key
+
+
+def test_store_on_disk(api, tmp_path):
+    path = str(tmp_path / 'sync.json')
+    _, watermark = IncrementalSync(1, _param(), api=api,
+                                   store=SyncStore(path)).poll()
+    sync = IncrementalSync(1, _param(), api=api, store=SyncStore(path))
+    assert sync.watermark == watermark
+    assert sync.poll()[0] == []
+
+
+def test_recent_size(api):
+    store = SyncStore()
+    sync = IncrementalSync(1, _param(), api=api, store=store,
+                           recent_size=10)
+    sync.poll()
+    assert len(store.get(sync.key)['recent']) == 10
@@ -0,0 +1,103 @@
+"""Tests of the ``timestamps`` option: the dates decoded as epoch values must
+be the dates decoded as datetimes."""
+
+from datetime import datetime
+
+import pytest
+
+from radarly.analytics import Analytics
+from radarly.distribution import Distribution
+from radarly.publication import Publication
+from radarly.utils.jsonparser import (_BLACKLIST_PATH, RadarlyDecoder,
+                                      date_parser, from_epoch, parse_date,
+                                      parse_epoch)
+
+
+def test_parse_epoch_matches_parse_date():
+    assert parse_epoch('2018-01-03T05:00:00.123Z') == 1514955600123
+    assert from_epoch(1514955600123) == datetime(2018, 1, 3, 5, 0, 0, 123000)
+
+
+@pytest.mark.parametrize('value', ['2018-02-30T00:00:00.000Z',
+                                   '2018-13-01T00:00:00.000Z',
+                                   '2018-01-01T24:00:00.000Z',
+                                   '0000-01-01T00:00:00.000Z'])
+def test_parse_epoch_of_invalid_date(value):
+    with pytest.raises(ValueError):
+        parse_date(value)
+    with pytest.raises(ValueError):
+        parse_epoch(value)
+
+
+def test_unknown_timestamps_option():
+    with pytest.raises(ValueError):
+        date_parser('seconds')
+
+
+def test_distribution_epoch(api):
+    dates = [item['date'] for item in Distribution.fetch(1, {}, api=api)]
+    epochs = [
+        item['date']
+        for item in Distribution.fetch(1, {}, api=api, timestamps='epoch')
+    ]
+    assert all(isinstance(value, int) for value in epochs)
+    assert [from_epoch(value) for value in epochs] == dates
+
+
+def test_analytics_epoch(api):
+    stats = Analytics.fetch(1, {'fields': ['tones']}, api=api,
+                            timestamps='epoch')
+    assert list(stats['total']['total']) == [1514764800000]
+
+
+def test_publications_epoch(api):
+    param = {'start': 0, 'limit': 5}
+    decoded = Publication.fetch(1, param, api=api)
+    epochs = Publication.fetch(1, param, api=api, timestamps='epoch')
+    assert [from_epoch(item['date']) for item in epochs] == \
+        [item['date'] for item in decoded]
+
+
+def test_api_option(api):
+    api.timestamps = 'epoch'
+    distribution = Distribution.fetch(1, {}, api=api)
+    assert isinstance(distribution[0]['date'], int)
+
+
+TAG_DATE = '2018-01-05T00:00:00.000Z'
+
+
+@pytest.fixture
+def tagged_handler(hits):
+    tagged = [
+        dict(hit, radar=dict(hit['radar'], tag={'custom': {
+            'Date': [TAG_DATE], 'Invalid': '2018-02-30T00:00:00.000Z',
+        }}))
+        for hit in hits[:5]
+    ]
+
+    def handler(verb, payload, kwargs):
+        return 200, {'total': len(tagged), 'hits': tagged}
+    return handler
+
+
+@pytest.mark.parametrize('options', [{}, {'lazy': True}, {'stream': True}])
+def test_blacklisted_dates_in_epoch_mode(api, session, engine, tagged_handler,
+                                        options):
+    session.handlers['inbox/search.json'] = tagged_handler
+    publications = list(Publication.fetch(1, {'start': 0, 'limit': 5},
+                                          api=api, timestamps='epoch',
+                                          **options))
+    assert [item['$radar.tag.custom']['Date'] for item in publications] == \
+        [[TAG_DATE]] * 5
+    assert all(isinstance(item['date'], int) for item in publications)
+
+
+def test_blacklisted_dates_of_generic_decoder(engine):
+    document = {'dots': [{'date': TAG_DATE, 'stats': {'lastDate': TAG_DATE}}],
+                'radar': {'tag': [{'createdAt': [TAG_DATE]}]}}
+    decoder = RadarlyDecoder(blacklist=_BLACKLIST_PATH, timestamps='epoch')
+    decoded = decoder.decode(engine.dumpb(document), engine)
+    assert decoded['dots'][0]['date'] == parse_epoch(TAG_DATE)
+    assert decoded['dots'][0]['stats'] == {'lastDate': TAG_DATE}
+    assert decoded['radar']['tag'] == [{'createdAt': [TAG_DATE]}]